@@ -0,0 +1,89 @@
+"""
+Benchmark IVF / IVF-PQ search (ann_index.py) against exact search (numpy_store.py).
+
+Uses synthetic clustered unit vectors, so no API key or PDF is needed. For every corpus size it
+reports build time, recall@k against exact top k, and p50/p99 single-query latency for exact
+search and for each `nprobe` setting.
+
+Run
+  python ann_bench.py                                   # 10k, 100k and 1M vectors of size 128
+  python ann_bench.py --sizes 10000 100000 --dim 768 --pq-m 96 --nprobe 4 16 64
+"""
+
+import argparse
+import time
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from ann_index import IVFIndex
+from numpy_store import normalize, top_k
+
+
+def clustered_vectors(n: int, dim: int, n_topics: int = 200, spread: float = 0.8, seed: int = 0) -> np.ndarray:
+    """Unit vectors around `n_topics` random directions, roughly like chunk embeddings of many filings."""
+    rng = np.random.default_rng(seed)
+    topics = normalize(rng.standard_normal((n_topics, dim)).astype(np.float32))
+    out = np.empty((n, dim), dtype=np.float32)
+    for i in range(0, n, 100_000):
+        m = min(100_000, n - i)
+        noise = rng.standard_normal((m, dim)).astype(np.float32) * (spread / np.sqrt(dim))
+        out[i:i + m] = normalize(topics[rng.integers(0, n_topics, m)] + noise)
+    return out
+
+
+def latencies(search: Callable[[np.ndarray], np.ndarray], queries: np.ndarray) -> Tuple[List[float], np.ndarray]:
+    times, results = [], []
+    for q in queries:
+        t0 = time.perf_counter()
+        results.append(search(q[None, :])[0])
+        times.append((time.perf_counter() - t0) * 1000)
+    return times, np.stack(results)
+
+
+def recall(found: np.ndarray, truth: np.ndarray) -> float:
+    k = truth.shape[1]
+    return float(np.mean([len(set(f[f >= 0]) & set(t)) / k for f, t in zip(found, truth)]))
+
+
+def report(label: str, times: List[float], rec: float) -> None:
+    print(f"  {label:<24} recall@k {rec:6.3f}   p50 {np.percentile(times, 50):8.3f} ms"
+          f"   p99 {np.percentile(times, 99):8.3f} ms")
+
+
+def bench(n: int, dim: int, k: int, n_queries: int, nlist: int, nprobes: List[int], pq_m: int, refine: int) -> None:
+    # Queries come from the same topics as the corpus but are not in it
+    data = clustered_vectors(n + n_queries, dim)
+    vectors, queries = data[:n], data[n:]
+    print(f"\n{n:,} vectors x {dim}  (k={k}, nlist={nlist}, pq_m={pq_m or 'flat'})")
+
+    exact_times, truth = latencies(lambda q: top_k(q @ vectors.T, k), queries)
+    report("exact", exact_times, 1.0)
+
+    t0 = time.perf_counter()
+    index = IVFIndex(dim, nlist=nlist, pq_m=pq_m, refine=refine)
+    index.train(vectors)
+    index.add(vectors)
+    index.search(queries[:1], k, vectors)  # builds the inverted lists
+    print(f"  build {time.perf_counter() - t0:.1f} s")
+
+    for nprobe in nprobes:
+        times, found = latencies(lambda q: index.search(q, k, vectors, nprobe=nprobe)[0], queries)
+        report(f"ivf nprobe={nprobe}", times, recall(found, truth))
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    ap.add_argument("--dim", type=int, default=128)
+    ap.add_argument("--k", type=int, default=10)
+    ap.add_argument("--queries", type=int, default=200)
+    ap.add_argument("--nlist", type=int, default=0, help="Inverted lists (default: about 4*sqrt(n))")
+    ap.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 16, 64])
+    ap.add_argument("--pq-m", type=int, default=0, help="PQ sub-vectors per vector (0 = IVF-Flat)")
+    ap.add_argument("--refine", type=int, default=4, help="With PQ: re-rank k*refine candidates exactly")
+    args = ap.parse_args()
+
+    for n in args.sizes:
+        nlist = args.nlist or int(4 * np.sqrt(n))
+        bench(n, args.dim, args.k, args.queries, nlist, args.nprobe, args.pq_m, args.refine)
@@ -0,0 +1,234 @@
+"""
+Approximate nearest-neighbour search for the semantic search pipeline: an IVF index, optionally
+with product quantization (IVF-PQ), in NumPy.
+
+- IVFIndex clusters the normalized vectors into `nlist` lists with spherical k-means. A query
+  only scores the vectors of its `nprobe` closest lists.
+- With `pq_m > 0`, vectors in the lists are stored as `pq_m` one-byte codes and scored with
+  lookup tables (asymmetric distance). The best `k * refine` candidates are then re-ranked
+  with exact vectors when these are available.
+- ANNVectorStore is NumpyVectorStore with IVFIndex search. The index is trained on the first
+  search once the store holds `min_train_size` vectors; smaller stores use exact search.
+  The store still keeps the full float32 matrix (for exact search below `min_train_size`,
+  re-indexing after deletes and the re-rank), so in the store PQ only speeds up search;
+  the codes add `pq_m` bytes per vector on top of the matrix.
+
+Knobs: `nlist` (more lists = smaller lists, faster but lower recall), `nprobe` (lists scanned
+per query; higher = better recall, slower), `pq_m`/`refine` (scan cost vs. accuracy; an
+IVFIndex used on its own with `search(vectors=None)` needs only the codes, `pq_m` bytes per
+vector instead of 4 * dim, at the cost of the re-rank).
+The index is saved to and loaded from a single .npz file, also as part of a snapshot
+(snapshot.py), whose store then searches through it.
+
+See ann_bench.py for recall@k and latency against exact search.
+"""
+
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from numpy_store import NumpyVectorStore, normalize, top_k
+
+
+def kmeans(x: np.ndarray, n_clusters: int, iters: int = 10, seed: int = 0, spherical: bool = True,
+           chunk: int = 65536) -> np.ndarray:
+    """Lloyd's k-means; with `spherical`, centroids are unit length and assignment is by inner product."""
+    rng = np.random.default_rng(seed)
+    centroids = x[rng.choice(len(x), n_clusters, replace=len(x) < n_clusters)].copy()
+    for _ in range(iters):
+        assign = nearest(x, centroids, spherical, chunk)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, x)
+        counts = np.bincount(assign, minlength=n_clusters)
+        empty = counts == 0
+        # Re-seed empty clusters from random points
+        sums[empty] = x[rng.choice(len(x), int(empty.sum()))]
+        counts[empty] = 1
+        centroids = sums / counts[:, None]
+        if spherical:
+            centroids = normalize(centroids)
+    return centroids.astype(np.float32)
+
+
+def nearest(x: np.ndarray, centroids: np.ndarray, spherical: bool = True, chunk: int = 65536) -> np.ndarray:
+    """Index of the closest centroid for every row of `x`, computed in chunks to bound memory."""
+    out = np.empty(len(x), dtype=np.int64)
+    c_norms = None if spherical else (centroids ** 2).sum(1)
+    for i in range(0, len(x), chunk):
+        sims = x[i:i + chunk] @ centroids.T
+        if not spherical:
+            sims = 2 * sims - c_norms
+        out[i:i + chunk] = sims.argmax(1)
+    return out
+
+
+class IVFIndex:
+    def __init__(self, dim: int, nlist: int = 256, nprobe: int = 8, pq_m: int = 0, refine: int = 4,
+                 train_iters: int = 10, seed: int = 0):
+        if pq_m and dim % pq_m:
+            raise ValueError(f"pq_m={pq_m} must divide the embedding size {dim}")
+        self.dim = dim
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.pq_m = pq_m
+        self.refine = refine
+        self.train_iters = train_iters
+        self.seed = seed
+        self.centroids: Optional[np.ndarray] = None
+        self.codebooks: Optional[np.ndarray] = None  # (pq_m, 256, dim // pq_m)
+        self.assign = np.empty(0, dtype=np.int64)
+        self.codes = np.empty((0, pq_m), dtype=np.uint8)
+        self._order: Optional[np.ndarray] = None
+        self._offsets: Optional[np.ndarray] = None
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    @property
+    def ntotal(self) -> int:
+        return len(self.assign)
+
+    def train(self, vectors: np.ndarray, max_samples: int = 100_000) -> None:
+        rng = np.random.default_rng(self.seed)
+        sample = vectors if len(vectors) <= max_samples else vectors[rng.choice(len(vectors), max_samples, replace=False)]
+        self.centroids = kmeans(sample, min(self.nlist, len(sample)), self.train_iters, self.seed)
+        self.nlist = len(self.centroids)
+        if self.pq_m:
+            sub = self.dim // self.pq_m
+            self.codebooks = np.stack([
+                kmeans(sample[:, m * sub:(m + 1) * sub], 256, self.train_iters, self.seed, spherical=False)
+                for m in range(self.pq_m)
+            ])
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        sub = self.dim // self.pq_m
+        codes = np.empty((len(vectors), self.pq_m), dtype=np.uint8)
+        for m in range(self.pq_m):
+            codes[:, m] = nearest(vectors[:, m * sub:(m + 1) * sub], self.codebooks[m], spherical=False)
+        return codes
+
+    def add(self, vectors: np.ndarray) -> None:
+        """Append normalized vectors; their ids are their positions in insertion order."""
+        self.assign = np.concatenate([self.assign, nearest(vectors, self.centroids)])
+        if self.pq_m:
+            self.codes = np.concatenate([self.codes, self.encode(vectors)])
+        self._order = None
+
+    def reset(self, vectors: np.ndarray) -> None:
+        """Re-add all vectors with the trained centroids (after rows were deleted or reordered)."""
+        self.assign = np.empty(0, dtype=np.int64)
+        self.codes = np.empty((0, self.pq_m), dtype=np.uint8)
+        self.add(vectors)
+
+    def _lists(self) -> Tuple[np.ndarray, np.ndarray]:
+        # Inverted lists as one array of ids sorted by list plus offsets, rebuilt lazily after adds
+        if self._order is None:
+            self._order = np.argsort(self.assign, kind="stable")
+            self._offsets = np.concatenate([[0], np.cumsum(np.bincount(self.assign, minlength=self.nlist))])
+        return self._order, self._offsets
+
+    def search(self, queries: np.ndarray, k: int, vectors: Optional[np.ndarray] = None,
+               nprobe: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Ids and scores of the approximate top k for each normalized query; -1 pads short results.
+
+        `vectors` are the exact stored vectors: required for IVF-Flat, used for re-ranking with PQ.
+        """
+        order, offsets = self._lists()
+        nprobe = min(nprobe or self.nprobe, self.nlist)
+        probes = top_k(queries @ self.centroids.T, nprobe)
+        ids = np.full((len(queries), k), -1, dtype=np.int64)
+        scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        for qi, q in enumerate(queries):
+            cand = np.concatenate([order[offsets[l]:offsets[l + 1]] for l in probes[qi]])
+            if not len(cand):
+                continue
+            if self.pq_m:
+                sub = self.dim // self.pq_m
+                table = np.einsum("mcs,ms->mc", self.codebooks, q.reshape(self.pq_m, sub))
+                s = table[np.arange(self.pq_m), self.codes[cand]].sum(1)
+                if vectors is not None and self.refine:
+                    keep = top_k(s, k * self.refine)
+                    cand = cand[keep]
+                    s = vectors[cand] @ q
+            else:
+                s = vectors[cand] @ q
+            best = top_k(s, k)
+            ids[qi, :len(best)] = cand[best]
+            scores[qi, :len(best)] = s[best]
+        return ids, scores
+
+    def save(self, path: str) -> None:
+        np.savez(path, dim=self.dim, nlist=self.nlist, nprobe=self.nprobe, pq_m=self.pq_m, refine=self.refine,
+                 centroids=self.centroids, assign=self.assign, codes=self.codes,
+                 codebooks=self.codebooks if self.codebooks is not None else np.empty(0, dtype=np.float32))
+
+    @classmethod
+    def load(cls, path: str) -> "IVFIndex":
+        data = np.load(path)
+        index = cls(int(data["dim"]), int(data["nlist"]), int(data["nprobe"]), int(data["pq_m"]), int(data["refine"]))
+        index.centroids = data["centroids"]
+        index.assign = data["assign"]
+        index.codes = data["codes"]
+        index.codebooks = data["codebooks"] if index.pq_m else None
+        return index
+
+
+def ivf_search(index: IVFIndex, queries: np.ndarray, k: int,
+               vectors: np.ndarray) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+    """`NumpyVectorStore._search` results (row ids and scores per query) through an IVFIndex."""
+    ids, scores = index.search(queries, k, vectors)
+    return [row[row >= 0] for row in ids], [s[row >= 0] for row, s in zip(ids, scores)]
+
+
+class ANNVectorStore(NumpyVectorStore):
+    """NumpyVectorStore searched through an IVFIndex; the raw vectors stay in `matrix`, also with PQ."""
+
+    def __init__(self, embedding: Embeddings, nlist: int = 256, nprobe: int = 8, pq_m: int = 0,
+                 refine: int = 4, min_train_size: Optional[int] = None, index_path: Optional[str] = None):
+        super().__init__(embedding)
+        self.index_params = dict(nlist=nlist, nprobe=nprobe, pq_m=pq_m, refine=refine)
+        # k-means wants a few dozen points per list
+        self.min_train_size = min_train_size if min_train_size is not None else 39 * nlist
+        self.index_path = index_path
+        self.index: Optional[IVFIndex] = None
+
+    def _index(self) -> Optional[IVFIndex]:
+        vectors = self.matrix[:self.size]
+        if self.index is None:
+            if self.size < self.min_train_size:
+                return None
+            self.index = IVFIndex(vectors.shape[1], **self.index_params)
+            self.index.train(vectors)
+        if self.index.ntotal > self.size:
+            self.index.reset(vectors)
+        elif self.index.ntotal < self.size:
+            self.index.add(vectors[self.index.ntotal:])
+        return self.index
+
+    def delete(self, ids: Optional[List[str]] = None, **kwargs: Any) -> Optional[bool]:
+        result = super().delete(ids)
+        if self.index is not None and self.index.ntotal != self.size:
+            # Rows were compacted, so positions moved
+            self.index.reset(self.matrix[:self.size])
+        return result
+
+    def _search(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        index = self._index()
+        if index is None:
+            return super()._search(queries, k)
+        return ivf_search(index, queries, k, self.matrix[:self.size])
+
+    def trained_index(self) -> Optional[IVFIndex]:
+        """The index over the current rows, trained now if needed; None below `min_train_size`."""
+        return self._index()
+
+    def save_index(self, path: Optional[str] = None) -> None:
+        index = self._index()
+        if index is not None:
+            index.save(path or self.index_path)
+
+    def load_index(self, path: Optional[str] = None) -> None:
+        """Use a saved index instead of training; it must have been built over the same rows."""
+        self.index = IVFIndex.load(path or self.index_path)
@@ -0,0 +1,124 @@
+"""
+On-disk embedding cache for LangChain `Embeddings`.
+
+`CachedEmbeddings` wraps any embedder (e.g. GoogleGenerativeAIEmbeddings). Vectors are stored in
+SQLite as float32 blobs keyed by model name + a SHA-256 of the text, so re-running the pipeline
+on an unchanged document makes no provider calls. Only cache misses are sent to the provider,
+in batches of `batch_size` texts with at most `max_concurrency` batches in flight.
+
+Run (self-check with a deterministic local fake embedder, no API key needed)
+  python embedding_cache.py
+"""
+
+import hashlib
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+
+class CachedEmbeddings(Embeddings):
+    def __init__(self, embeddings: Embeddings, path: str = "embeddings_cache.sqlite",
+                 model_name: Optional[str] = None, batch_size: int = 100, max_concurrency: int = 4):
+        self.embeddings = embeddings
+        self.model_name = model_name or getattr(embeddings, "model", None) or type(embeddings).__name__
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+
+    def _key(self, kind: str, text: str) -> str:
+        # Documents and queries are embedded with different task types by some providers
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.model_name}:{kind}:{digest}"
+
+    def _lookup(self, keys: List[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        unique = list(dict.fromkeys(keys))
+        with self._lock:
+            for i in range(0, len(unique), 500):
+                chunk = unique[i:i + 500]
+                rows = self.conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                )
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+
+    def _store(self, keys: List[str], vectors: List[List[float]]) -> None:
+        rows = [(k, np.asarray(v, dtype=np.float32).tobytes()) for k, v in zip(keys, vectors)]
+        with self._lock:
+            self.conn.executemany("INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows)
+            self.conn.commit()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._key("doc", t) for t in texts]
+        cached = self._lookup(keys)
+        # One provider call per distinct missing text
+        missing = list(dict.fromkeys(k for k in keys if k not in cached))
+        text_of = dict(zip(keys, texts))
+        self.hits += sum(1 for k in keys if k in cached)
+        self.misses += len(missing)
+
+        batches = [missing[i:i + self.batch_size] for i in range(0, len(missing), self.batch_size)]
+
+        def embed_batch(batch_keys: List[str]) -> None:
+            vectors = self.embeddings.embed_documents([text_of[k] for k in batch_keys])
+            self._store(batch_keys, vectors)
+            cached.update(zip(batch_keys, vectors))
+
+        if len(batches) == 1:
+            embed_batch(batches[0])
+        elif batches:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+                list(pool.map(embed_batch, batches))
+        return [list(cached[k]) for k in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        key = self._key("query", text)
+        cached = self._lookup([key])
+        if key in cached:
+            self.hits += 1
+            return cached[key]
+        self.misses += 1
+        vector = self.embeddings.embed_query(text)
+        self._store([key], [vector])
+        return list(vector)
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+
+    class CountingFake(DeterministicFakeEmbedding):
+        calls: int = 0
+
+        def embed_documents(self, texts: List[str]) -> List[List[float]]:
+            self.calls += 1
+            return super().embed_documents(texts)
+
+        def embed_query(self, text: str) -> List[float]:
+            self.calls += 1
+            return super().embed_query(text)
+
+    texts = [f"chunk number {i} of the filing" for i in range(1000)]
+    expected = np.asarray(DeterministicFakeEmbedding(size=768).embed_documents(texts), dtype=np.float32)
+    path = os.path.join(tempfile.mkdtemp(), "cache.sqlite")
+    for run in (1, 2):
+        fake = CountingFake(size=768)
+        cached = CachedEmbeddings(fake, path, model_name="fake-768", batch_size=100)
+        vectors = cached.embed_documents(texts)
+        cached.embed_query("How many distribution centers does Nike have in the US?")
+        assert np.allclose(np.asarray(vectors, dtype=np.float32), expected)
+        print(f"run {run}: provider calls={fake.calls} hits={cached.hits} misses={cached.misses}")
+        cached.close()
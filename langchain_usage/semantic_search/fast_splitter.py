@@ -0,0 +1,144 @@
+"""
+RecursiveCharacterTextSplitter that works on offsets instead of substrings.
+
+LangChain's splitter re-splits every oversized piece into new strings, measures and joins them
+again while merging, and recovers each chunk's `start_index` with `str.find`. This version keeps
+every piece as offsets into the original text: separator search is `str.find` with bounds,
+merging slides a window over the piece boundaries by bisection, and `start_index` comes from
+the chunk's offset, so the only strings built are the chunks themselves.
+
+Same chunks and `start_index` for literal separators with the default keep_separator=True,
+strip_whitespace and len() as length function; other settings fall back to LangChain.
+LangChain's `find` can land on an earlier copy of a short repeated chunk; that value is kept
+for compatibility (found with a search bounded by the span) unless `exact_start_index=True`.
+See splitter_bench.py for the equivalence check and timings.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, List, Optional, Tuple
+
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+Span = Tuple[int, int]
+
+
+class FastRecursiveCharacterTextSplitter(RecursiveCharacterTextSplitter):
+    def __init__(self, *args: Any, exact_start_index: bool = False, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._exact_start_index = exact_start_index
+
+    @property
+    def _fast(self) -> bool:
+        return (self._keep_separator in (True, "start") and not self._is_separator_regex
+                and self._strip_whitespace and self._length_function is len)
+
+    def split_spans(self, text: str) -> List[Span]:
+        """(start, end) of every chunk in `text`, in order."""
+        out: List[Span] = []
+        self._split_span(text, 0, len(text), self._separators, out)
+        return out
+
+    def _split_span(self, text: str, a: int, b: int, separators: List[str], out: List[Span]) -> None:
+        if b - a < self._chunk_size:
+            # Every piece would fit, so merging gives back the whole span
+            self._emit(text, a, b, out)
+            return
+        separator = separators[-1]
+        rest: List[str] = []
+        for i, sep in enumerate(separators):
+            if not sep:
+                separator = sep
+                break
+            if text.find(sep, a, b) != -1:
+                separator = sep
+                rest = separators[i + 1:]
+                break
+
+        # Piece i is [bounds[i], bounds[i + 1]); runs of pieces shorter than chunk_size are merged
+        bounds = self._bounds(text, a, b, separator)
+        first = 0
+        for i in range(len(bounds) - 1):
+            start, end = bounds[i], bounds[i + 1]
+            if end - start < self._chunk_size:
+                continue
+            if i > first:
+                self._merge(text, bounds, first, i, out)
+            if rest:
+                self._split_span(text, start, end, rest, out)
+            else:
+                out.append((start, end))
+            first = i + 1
+        if first < len(bounds) - 1:
+            self._merge(text, bounds, first, len(bounds) - 1, out)
+
+    @staticmethod
+    def _bounds(text: str, a: int, b: int, separator: str) -> List[int]:
+        # Each separator starts a new piece (keep_separator="start"); the pieces tile [a, b)
+        if not separator:
+            return list(range(a, b + 1))
+        bounds = [a]
+        pos = text.find(separator, a, b)
+        while pos != -1:
+            if pos != bounds[-1]:
+                bounds.append(pos)
+            pos = text.find(separator, pos + len(separator), b)
+        bounds.append(b)
+        return bounds
+
+    def _merge(self, text: str, bounds: List[int], first: int, last: int, out: List[Span]) -> None:
+        # Pieces first..last-1 are contiguous, so a window of pieces [lo, hi) is the span
+        # bounds[lo]:bounds[hi] and both of its ends can be found by bisection
+        size, overlap = self._chunk_size, self._chunk_overlap
+        lo = first
+        while True:
+            # First piece that no longer fits in a chunk starting at bounds[lo]
+            hi = bisect_right(bounds, bounds[lo] + size, lo + 1, last + 1) - 1
+            if hi >= last:
+                break
+            self._emit(text, bounds[lo], bounds[hi], out)
+            # Drop pieces from the front until at most `overlap` is left and piece hi fits
+            lo = max(bisect_left(bounds, bounds[hi] - overlap, lo, hi),
+                     bisect_left(bounds, bounds[hi + 1] - size, lo, hi))
+        self._emit(text, bounds[lo], bounds[last], out)
+
+    @staticmethod
+    def _emit(text: str, start: int, end: int, out: List[Span]) -> None:
+        # Strip whitespace by moving the bounds
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if start < end:
+            out.append((start, end))
+
+    @staticmethod
+    def _find_start(text: str, chunk: str, start: int, offset: int) -> int:
+        # What text.find(chunk, max(0, offset)) returns, searching no further than the real start
+        offset = max(0, offset)
+        if start < offset:
+            return text.find(chunk, offset)
+        return text.find(chunk, offset, start + len(chunk))
+
+    def split_text(self, text: str) -> List[str]:
+        if not self._fast:
+            return super().split_text(text)
+        return [text[s:e] for s, e in self.split_spans(text)]
+
+    def create_documents(self, texts: List[str], metadatas: Optional[List[dict]] = None) -> List[Document]:
+        if not self._fast:
+            return super().create_documents(texts, metadatas)
+        metadatas = metadatas or [{}] * len(texts)
+        documents = []
+        for text, metadata in zip(texts, metadatas):
+            index = previous = 0
+            for start, end in self.split_spans(text):
+                chunk = text[start:end]
+                meta = dict(metadata)
+                if self._add_start_index:
+                    index = start if self._exact_start_index else self._find_start(
+                        text, chunk, start, index + previous - self._chunk_overlap)
+                    previous = end - start
+                    meta["start_index"] = index
+                documents.append(Document(page_content=chunk, metadata=meta))
+        return documents
@@ -0,0 +1,244 @@
+"""
+Hybrid lexical + dense retrieval for the semantic search pipeline.
+
+- BM25Index is an in-process inverted index. Posting lists are kept as flat NumPy arrays
+  sorted by term (doc numbers as int32, term frequencies as uint16) plus one offsets array, so
+  a term's postings are a slice and scoring a query is a few vectorized adds.
+  New documents are buffered and merged into the arrays on the next search; deleted ones are
+  dropped from them at the same time.
+- HybridSearcher takes the dense top `fetch_k` from a NumpyVectorStore / ANNVectorStore and
+  the BM25 top `fetch_k`, and combines them with reciprocal-rank fusion (RRF), so exact
+  figures and names ("distribution centers", "$51.2 billion") are found even when the
+  embedding misses them.
+
+Both indexes are keyed by document id, not by row: index chunks in BM25 under the ids the store
+returned for them (ingest.py does this), and delete or re-add them in both. Lexical hits whose id
+is no longer in the store are skipped.
+
+Run (self-check with a deterministic local fake embedder, no API key needed)
+  python hybrid_search.py
+"""
+
+import re
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+
+from numpy_store import NumpyVectorStore, normalize, top_k
+
+# Words, and numbers with their separators kept together ("51.2", "1,000")
+TOKEN_RE = re.compile(r"\w+(?:[.,]\w+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+class BM25Index:
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.vocab: Dict[str, int] = {}
+        # Document id of every internal doc number, and the doc number of every live id
+        self.ids: List[str] = []
+        self.doc_of: Dict[str, int] = {}
+        self._deleted: Set[int] = set()
+        self.doc_len = np.empty(0, dtype=np.int32)
+        # Postings of term t are docs[offsets[t]:offsets[t + 1]] / tfs[...], doc numbers ascending
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.docs = np.empty(0, dtype=np.int32)
+        self.tfs = np.empty(0, dtype=np.uint16)
+        self._pending_terms = array("i")
+        self._pending_docs = array("i")
+        self._pending_tfs = array("H")
+        self._pending_lens = array("i")
+        self._norm: Optional[np.ndarray] = None
+
+    @property
+    def size(self) -> int:
+        return len(self.doc_of)
+
+    def add(self, texts: Iterable[str], ids: Sequence[str]) -> None:
+        """Index `texts` under the document `ids`; an id that is already indexed is replaced."""
+        texts = list(texts)
+        if len(texts) != len(ids):
+            raise ValueError(f"Got {len(texts)} texts for {len(ids)} ids")
+        self.delete([i for i in ids if i in self.doc_of])
+        doc = len(self.ids)
+        for doc_id, text in zip(ids, texts):
+            self.ids.append(doc_id)
+            self.doc_of[doc_id] = doc
+            tokens = tokenize(text)
+            for term, tf in Counter(tokens).items():
+                self._pending_terms.append(self.vocab.setdefault(term, len(self.vocab)))
+                self._pending_docs.append(doc)
+                self._pending_tfs.append(min(tf, 65535))
+            self._pending_lens.append(len(tokens))
+            doc += 1
+        self._norm = None
+
+    def delete(self, ids: Iterable[str]) -> None:
+        for doc_id in ids:
+            doc = self.doc_of.pop(doc_id, None)
+            if doc is not None:
+                self._deleted.add(doc)
+                self._norm = None
+
+    def _terms(self) -> np.ndarray:
+        # Term of every posting
+        return np.repeat(np.arange(len(self.offsets) - 1, dtype=np.int32), np.diff(self.offsets))
+
+    def _compact(self) -> None:
+        self._merge_pending()
+        self._drop_deleted()
+
+    def _merge_pending(self) -> None:
+        # Merge buffered postings into the term-sorted arrays
+        if not len(self._pending_lens):
+            return
+        old_terms = self._terms()
+        terms = np.concatenate([old_terms, np.frombuffer(self._pending_terms, dtype=np.int32)])
+        docs = np.concatenate([self.docs, np.frombuffer(self._pending_docs, dtype=np.int32)])
+        tfs = np.concatenate([self.tfs, np.frombuffer(self._pending_tfs, dtype=np.uint16)])
+        # New doc numbers are larger than old ones, so a stable sort by term keeps doc numbers ascending
+        order = np.argsort(terms, kind="stable")
+        self.docs, self.tfs = docs[order], tfs[order]
+        self.offsets = np.concatenate([[0], np.cumsum(np.bincount(terms, minlength=len(self.vocab)))])
+        self.doc_len = np.concatenate([self.doc_len, np.frombuffer(self._pending_lens, dtype=np.int32)])
+        self._pending_terms, self._pending_docs = array("i"), array("i")
+        self._pending_tfs, self._pending_lens = array("H"), array("i")
+
+    def _drop_deleted(self) -> None:
+        # Remove deleted documents and renumber the rest; renumbering keeps their order, so
+        # postings stay sorted by doc number
+        if not self._deleted:
+            return
+        keep = np.ones(len(self.doc_len), dtype=bool)
+        keep[list(self._deleted)] = False
+        renumber = (np.cumsum(keep) - 1).astype(np.int32)
+        live = keep[self.docs]
+        terms = self._terms()[live]
+        self.docs, self.tfs = renumber[self.docs[live]], self.tfs[live]
+        self.offsets = np.concatenate([[0], np.cumsum(np.bincount(terms, minlength=len(self.vocab)))])
+        self.doc_len = self.doc_len[keep]
+        self.ids = [doc_id for doc_id, k in zip(self.ids, keep) if k]
+        self.doc_of = {doc_id: doc for doc, doc_id in enumerate(self.ids)}
+        self._deleted = set()
+
+    def search(self, query: str, k: int) -> Tuple[List[str], np.ndarray]:
+        """Document ids (best first) and BM25 scores of the top k documents matching any query term."""
+        self._compact()
+        n = len(self.doc_len)
+        if self._norm is None:
+            avg = self.doc_len.mean() if n else 1.0
+            self._norm = self.k1 * (1 - self.b + self.b * self.doc_len / max(avg, 1e-9))
+        scores = np.zeros(n, dtype=np.float32)
+        for term in set(tokenize(query)):
+            t = self.vocab.get(term)
+            if t is None:
+                continue
+            lo, hi = self.offsets[t], self.offsets[t + 1]
+            docs, tf = self.docs[lo:hi], self.tfs[lo:hi].astype(np.float32)
+            idf = np.log1p((n - len(docs) + 0.5) / (len(docs) + 0.5))
+            scores[docs] += idf * tf * (self.k1 + 1) / (tf + self._norm[docs])
+        best = top_k(scores, k)
+        best = best[scores[best] > 0]
+        return [self.ids[doc] for doc in best], scores[best]
+
+    def save(self, path: str) -> None:
+        self._compact()
+        terms = np.array(sorted(self.vocab, key=self.vocab.get), dtype=np.str_)
+        np.savez(path, k1=self.k1, b=self.b, terms=terms, ids=np.array(self.ids, dtype=np.str_),
+                 doc_len=self.doc_len, offsets=self.offsets, docs=self.docs, tfs=self.tfs)
+
+    @classmethod
+    def load(cls, path: str) -> "BM25Index":
+        data = np.load(path)
+        if "ids" not in data.files:
+            raise ValueError(f"{path} was saved without document ids; rebuild it")
+        index = cls(float(data["k1"]), float(data["b"]))
+        index.vocab = {term: i for i, term in enumerate(data["terms"].tolist())}
+        index.ids = data["ids"].tolist()
+        index.doc_of = {doc_id: doc for doc, doc_id in enumerate(index.ids)}
+        index.doc_len, index.offsets = data["doc_len"], data["offsets"]
+        index.docs, index.tfs = data["docs"], data["tfs"]
+        return index
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[str]], k: int = 60) -> List[Tuple[str, float]]:
+    """Fuse ranked id lists: score(id) = sum of 1 / (k + rank), best first."""
+    fused: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, start=1):
+            fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (k + rank)
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
+
+
+class HybridSearcher:
+    def __init__(self, store: NumpyVectorStore, bm25: BM25Index, rrf_k: int = 60):
+        self.store = store
+        self.bm25 = bm25
+        self.rrf_k = rrf_k
+
+    def search_with_score(self, query: str, k: int = 4, fetch_k: int = 20) -> List[Tuple[Document, float]]:
+        """Top k documents by RRF of the dense and BM25 top `fetch_k`; scores are RRF scores."""
+        if self.store.size == 0:
+            return []
+        vector = normalize(np.asarray([self.store.embeddings.embed_query(query)], dtype=np.float32))
+        rows, _ = self.store._search(vector, fetch_k)
+        dense = [self.store.docs[row].id for row in rows[0]]
+        lexical, _ = self.bm25.search(query, fetch_k)
+        row_of = self.store.row_of
+        # An id BM25 still has but the store no longer does has nothing to return
+        lexical = [doc_id for doc_id in lexical if doc_id in row_of]
+        fused = reciprocal_rank_fusion([dense, lexical], self.rrf_k)
+        return [(self.store.docs[row_of[doc_id]], score) for doc_id, score in fused[:k]]
+
+    def search(self, query: str, k: int = 4, fetch_k: int = 20) -> List[Document]:
+        return [doc for doc, _ in self.search_with_score(query, k, fetch_k)]
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+
+    texts = [f"Segment note {i}: footwear and apparel revenues grew in region {i % 7}." for i in range(5000)]
+    texts[4321] = "As of May 31, 2023, we operated 29 distribution centers in the United States."
+    store = NumpyVectorStore(DeterministicFakeEmbedding(size=256))
+    ids = store.add_texts(texts)
+    bm25 = BM25Index()
+    bm25.add(texts, ids)
+
+    query = "How many distribution centers does Nike have in the US?"
+    dense = store.similarity_search(query, k=4)
+    hybrid = HybridSearcher(store, bm25).search(query, k=4)
+    print("dense :", [d.page_content[:50] for d in dense])
+    print("hybrid:", [d.page_content[:50] for d in hybrid])
+    assert texts[4321] in [d.page_content for d in hybrid]
+
+    path = os.path.join(tempfile.mkdtemp(), "bm25.npz")
+    bm25.save(path)
+    hits, _ = BM25Index.load(path).search(query, 4)
+    assert hits[0] == ids[4321]
+
+    # Deleting from the store shifts every later row; fused results must follow the ids
+    removed = ids[:100]
+    store.delete(removed)
+    bm25.delete(removed)
+    hybrid = HybridSearcher(store, bm25).search_with_score(query, k=4)
+    assert texts[4321] in [doc.page_content for doc, _ in hybrid]
+    assert all(doc.id not in removed and doc.page_content == texts[ids.index(doc.id)] for doc, _ in hybrid)
+    # A store delete the BM25 index missed only drops that hit instead of returning the wrong row
+    store.delete([ids[4321]])
+    hybrid = HybridSearcher(store, bm25).search(query, k=4)
+    assert all(doc.id != ids[4321] and doc.page_content == texts[ids.index(doc.id)] for doc in hybrid)
+    # Re-adding an id replaces its text in both indexes
+    store.add_texts([texts[4321]], ids=[ids[0]])
+    bm25.add([texts[4321]], [ids[0]])
+    assert bm25.search(query, 1)[0] == [ids[0]]
+    assert ids[0] in [doc.id for doc in HybridSearcher(store, bm25).search(query, k=4)]
+    print("delete/re-add: ok")
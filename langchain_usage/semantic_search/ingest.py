@@ -0,0 +1,185 @@
+"""
+Parallel, streaming PDF ingestion for the semantic search corpus.
+
+- Page text is extracted with pypdf (the library PyPDFLoader wraps) in a process pool, a few
+  pages per task, so many filings use all cores instead of one. Workers are started with
+  forkserver (spawn where that is missing), never fork: the caller may already hold gRPC
+  clients and threads (the Gemini embeddings), which a forked child would inherit in an
+  undefined state. Scripts that call `ingest()` therefore need an `if __name__ == "__main__"`
+  guard, since the workers import the main module.
+- At most `max_pending` tasks are in flight; the next one is submitted when the oldest result
+  is consumed, so a slow embedder holds back extraction instead of letting every extracted
+  page pile up in memory. Each worker keeps its last few PdfReaders open, so consecutive
+  page ranges of a file do not re-parse it.
+- Pages come back in order as a generator and go through the text splitter one at a time
+  (the splitter never merges text across pages, so the chunks are the same as splitting the
+  whole loaded list).
+- Chunks are handed to the vector store in batches as soon as they are produced, so embedding
+  overlaps with extraction of the following pages.
+
+Run
+  python ingest.py nke-10k-2023.pdf                         # fake embeddings: extraction + splitting only
+  python ingest.py filings/*.pdf --workers 8 --snapshot index_snapshots --gemini
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStore
+
+from hybrid_search import BM25Index
+
+
+@lru_cache(maxsize=4)
+def _reader(path: str):
+    # Per worker process: the page-range tasks of a file mostly land on the same workers
+    from pypdf import PdfReader
+
+    return PdfReader(path)
+
+
+def count_pages(path: str) -> int:
+    return len(_reader(path).pages)
+
+
+def extract_pages(task: Tuple[str, int, int]) -> List[Tuple[int, str]]:
+    """Text of pages [start, stop) of one PDF; runs in a worker process."""
+    path, start, stop = task
+    reader = _reader(path)
+    return [(i, reader.pages[i].extract_text()) for i in range(start, stop)]
+
+
+class IngestStats:
+    def __init__(self):
+        self.files = 0
+        self.pages = 0
+        self.chunks = 0
+        self.started = time.perf_counter()
+
+    @property
+    def seconds(self) -> float:
+        return time.perf_counter() - self.started
+
+    def __str__(self) -> str:
+        s = max(self.seconds, 1e-9)
+        return (f"{self.files} files, {self.pages} pages, {self.chunks} chunks in {s:.1f}s "
+                f"({self.pages / s:.1f} pages/s, {self.chunks / s:.1f} chunks/s)")
+
+
+def _mp_context():
+    # Not fork: forking after the embedding client started its threads can deadlock the child
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def iter_pages(paths: Iterable[str], workers: Optional[int] = None, pages_per_task: int = 8,
+               stats: Optional[IngestStats] = None, max_pending: Optional[int] = None) -> Iterator[Document]:
+    """Page Documents of every PDF in order, with `source` (the path) and 0-based `page` metadata.
+
+    PyPDFLoader sets the same two keys, plus the PDF info fields, `total_pages` and `page_label`,
+    which are not extracted here. At most `max_pending` tasks (default 2 per worker) are
+    extracted ahead of the consumer.
+    """
+    paths = list(paths)
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_mp_context()) as pool:
+        tasks = iter([(path, start, min(start + pages_per_task, n))
+                      for path, n in zip(paths, pool.map(count_pages, paths))
+                      for start in range(0, n, pages_per_task)])
+        pending: "deque[Tuple[str, Future]]" = deque()
+
+        def submit_next() -> None:
+            task = next(tasks, None)
+            if task is not None:
+                pending.append((task[0], pool.submit(extract_pages, task)))
+
+        for _ in range(max_pending):
+            submit_next()
+        current = None
+        while pending:
+            path, future = pending.popleft()
+            pages = future.result()
+            # Refill before yielding, so the pool works on the next task while this one is consumed
+            submit_next()
+            if stats is not None and path != current:
+                stats.files += 1
+                current = path
+            for page, text in pages:
+                if stats is not None:
+                    stats.pages += 1
+                yield Document(page_content=text, metadata={"source": path, "page": page})
+
+
+def iter_chunks(pages: Iterable[Document], splitter, stats: Optional[IngestStats] = None) -> Iterator[Document]:
+    for page in pages:
+        chunks = splitter.split_documents([page])
+        if stats is not None:
+            stats.chunks += len(chunks)
+        yield from chunks
+
+
+def batched(items: Iterable[Document], size: int) -> Iterator[List[Document]]:
+    batch: List[Document] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def ingest(paths: Iterable[str], store: VectorStore, splitter, batch_size: int = 256,
+           workers: Optional[int] = None, pages_per_task: int = 8,
+           bm25: Optional[BM25Index] = None, max_pending: Optional[int] = None) -> IngestStats:
+    """Extract, split and embed `paths` into `store`, streaming; returns throughput counters.
+
+    With `bm25`, every chunk is also indexed lexically, under the id the store gave it.
+    """
+    stats = IngestStats()
+    chunks = iter_chunks(iter_pages(paths, workers, pages_per_task, stats, max_pending), splitter, stats)
+    for batch in batched(chunks, batch_size):
+        ids = store.add_documents(batch)
+        if bm25 is not None:
+            bm25.add((doc.page_content for doc in batch), ids)
+    return stats
+
+
+if __name__ == "__main__":
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+
+    from embedding_cache import CachedEmbeddings
+    from fast_splitter import FastRecursiveCharacterTextSplitter
+    from numpy_store import NumpyVectorStore
+    from snapshot import build_snapshot
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("pdfs", nargs="+")
+    ap.add_argument("--workers", type=int, default=os.cpu_count())
+    ap.add_argument("--pages-per-task", type=int, default=8)
+    ap.add_argument("--batch-size", type=int, default=256, help="Chunks per embedding call")
+    ap.add_argument("--gemini", action="store_true", help="Embed with Gemini (cached) instead of a local fake")
+    ap.add_argument("--snapshot", help="Write the result as a snapshot under this directory")
+    args = ap.parse_args()
+
+    if args.gemini:
+        from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+        embeddings = CachedEmbeddings(GoogleGenerativeAIEmbeddings(model="models/gemini-embedding-001"),
+                                      "embeddings_cache.sqlite", batch_size=100, max_concurrency=4)
+    else:
+        embeddings = DeterministicFakeEmbedding(size=768)
+    splitter = FastRecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200, add_start_index=True)
+    store = NumpyVectorStore(embeddings)
+    bm25 = BM25Index()
+    print(ingest(args.pdfs, store, splitter, args.batch_size, args.workers, args.pages_per_task, bm25))
+    if args.snapshot:
+        print(f"Wrote snapshot {build_snapshot(store, args.snapshot, bm25=bm25)}")
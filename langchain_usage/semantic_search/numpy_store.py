@@ -0,0 +1,151 @@
+"""
+Drop-in replacement for LangChain's InMemoryVectorStore backed by one NumPy matrix.
+
+Embeddings are L2-normalized and kept in a contiguous float32 matrix, so a query is a single
+matrix-vector product plus `argpartition` for the top k, and `similarity_search_batch` scores
+many questions with one matrix-matrix product. Scores are cosine similarities (higher is more
+similar), the same as InMemoryVectorStore.
+"""
+
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indexes of the k highest scores along the last axis, best first."""
+    n = scores.shape[-1]
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(scores.shape[:-1] + (0,), dtype=np.int64)
+    if k < n:
+        idx = np.argpartition(-scores, k - 1, axis=-1)[..., :k]
+    else:
+        idx = np.broadcast_to(np.arange(n), scores.shape).copy()
+    order = np.argsort(-np.take_along_axis(scores, idx, axis=-1), axis=-1, kind="stable")
+    return np.take_along_axis(idx, order, axis=-1)
+
+
+class NumpyVectorStore(VectorStore):
+    def __init__(self, embedding: Embeddings):
+        self.embedding = embedding
+        self.ids: List[str] = []
+        self.docs: List[Document] = []
+        self.row_of: Dict[str, int] = {}
+        self.matrix = np.empty((0, 0), dtype=np.float32)
+        self.size = 0
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self.embedding
+
+    def _reserve(self, extra: int, dim: int) -> None:
+        # Grow capacity geometrically so repeated adds stay amortized O(n)
+        needed = self.size + extra
+        if self.matrix.shape[1] not in (0, dim):
+            raise ValueError(f"Embedding size {dim} does not match the store ({self.matrix.shape[1]})")
+        if needed > self.matrix.shape[0] or self.matrix.shape[1] == 0:
+            grown = np.empty((max(needed, 2 * self.matrix.shape[0], 64), dim), dtype=np.float32)
+            if self.size:
+                grown[:self.size] = self.matrix[:self.size]
+            self.matrix = grown
+
+    def add_vectors(self, vectors: Sequence[Sequence[float]], documents: List[Document],
+                    ids: Optional[List[str]] = None) -> List[str]:
+        vectors = normalize(np.asarray(vectors, dtype=np.float32).reshape(len(documents), -1))
+        ids = list(ids) if ids else [doc.id or str(uuid.uuid4()) for doc in documents]
+        self.delete([i for i in ids if i in self.row_of])
+        self._reserve(len(documents), vectors.shape[1])
+        self.matrix[self.size:self.size + len(documents)] = vectors
+        for doc_id, doc in zip(ids, documents):
+            self.row_of[doc_id] = self.size
+            self.ids.append(doc_id)
+            self.docs.append(Document(id=doc_id, page_content=doc.page_content, metadata=doc.metadata))
+            self.size += 1
+        return ids
+
+    def add_texts(self, texts: Iterable[str], metadatas: Optional[List[dict]] = None,
+                  ids: Optional[List[str]] = None, **kwargs: Any) -> List[str]:
+        texts = list(texts)
+        metadatas = metadatas or [{} for _ in texts]
+        docs = [Document(page_content=t, metadata=m) for t, m in zip(texts, metadatas)]
+        return self.add_vectors(self.embedding.embed_documents(texts), docs, ids)
+
+    def add_documents(self, documents: List[Document], **kwargs: Any) -> List[str]:
+        vectors = self.embedding.embed_documents([d.page_content for d in documents])
+        return self.add_vectors(vectors, documents, kwargs.get("ids"))
+
+    def delete(self, ids: Optional[List[str]] = None, **kwargs: Any) -> Optional[bool]:
+        rows = [self.row_of[i] for i in ids or [] if i in self.row_of]
+        if not rows:
+            return True
+        keep = np.ones(self.size, dtype=bool)
+        keep[rows] = False
+        self.matrix = np.ascontiguousarray(self.matrix[:self.size][keep])
+        self.ids = [i for i, k in zip(self.ids, keep) if k]
+        self.docs = [d for d, k in zip(self.docs, keep) if k]
+        self.size = len(self.ids)
+        self.row_of = {doc_id: row for row, doc_id in enumerate(self.ids)}
+        return True
+
+    def get_by_ids(self, ids: Sequence[str], /) -> List[Document]:
+        return [self.docs[self.row_of[i]] for i in ids if i in self.row_of]
+
+    # -- search --------------------------------------------------------------
+
+    def _search(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Row indexes (best first) and their scores for normalized `queries`; exact search."""
+        scores = queries @ self.matrix[:self.size].T
+        best = top_k(scores, k)
+        return best, np.take_along_axis(scores, best, axis=-1)
+
+    def similarity_search_by_vector_with_score(self, embedding: List[float], k: int = 4,
+                                               **kwargs: Any) -> List[Tuple[Document, float]]:
+        return self.similarity_search_by_vectors_with_score([embedding], k)[0]
+
+    def similarity_search_by_vector(self, embedding: List[float], k: int = 4, **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_by_vector_with_score(embedding, k)]
+
+    def similarity_search_with_score(self, query: str, k: int = 4, **kwargs: Any) -> List[Tuple[Document, float]]:
+        return self.similarity_search_by_vector_with_score(self.embedding.embed_query(query), k)
+
+    def similarity_search(self, query: str, k: int = 4, **kwargs: Any) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k)]
+
+    def similarity_search_by_vectors_with_score(self, embeddings: Sequence[Sequence[float]],
+                                                k: int = 4) -> List[List[Tuple[Document, float]]]:
+        """Top k documents for each query vector, scored with one matrix product."""
+        queries = np.asarray(embeddings, dtype=np.float32).reshape(len(embeddings), -1)
+        if self.size == 0:
+            return [[] for _ in range(len(queries))]
+        best, scores = self._search(normalize(queries), k)
+        return [[(self.docs[j], float(s)) for j, s in zip(rows, row_scores)]
+                for rows, row_scores in zip(best, scores)]
+
+    def similarity_search_batch(self, queries: List[str], k: int = 4) -> List[List[Tuple[Document, float]]]:
+        """Answer many questions at once: every question is embedded, then all are scored in one call."""
+        return self.similarity_search_by_vectors_with_score(
+            [self.embedding.embed_query(q) for q in queries], k
+        )
+
+    def _select_relevance_score_fn(self):
+        # Scores already are cosine similarities
+        return lambda score: score
+
+    @classmethod
+    def from_texts(cls, texts: List[str], embedding: Embeddings, metadatas: Optional[List[dict]] = None,
+                   ids: Optional[List[str]] = None, **kwargs: Any) -> "NumpyVectorStore":
+        store = cls(embedding)
+        store.add_texts(texts, metadatas, ids)
+        return store
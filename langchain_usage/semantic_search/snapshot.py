@@ -0,0 +1,244 @@
+"""
+Build-once / serve-many index snapshots for the semantic search corpus.
+
+`build_snapshot()` writes the chunks, their metadata (page, start_index, ...) and normalized
+vectors of a NumpyVectorStore to a new version directory under `root`, then points
+`root/CURRENT` at it. `open_snapshot()` maps the current version read-only: vectors with
+`np.memmap` and chunks through an offsets table, so opening takes milliseconds whatever the
+corpus size. Worker processes that open the same snapshot share its pages in the OS page cache.
+A long-running server calls `reopen_snapshot()` to switch to a newer CURRENT; it closes the
+store it replaces (the docs.jsonl file handle and its mapping). Stores are also context managers.
+
+Layout
+  root/CURRENT              name of the current version directory
+  root/v0003/manifest.json  format, version, count, dim, embedding model, source fingerprint
+  root/v0003/vectors.f32    count x dim float32, row-major
+  root/v0003/docs.jsonl     one {"id", "page_content", "metadata"} object per line
+  root/v0003/docs_offsets.npy  byte offset of every line (count + 1 entries)
+  root/v0003/bm25.npz       optional BM25 index over the same documents (hybrid_search.py)
+  root/v0003/ivf.npz        optional IVF index over the same rows (ann_index.py); when present,
+                            the snapshot store searches through it instead of scanning all rows
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from ann_index import IVFIndex, ivf_search
+from hybrid_search import BM25Index
+from numpy_store import NumpyVectorStore
+
+SNAPSHOT_FORMAT = 1
+
+
+def source_fingerprint(file_path: str, **params: Any) -> Dict[str, Any]:
+    """What a snapshot was built from: file content hash plus build parameters (splitter, model...)."""
+    h = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return {"file": os.path.basename(file_path), "sha256": h.hexdigest(), **params}
+
+
+def _next_version(root: str) -> str:
+    versions = [int(d[1:]) for d in os.listdir(root) if d.startswith("v") and d[1:].isdigit()]
+    return f"v{max(versions, default=0) + 1:04d}"
+
+
+def build_snapshot(store: NumpyVectorStore, root: str, source: Optional[Dict[str, Any]] = None,
+                   model: Optional[str] = None, bm25: Optional[BM25Index] = None,
+                   ivf: Optional[IVFIndex] = None) -> str:
+    """Write `store` as a new snapshot version under `root` and make it current. Returns its directory."""
+    os.makedirs(root, exist_ok=True)
+    version = _next_version(root)
+    tmp = os.path.join(root, f".{version}.tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+
+    vectors = np.ascontiguousarray(store.matrix[:store.size], dtype=np.float32)
+    vectors.tofile(os.path.join(tmp, "vectors.f32"))
+    offsets = [0]
+    with open(os.path.join(tmp, "docs.jsonl"), "wb") as f:
+        for doc_id, doc in zip(store.ids, store.docs):
+            line = json.dumps({"id": doc_id, "page_content": doc.page_content, "metadata": doc.metadata},
+                              ensure_ascii=False).encode("utf-8") + b"\n"
+            f.write(line)
+            offsets.append(offsets[-1] + len(line))
+    np.save(os.path.join(tmp, "docs_offsets.npy"), np.asarray(offsets, dtype=np.int64))
+    if bm25 is not None:
+        bm25.save(os.path.join(tmp, "bm25.npz"))
+    if ivf is not None:
+        ivf.save(os.path.join(tmp, "ivf.npz"))
+    manifest = {
+        "format": SNAPSHOT_FORMAT,
+        "version": version,
+        "count": int(vectors.shape[0]),
+        "dim": int(vectors.shape[1]) if vectors.ndim == 2 else 0,
+        "model": model or getattr(store.embeddings, "model_name", None) or getattr(store.embeddings, "model", None),
+        "source": source or {},
+        "index": "ivf" if ivf is not None else "flat",
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+    with open(os.path.join(tmp, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    final = os.path.join(root, version)
+    os.replace(tmp, final)
+    with open(os.path.join(root, "CURRENT.tmp"), "w", encoding="utf-8") as f:
+        f.write(version)
+    os.replace(os.path.join(root, "CURRENT.tmp"), os.path.join(root, "CURRENT"))
+    return final
+
+
+class LazyDocs(Sequence):
+    """Documents of a snapshot, parsed from the memory-mapped docs.jsonl only when accessed."""
+
+    def __init__(self, path: str, offsets: np.ndarray):
+        self._f = open(path, "rb")
+        self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ) if offsets[-1] else b""
+        self._offsets = offsets
+        self._get = lru_cache(maxsize=4096)(self._load)
+
+    def _load(self, i: int) -> Document:
+        data = json.loads(self._mm[self._offsets[i]:self._offsets[i + 1]])
+        return Document(id=data["id"], page_content=data["page_content"], metadata=data["metadata"])
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        return self._get(int(i))
+
+    def close(self) -> None:
+        self._get.cache_clear()
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._f.close()
+        # The offsets are a memmap too; like the vectors, it is unmapped once nothing refers to it
+        self._offsets = np.zeros(1, dtype=np.int64)
+
+    def __enter__(self) -> "LazyDocs":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class SnapshotVectorStore(NumpyVectorStore):
+    """Read-only NumpyVectorStore over a memory-mapped snapshot. Rebuild the snapshot to change it."""
+
+    def __init__(self, embedding: Embeddings, path: str):
+        super().__init__(embedding)
+        with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        if self.manifest["format"] != SNAPSHOT_FORMAT:
+            raise ValueError(f"Unsupported snapshot format {self.manifest['format']} in {path}")
+        self.path = path
+        self.size = self.manifest["count"]
+        if self.size:
+            self.matrix = np.memmap(os.path.join(path, "vectors.f32"), dtype=np.float32, mode="r",
+                                    shape=(self.size, self.manifest["dim"]))
+        offsets = np.load(os.path.join(path, "docs_offsets.npy"), mmap_mode="r")
+        self.docs = LazyDocs(os.path.join(path, "docs.jsonl"), offsets)
+        self._row_of: Optional[Dict[str, int]] = None
+        bm25_path = os.path.join(path, "bm25.npz")
+        self.bm25: Optional[BM25Index] = None
+        if os.path.exists(bm25_path):
+            try:
+                self.bm25 = BM25Index.load(bm25_path)
+            except ValueError:
+                # Saved before BM25 kept document ids; treated like a snapshot without one
+                pass
+        ivf_path = os.path.join(path, "ivf.npz")
+        self.index = IVFIndex.load(ivf_path) if os.path.exists(ivf_path) else None
+
+    @property
+    def ids(self) -> List[str]:
+        return [doc.id for doc in self.docs]
+
+    @ids.setter
+    def ids(self, value: List[str]) -> None:
+        # NumpyVectorStore.__init__ assigns an empty list; ids are read from the snapshot
+        pass
+
+    @property
+    def row_of(self) -> Dict[str, int]:
+        # Only needed for get_by_ids, so built on first use
+        if self._row_of is None:
+            self._row_of = {doc.id: row for row, doc in enumerate(self.docs)}
+        return self._row_of
+
+    @row_of.setter
+    def row_of(self, value: Dict[str, int]) -> None:
+        pass
+
+    def _search(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        if self.index is None:
+            return super()._search(queries, k)
+        return ivf_search(self.index, queries, k, self.matrix[:self.size])
+
+    def add_vectors(self, *args: Any, **kwargs: Any) -> List[str]:
+        raise NotImplementedError("Snapshots are read-only; build a new one with build_snapshot()")
+
+    def delete(self, ids: Optional[List[str]] = None, **kwargs: Any) -> Optional[bool]:
+        raise NotImplementedError("Snapshots are read-only; build a new one with build_snapshot()")
+
+    def close(self) -> None:
+        """Release docs.jsonl and drop the memmaps; they are unmapped once no other array refers to them."""
+        self.docs.close()
+        self._row_of = None
+        self.index = None
+        self.matrix = np.empty((0, self.manifest["dim"]), dtype=np.float32)
+        self.size = 0
+
+    def __enter__(self) -> "SnapshotVectorStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def current_snapshot(root: str) -> Optional[str]:
+    try:
+        with open(os.path.join(root, "CURRENT"), encoding="utf-8") as f:
+            return os.path.join(root, f.read().strip())
+    except FileNotFoundError:
+        return None
+
+
+def open_snapshot(root: str, embedding: Embeddings,
+                  source: Optional[Dict[str, Any]] = None) -> Optional[SnapshotVectorStore]:
+    """Open the current snapshot under `root`; None if there is none or it was built from another `source`."""
+    path = current_snapshot(root)
+    if path is None:
+        return None
+    store = SnapshotVectorStore(embedding, path)
+    if source is not None and store.manifest.get("source") != source:
+        store.close()
+        return None
+    return store
+
+
+def reopen_snapshot(store: Optional[SnapshotVectorStore], root: str, embedding: Embeddings,
+                    source: Optional[Dict[str, Any]] = None) -> Optional[SnapshotVectorStore]:
+    """`store` if it is still the current snapshot under `root`, else the new current one with `store` closed."""
+    path = current_snapshot(root)
+    if store is not None and path == store.path:
+        return store
+    new_store = open_snapshot(root, embedding, source)
+    if store is not None:
+        store.close()
+    return new_store
@@ -0,0 +1,87 @@
+"""
+Check FastRecursiveCharacterTextSplitter (fast_splitter.py) against LangChain's
+RecursiveCharacterTextSplitter and time both.
+
+Inputs are the pages of the 10-K PDF (when pypdf is installed) plus generated text with blank
+lines, long lines and unbroken runs that exercise every separator level. Chunks and
+`start_index` must be identical; the report gives MB/s and chunks/s for each splitter.
+
+Run
+  python splitter_bench.py
+  python splitter_bench.py --pdf nke-10k-2023.pdf --chunk-size 500 --overlap 50 --repeat 5
+"""
+
+import argparse
+import os
+import random
+import time
+from typing import List
+
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from fast_splitter import FastRecursiveCharacterTextSplitter
+
+
+def generated_texts(n: int = 50, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    words = ["revenue", "Nike", "footwear", "apparel", "fiscal", "2023", "the", "of", "$", "million",
+             "a" * 40, "x" * 1500, "NIKE, Inc.", "distribution", "centers", " ", "\t"]
+    texts = []
+    for _ in range(n):
+        parts = []
+        for _ in range(rng.randint(50, 3000)):
+            parts.append(rng.choice(words))
+            parts.append(rng.choices([" ", "\n", "\n\n", "\n\n\n", "  ", ""], [70, 12, 6, 2, 5, 5])[0])
+        texts.append("".join(parts))
+    return texts
+
+
+def pdf_texts(path: str) -> List[str]:
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        print("pypdf not installed, skipping the PDF")
+        return []
+    return [page.extract_text() for page in PdfReader(path).pages]
+
+
+def timed(splitter, docs: List[Document], repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        chunks = splitter.split_documents(docs)
+        best = min(best, time.perf_counter() - t0)
+    return chunks, best
+
+
+def bench(label: str, texts: List[str], chunk_size: int, overlap: int, repeat: int) -> None:
+    docs = [Document(page_content=t, metadata={"page": i}) for i, t in enumerate(texts)]
+    kwargs = dict(chunk_size=chunk_size, chunk_overlap=overlap, add_start_index=True)
+    ref, ref_s = timed(RecursiveCharacterTextSplitter(**kwargs), docs, repeat)
+    fast, fast_s = timed(FastRecursiveCharacterTextSplitter(**kwargs), docs, repeat)
+
+    assert len(ref) == len(fast), (len(ref), len(fast))
+    for i, (r, f) in enumerate(zip(ref, fast)):
+        assert r.page_content == f.page_content and r.metadata == f.metadata, (i, r, f)
+
+    mb = sum(len(t) for t in texts) / 1e6
+    print(f"\n{label}: {len(texts)} texts, {mb:.2f} MB, {len(ref)} chunks - identical")
+    for name, s in (("langchain", ref_s), ("fast", fast_s)):
+        print(f"  {name:<10} {s * 1000:8.1f} ms   {mb / s:7.2f} MB/s   {len(ref) / s:9.0f} chunks/s")
+    print(f"  speedup    {ref_s / fast_s:.1f}x")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pdf", default="nke-10k-2023.pdf")
+    ap.add_argument("--chunk-size", type=int, default=1000)
+    ap.add_argument("--overlap", type=int, default=200)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    if os.path.exists(args.pdf):
+        pages = pdf_texts(args.pdf)
+        if pages:
+            bench(args.pdf, pages, args.chunk_size, args.overlap, args.repeat)
+    bench("generated", generated_texts(), args.chunk_size, args.overlap, args.repeat)
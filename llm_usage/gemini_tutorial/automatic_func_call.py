@@ -1,5 +1,6 @@
 from google import genai
-from google.genai import types
+
+from tool_registry import ToolRegistry
 
 # Actual function implementations
 def power_disco_ball_impl(power: bool) -> dict:
@@ -38,20 +39,21 @@ def dim_lights_impl(brightness: float) -> dict:
     """
     return {"brightness": brightness}
 
-# Configure the client
-client = genai.Client()
-config = types.GenerateContentConfig(
-    tools=[power_disco_ball_impl, start_music_impl, dim_lights_impl]
-)
-
-# Make the request
-response = client.models.generate_content(
-    model="gemini-2.5-flash",
-    contents="Do everything you need to this place into party!",
-    config=config,
-)
-
-print("\nExample 2: Automatic function calling")
-print(response.text)
+# Declarations and config are built once at startup and reused for every request
+registry = ToolRegistry([power_disco_ball_impl, start_music_impl, dim_lights_impl])
+
+if __name__ == "__main__":
+    # Configure the client
+    client = genai.Client()
+
+    # Make the request; the registry runs the requested functions and sends back their results
+    response = registry.generate(
+        client,
+        "Do everything you need to this place into party!",
+        model="gemini-2.5-flash",
+    )
+
+    print("\nExample 2: Automatic function calling")
+    print(response.text)
 # I've turned on the disco ball, started playing loud and energetic music, and dimmed the lights to 50% brightness. Let's get this party started!
 # Alright, the disco ball is spinning, the music is pumping, and the lights are dimmed. Get ready to party!
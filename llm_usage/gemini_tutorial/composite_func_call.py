@@ -1,5 +1,6 @@
 from google import genai
-from google.genai import types
+
+from tool_registry import ToolRegistry
 
 # Example Functions
 def get_weather_forecast(location: str) -> dict:
@@ -16,18 +17,19 @@ def set_thermostat_temperature(temperature: int) -> dict:
     print("Tool Response: {'status': 'success'}")
     return {"status": "success"}
 
-# Configure the client and model
-client = genai.Client()
-config = types.GenerateContentConfig(
-    tools=[get_weather_forecast, set_thermostat_temperature]
-)
+# Declarations and config are built once at startup and reused for every request
+registry = ToolRegistry([get_weather_forecast, set_thermostat_temperature])
+
+if __name__ == "__main__":
+    # Configure the client and model
+    client = genai.Client()
 
-# Make the request
-response = client.models.generate_content(
-    model="gemini-2.5-flash",
-    contents="If it's warmer than 20°C in London, set the thermostat to 20°C, otherwise set it to 18°C.",
-    config=config,
-)
+    # Make the request; the model may call both tools, one after the other
+    response = registry.generate(
+        client,
+        "If it's warmer than 20°C in London, set the thermostat to 20°C, otherwise set it to 18°C.",
+        model="gemini-2.5-flash",
+    )
 
-# Print the final, user-facing response
-print(response.text)
\ No newline at end of file
+    # Print the final, user-facing response
+    print(response.text)
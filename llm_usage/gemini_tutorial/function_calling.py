@@ -1,6 +1,8 @@
 from google import genai
 from google.genai import types
 
+from tool_dispatcher import ToolDispatcher
+
 # Define the function declaration for the model
 # schedule_meeting_function = {
 #     "name": "schedule_meeting",
@@ -65,7 +67,9 @@ def set_light_values(brightness: int, color_temp: str) -> dict[str, int | str]:
     return {"brightness": brightness, "colorTemperature": color_temp}
 
 client = genai.Client()
-tools = types.Tool(function_declarations=[set_light_values_declaration])
+dispatcher = ToolDispatcher(timeout=10)
+dispatcher.register(set_light_values_declaration, set_light_values)
+tools = types.Tool(function_declarations=dispatcher.declarations())
 config = types.GenerateContentConfig(tools=[tools])
 prompt = "Turn the lights down to a romantic level"
 
@@ -81,36 +85,29 @@ response = client.models.generate_content(
     config=config,
 )
 
-if response.candidates[0].content.parts[0].function_call:
-    function_call = response.candidates[0].content.parts[0].function_call
-    print(f"Function to call: {function_call.name}")
-    print(f"Arguments: {function_call.args}")
-    #  In a real app, you would call your function here:
-    #  result = schedule_meeting(**function_call.args)
+if response.function_calls:
+    for function_call in response.function_calls:
+        print(f"Function to call: {function_call.name}")
+        print(f"Arguments: {function_call.args}")
 else:
     print("No function call found in the response.")
     print(response.text)
 
-tool_call = response.candidates[0].content.parts[0].function_call
-result = ""
-if tool_call == "set_light_values":
-    print(f"Function before calling: {result}")
-    result = set_light_values(**tool_call.args)
-    print(f"Function execution result: {result}")
-
-#Append function result so that agent can show it to the user
-function_response_part = types.Part.from_function_response(name=tool_call.name, response={"result": result})
-
-contents.append(response.candidates[0].content)
-contents.append(types.Content(
-        role="user", parts=[function_response_part]
-    ))
-
-final_result = client.models.generate_content(
-    model="gemini-2.5-flash",
-    contents=contents,
-    config=config,)
+if response.function_calls:
+    # Validates the args and runs every requested call (concurrently if there are several)
+    results = dispatcher.dispatch(response.function_calls)
+    for tool_result in results:
+        print(f"Function execution result: {tool_result.response} ({tool_result.seconds * 1000:.1f} ms)")
 
-print(final_result.text)
+    #Append function results so that agent can show them to the user
+    contents.append(response.candidates[0].content)
+    contents.append(types.Content(
+            role="user", parts=dispatcher.response_parts(results)
+        ))
 
+    final_result = client.models.generate_content(
+        model="gemini-2.5-flash",
+        contents=contents,
+        config=config,)
 
+    print(final_result.text)
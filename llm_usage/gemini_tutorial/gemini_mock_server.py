@@ -0,0 +1,144 @@
+"""
+Local stand-in for the Gemini REST API, with injected latency.
+
+Answers the call the samples need, so concurrency can be tried without an API key:
+- POST /<version>/models/<model>:generateContent   -> a short text derived from the prompt
+When the request declares tools and its last turn is not a function response, the reply
+instead calls the first `tool_calls` declared functions (all in one turn), with arguments
+built from their schemas; the next request, carrying the responses, gets the text. So a
+function-calling loop makes one tool round per prompt. `tool_calls=0` always answers with text.
+Each request sleeps `latency` seconds (plus up to `jitter`). Requests are served on their own
+threads, so concurrent calls overlap like they would against the real service. `stats` counts
+the calls and the prompt characters received.
+
+Use
+  server, base_url = start_mock_server(latency=1.0)
+  client = genai.Client(api_key="mock", http_options=types.HttpOptions(base_url=base_url))
+
+Run standalone
+  python gemini_mock_server.py --port 8765 --latency 1.0
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+
+GENERATE_RE = re.compile(r"^/[^/]+/models/([^/:]+):generateContent$")
+
+
+def _texts(contents: Any) -> str:
+    if isinstance(contents, dict):
+        contents = [contents]
+    return " ".join(part.get("text", "") for content in contents or [] for part in content.get("parts", []))
+
+
+def _example_value(schema: Dict[str, Any]) -> Any:
+    """A value that satisfies a (JSON or Gemini) parameter schema."""
+    if schema.get("enum"):
+        return schema["enum"][0]
+    kind = str(schema.get("type", "string")).lower()
+    return {"boolean": True, "integer": 1, "number": 0.5, "array": [], "object": {}}.get(kind, "x")
+
+
+def _function_calls(request: Dict[str, Any], limit: int) -> List[Dict[str, Any]]:
+    contents = request.get("contents") or []
+    if not limit or (contents and any("functionResponse" in part for part in contents[-1].get("parts", []))):
+        return []
+    declarations = [d for tool in request.get("tools") or [] for d in tool.get("functionDeclarations") or []]
+    calls = []
+    for i, declaration in enumerate(declarations[:limit]):
+        # The SDK sends the JSON schema as parameters_json_schema, the REST docs spell it in camelCase
+        schema = (declaration.get("parametersJsonSchema") or declaration.get("parameters_json_schema")
+                  or declaration.get("parameters") or {})
+        properties = schema.get("properties") or {}
+        args = {name: _example_value(properties[name]) for name in schema.get("required") or properties}
+        calls.append({"functionCall": {"id": f"call-{i}", "name": declaration["name"], "args": args}})
+    return calls
+
+
+class MockGeminiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], latency: float = 0.5, jitter: float = 0.0, tool_calls: int = 3):
+        super().__init__(address, MockGeminiHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.tool_calls = tool_calls
+        self.stats: Counter = Counter()
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
+
+
+class MockGeminiHandler(BaseHTTPRequestHandler):
+    server: MockGeminiServer
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        path = self.path.split("?", 1)[0]
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        server = self.server
+        time.sleep(server.latency + random.uniform(0, server.jitter))
+
+        match = GENERATE_RE.match(path)
+        if not match:
+            return self._reply(404, {"error": {"code": 404, "message": f"Unknown path {path}",
+                                               "status": "NOT_FOUND"}})
+        with server.lock:
+            server.stats["generate"] += 1
+            prompt = _texts(request.get("systemInstruction")) + " " + _texts(request.get("contents"))
+            server.stats["prompt_chars"] += len(prompt)
+        calls = _function_calls(request, server.tool_calls)
+        if calls:
+            with server.lock:
+                server.stats["function_calls"] += len(calls)
+            parts = calls
+            text = ""
+        else:
+            first_line = next((line.strip() for line in prompt.splitlines() if line.strip()), "")
+            text = f"[{match.group(1)}] reply to: {first_line[:80]}"
+            parts = [{"text": text}]
+        self._reply(200, {
+            "candidates": [{"content": {"role": "model", "parts": parts}, "finishReason": "STOP"}],
+            "usageMetadata": {"promptTokenCount": len(prompt) // 4, "candidatesTokenCount": len(text) // 4},
+        })
+
+
+def start_mock_server(latency: float = 0.5, jitter: float = 0.0, port: int = 0,
+                      tool_calls: int = 3) -> Tuple[MockGeminiServer, str]:
+    """Start the server on a background thread; returns it and its base URL."""
+    server = MockGeminiServer(("127.0.0.1", port), latency, jitter, tool_calls)
+    threading.Thread(target=server.serve_forever, name="gemini-mock", daemon=True).start()
+    return server, server.base_url
+
+
+if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--latency", type=float, default=1.0)
+    ap.add_argument("--jitter", type=float, default=0.0)
+    args = ap.parse_args()
+
+    server = MockGeminiServer(("127.0.0.1", args.port), args.latency, args.jitter)
+    print(f"Mock Gemini API on {server.base_url} ({args.latency}s latency)")
+    server.serve_forever()
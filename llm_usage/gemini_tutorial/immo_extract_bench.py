@@ -0,0 +1,77 @@
+"""
+Benchmark: per-card extraction (`extract_cards`) vs single-roundtrip extraction (`extract_page`).
+
+Loads saved Immoweb result pages (or synthetic ones) into a headless Chromium page with
+`page.set_content` and times both extraction paths on the same DOM, so no network is involved.
+It also checks that both paths produce the same listings.
+
+Run
+  # synthetic fixtures: 5 pages x 60 cards
+  python immo_extract_bench.py --synthetic 5 --cards 60
+  # saved pages
+  python immo_extract_bench.py fixtures/page_1.html fixtures/page_2.html --repeat 5
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import statistics
+import time
+from dataclasses import asdict
+from typing import List
+
+from playwright.async_api import async_playwright
+
+from immo_fixtures import fake_results_html
+from immo_helper import LISTING_CARD_SEL, Listing, extract_cards, extract_page
+
+
+def comparable(items: List[Listing]) -> List[dict]:
+    return [{k: v for k, v in asdict(it).items() if k != "date_scraped"} for it in items]
+
+
+async def bench(pages_html: List[str], repeat: int) -> None:
+    per_card: List[float] = []
+    per_page: List[float] = []
+    n_cards = 0
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        page = await browser.new_page()
+        for html in pages_html:
+            await page.set_content(html)
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                a = await extract_cards(await page.query_selector_all(LISTING_CARD_SEL))
+                t1 = time.perf_counter()
+                b = await extract_page(page)
+                t2 = time.perf_counter()
+                per_card.append((t1 - t0) * 1000)
+                per_page.append((t2 - t1) * 1000)
+            if comparable(a) != comparable(b):
+                print("WARNING: per-card and single-roundtrip extraction differ on a page")
+            n_cards += len(b)
+        await browser.close()
+
+    print(f"pages: {len(pages_html)}  cards: {n_cards}  repeat: {repeat}")
+    for name, xs in (("per-card (extract_cards)", per_card), ("single roundtrip (extract_page)", per_page)):
+        print(f"{name:<32} median {statistics.median(xs):8.1f} ms/page   max {max(xs):8.1f} ms/page")
+    print(f"speed-up: {statistics.median(per_card) / statistics.median(per_page):.1f}x")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("fixtures", nargs="*", help="Saved result page HTML files")
+    ap.add_argument("--synthetic", type=int, default=0, help="Number of synthetic pages to generate")
+    ap.add_argument("--cards", type=int, default=60, help="Cards per synthetic page")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    pages_html = []
+    for path in args.fixtures:
+        with open(path, encoding="utf-8") as f:
+            pages_html.append(f.read())
+    pages_html += [fake_results_html(args.cards, seed=i) for i in range(args.synthetic)]
+    if not pages_html:
+        ap.error("pass fixture files and/or --synthetic N")
+
+    asyncio.run(bench(pages_html, args.repeat))
@@ -0,0 +1,39 @@
+"""
+Synthetic Immoweb result pages for offline benchmarks (see immo_extract_bench.py, immo_parse_bench.py).
+
+The markup mirrors the selectors in immo_helper.py, so every card yields a full `Listing`.
+"""
+
+import random
+
+STREETS = ["Avenue de la Chasse", "Rue des Champs", "Avenue d'Auderghem", "Rue Louis Hap", "Place Jourdan"]
+AGENCIES = ["Immo Jourdan", "Century 21 Etterbeek", "Latour & Petit", "Trevi Cinquantenaire"]
+FLOORS = ["ground floor", "1st floor", "2nd floor", "3rd floor", "4e étage"]
+
+
+def fake_card_html(rnd: random.Random, listing_id: int) -> str:
+    price = rnd.randrange(150_000, 300_000, 500)
+    beds = rnd.randint(0, 3)
+    baths = rnd.randint(1, 2)
+    area = rnd.randint(35, 130)
+    epc = rnd.choice("ABCDEFG") + rnd.choice(["", "+", "-"])
+    return f"""
+<article data-item="result" class="card--result">
+  <small class="card__information--locality">1040 Etterbeek</small>
+  <h2 data-qa="card-title"><a href="https://www.immoweb.be/en/classified/apartment/for-sale/etterbeek/1040/{listing_id}">
+    Apartment for sale - {rnd.choice(STREETS)}</a></h2>
+  <p data-qa="card-price" class="card--price">€{price:,}</p>
+  <ul data-qa="card-parameters" class="card__information--property">
+    <li>{beds} bedrooms</li><li>{baths} bathroom</li><li>{area} m²</li><li>{rnd.choice(FLOORS)}</li><li>EPC: {epc}</li>
+  </ul>
+  <p data-qa="card-agency" class="card--agency">{rnd.choice(AGENCIES)}</p>
+</article>"""
+
+
+def fake_results_html(n_cards: int, seed: int = 0) -> str:
+    """A results page with `n_cards` cards shaped like Immoweb's markup."""
+    rnd = random.Random(seed)
+    first_id = 10_000_000 + seed * 10_000
+    cards = "".join(fake_card_html(rnd, first_id + i) for i in range(n_cards))
+    return f"<html><body><main><div id='searchResults'>{cards}</div>" \
+           f"<a rel='next' href='?page={seed + 2}'>Next</a></main></body></html>"
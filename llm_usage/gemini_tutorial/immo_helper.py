@@ -22,19 +22,35 @@ Setup
 
 Run
   python immoweb_scraper.py --start-url "<paste the url>" --max-pages 10 --out csv json
+  # parallel crawl: 4 browser contexts, at most 2 page requests/second to immoweb.be
+  python immoweb_scraper.py --start-url "<paste the url>" --max-pages 50 --workers 4 --rate 2
+  # nightly incremental run: only new/changed listings, stops at the first page with nothing new
+  python immoweb_scraper.py --start-url "<paste the url>" --max-pages 50 --index immoweb_seen.sqlite
+  # fast-load mode: skip images/fonts/trackers, print time and bytes per page
+  python immoweb_scraper.py --start-url "<paste the url>" --max-pages 10 --fast
+  # read listings from the search API JSON instead of the cards, and compare both
+  python immoweb_scraper.py --start-url "<paste the url>" --max-pages 3 --engine json --cross-check
+  # stream rows to disk page by page (flat memory), de-dup/sort afterwards
+  python immoweb_scraper.py --start-url "<paste the url>" --max-pages 50 --stream --out parquet csv
 """
 
 from __future__ import annotations
 import asyncio
+import hashlib
 import json
 import math
+import os
 import re
+import sqlite3
+import time
+import unicodedata
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
+from urllib.parse import urlparse
 
 import pandas as pd
-from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
 
 LISTING_CARD_SEL = "[data-item='result'] , article:has(a[href*='/en/classified'])"
 NEXT_BUTTON_SEL = "a[aria-label*='Next'], a[rel='next']"
@@ -42,6 +58,8 @@ PRICE_SEL = "[data-qa='card-price'], [class*='price']"
 TITLE_SEL = "[data-qa='card-title'], h2, h3"
 META_SEL = "[data-qa='card-parameters'], ul, .classified__information--property, [class*='property-parameters']"
 AGENCY_SEL = "[data-qa='card-agency'], [class*='agency']"
+LINK_SEL = "a[href*='/en/classified'] , a[href*='/fr/annonce'] , a[href*='/nl/zoekertje']"
+LOCALITY_SEL = "a[href*='/en/'], a[href*='/fr/'], a[href*='/nl/'], small, span"
 
 @dataclass
 class Listing:
@@ -64,85 +82,116 @@ class Listing:
     def parse_float(text: str) -> Optional[float]:
         if not text:
             return None
+        # Fast path: plain integers such as "2" or "85" (most meta values)
+        if text.isascii() and text.isdigit():
+            return float(text)
         # Keep digits, dot and comma, then normalize comma to dot
-        s = re.sub(r"[^0-9,\.]", "", text)
+        s = NON_NUMERIC_RE.sub("", text)
         s = s.replace(".", "").replace(",", ".") if s.count(",") == 1 and s.count(".") > 1 else s.replace(",", "")
         try:
             return float(s)
-        except:
+        except ValueError:
             return None
 
 
+NON_NUMERIC_RE = re.compile(r"[^0-9,\.]")
+WHITESPACE_RE = re.compile(r"\s+")
+
+# One pattern per meta field, applied to whitespace-normalized, lowercased text
+META_PATTERNS = {
+    "bedrooms": r"(\d+[\.,]?\d*)\s*(bed|bedroom|chambre|slaapkamer)s?",
+    "bathrooms": r"(\d+[\.,]?\d*)\s*(bath|bathroom|salle de bain|badkamer)s?",
+    "habitable_area_sqm": r"(\d+[\.,]?\d*)\s*(m²|sqm|m2)",
+    "floor": r"((ground|rez|rdc|first|1st|2nd|3rd|\d+e?)\s*(floor|étage|verdieping))",
+    "epc": r"epc\s*[:\-]?\s*([a-g][+\-]?)",
+}
+
+# All of META_PATTERNS as one alternation, so a single left-to-right scan finds every field.
+# The first hit per field is the same one `re.search` would find with the separate pattern,
+# as long as no branch consumes text another field's match could start in. Two branches
+# could, so they keep that text in a lookahead:
+# - an area ending in "m2", whose "2" may start a floor ("80 m2 floor"): only the "m" is consumed
+# - the EPC letter, which may start a floor ("epc ground floor", "epc first floor"): only
+#   "epc" is consumed and the class is captured inside the lookahead
+META_RE = re.compile(
+    r"(?P<bedrooms>\d+[\.,]?\d*)\s*(?:bed|bedroom|chambre|slaapkamer)"
+    r"|(?P<bathrooms>\d+[\.,]?\d*)\s*(?:bath|bathroom|salle\s+de\s+bain|badkamer)"
+    r"|(?P<habitable_area_sqm>\d+[\.,]?\d*)\s*(?:m²|sqm|m(?=2))"
+    r"|(?P<floor>(?:ground|rez|rdc|first|1st|2nd|3rd|\d+e?)\s*(?:floor|étage|verdieping))"
+    r"|epc(?=\s*[:\-]?\s*(?P<epc>[a-g][+\-]?))"
+)
+META_FIELDS = list(META_PATTERNS)
+
+
 def parse_meta_block(text: str) -> Dict[str, Any]:
+    if not text:
+        return {}
+    found: Dict[str, str] = {}
+    for m in META_RE.finditer(text.lower()):
+        field = m.lastgroup
+        if field not in found:
+            found[field] = m.group(field)
+            if len(found) == len(META_FIELDS):
+                break
     out: Dict[str, Any] = {}
-    t = re.sub(r"\s+", " ", text or "").strip().lower()
-    # Bedrooms/bathrooms
-    m = re.search(r"(\d+[\.,]?\d*)\s*(bed|bedroom|chambre|slaapkamer)s?", t)
-    if m:
-        out["bedrooms"] = Listing.parse_float(m.group(1))
-    m = re.search(r"(\d+[\.,]?\d*)\s*(bath|bathroom|salle de bain|badkamer)s?", t)
-    if m:
-        out["bathrooms"] = Listing.parse_float(m.group(1))
-    # Area
-    m = re.search(r"(\d+[\.,]?\d*)\s*(m²|sqm|m2)", t)
-    if m:
-        out["habitable_area_sqm"] = Listing.parse_float(m.group(1))
+    # Bedrooms/bathrooms/area
+    for field in ("bedrooms", "bathrooms", "habitable_area_sqm"):
+        if field in found:
+            out[field] = Listing.parse_float(found[field])
     # Floor
-    m = re.search(r"(ground|rez|rdc|first|1st|2nd|3rd|\d+e?)\s*(floor|étage|verdieping)", t)
-    if m:
-        out["floor"] = m.group(0)
+    if "floor" in found:
+        out["floor"] = WHITESPACE_RE.sub(" ", found["floor"])
     # EPC / energy
-    m = re.search(r"epc\s*[:\-]?\s*([a-g][+\-]?)", t)
-    if m:
-        out["epc"] = m.group(1).upper()
+    if "epc" in found:
+        out["epc"] = found["epc"].upper()
     return out
 
-async def extract_card(card) -> Listing:
-    # URL
-    url = None
-    link = await card.query_selector("a[href*='/en/classified'] , a[href*='/fr/annonce'] , a[href*='/nl/zoekertje']")
-    if link:
-        url = await link.get_attribute("href")
-    # Title
-    title = None
-    for sel in TITLE_SEL.split(','):
-        el = await card.query_selector(sel.strip())
-        if el:
-            title = (await el.inner_text()).strip()
-            break
+
+def parse_float_series(s: pd.Series) -> pd.Series:
+    """Vectorized `Listing.parse_float`; unparseable values become NaN."""
+    s = s.str.replace(NON_NUMERIC_RE.pattern, "", regex=True)
+    euro = (s.str.count(",") == 1) & (s.str.count(r"\.") > 1)
+    s = s.str.replace(".", "", regex=False).str.replace(",", ".", regex=False).where(euro, s.str.replace(",", "", regex=False))
+    # float64 like the reference, also when every value happens to be integral
+    return pd.to_numeric(s, errors="coerce").astype("float64")
+
+
+def parse_meta_series(texts: pd.Series) -> pd.DataFrame:
+    """Batch `parse_meta_block` over a Series of meta texts with `Series.str.extract`.
+
+    Returns one column per meta field, aligned with `texts`; missing values are NaN.
+    """
+    # Object dtype keeps the string ops on Python's `re`. The pyarrow-backed string dtype
+    # (default in pandas 3) runs them on RE2, whose \s and \d are ASCII only: "2nd\xa0floor"
+    # would not be normalized and "٣ bedrooms" would not match, unlike `parse_meta_block`.
+    t = texts.astype(object).fillna("").str.replace(WHITESPACE_RE, " ", regex=True).str.strip().str.lower()
+    out = pd.DataFrame(index=texts.index)
+    for field in ("bedrooms", "bathrooms", "habitable_area_sqm"):
+        out[field] = parse_float_series(t.str.extract(META_PATTERNS[field], expand=True)[0])
+    out["floor"] = t.str.extract(META_PATTERNS["floor"], expand=True)[0]
+    out["epc"] = t.str.extract(META_PATTERNS["epc"], expand=True)[0].str.upper()
+    return out
+
+def listing_from_raw(raw: Dict[str, Optional[str]]) -> Listing:
+    """Build a `Listing` from the raw card texts gathered by `extract_card`/`extract_page`.
+
+    `raw` holds: url, title, price_text, agency, meta_text, locality_text (any may be None).
+    """
+    url = raw.get("url")
     # Price
     price_eur = None
-    for sel in PRICE_SEL.split(','):
-        el = await card.query_selector(sel.strip())
-        if el:
-            price_text = (await el.inner_text()).strip()
-            m = re.search(r"([\d\.,\s]+)", price_text)
-            if m:
-                price_eur = Listing.parse_float(m.group(1))
-            break
-    # Agency
-    agency = None
-    for sel in AGENCY_SEL.split(','):
-        el = await card.query_selector(sel.strip())
-        if el:
-            agency = (await el.inner_text()).strip()
-            break
-    # Meta block
-    meta_text = None
-    for sel in META_SEL.split(','):
-        el = await card.query_selector(sel.strip())
-        if el:
-            meta_text = (await el.inner_text()).strip()
-            if meta_text:
-                break
-    meta = parse_meta_block(meta_text or "")
+    price_text = raw.get("price_text")
+    if price_text:
+        m = re.search(r"([\d\.,\s]+)", price_text)
+        if m:
+            price_eur = Listing.parse_float(m.group(1))
+    meta = parse_meta_block(raw.get("meta_text") or "")
 
     # Try to guess locality/zipcode from anchors or small text
     locality = None
     zipcode = None
-    small = await card.query_selector("a[href*='/en/'], a[href*='/fr/'], a[href*='/nl/'], small, span")
-    if small:
-        s = (await small.inner_text()).strip()
+    s = raw.get("locality_text")
+    if s:
         m = re.search(r"(\d{4})\s+([\w\-\'\s]+)", s)
         if m:
             zipcode = m.group(1)
@@ -157,7 +206,7 @@ async def extract_card(card) -> Listing:
 
     return Listing(
         listing_id=listing_id,
-        title=title,
+        title=raw.get("title"),
         price_eur=price_eur,
         locality=locality,
         zipcode=zipcode,
@@ -168,41 +217,417 @@ async def extract_card(card) -> Listing:
         epc=meta.get("epc"),
         property_type="apartment",
         url=url,
-        agency=agency,
+        agency=raw.get("agency"),
         date_scraped=datetime.now(timezone.utc).isoformat(),
     )
 
-async def scrape(start_url: str, max_pages: int = 50, throttle_ms: int = 1500) -> List[Listing]:
+
+async def extract_card(card) -> Listing:
+    raw: Dict[str, Optional[str]] = {}
+    # URL
+    raw["url"] = None
+    link = await card.query_selector(LINK_SEL)
+    if link:
+        raw["url"] = await link.get_attribute("href")
+    # Title
+    raw["title"] = None
+    for sel in TITLE_SEL.split(','):
+        el = await card.query_selector(sel.strip())
+        if el:
+            raw["title"] = (await el.inner_text()).strip()
+            break
+    # Price
+    raw["price_text"] = None
+    for sel in PRICE_SEL.split(','):
+        el = await card.query_selector(sel.strip())
+        if el:
+            raw["price_text"] = (await el.inner_text()).strip()
+            break
+    # Agency
+    raw["agency"] = None
+    for sel in AGENCY_SEL.split(','):
+        el = await card.query_selector(sel.strip())
+        if el:
+            raw["agency"] = (await el.inner_text()).strip()
+            break
+    # Meta block
+    raw["meta_text"] = None
+    for sel in META_SEL.split(','):
+        el = await card.query_selector(sel.strip())
+        if el:
+            raw["meta_text"] = (await el.inner_text()).strip()
+            if raw["meta_text"]:
+                break
+    # Locality/zipcode text
+    raw["locality_text"] = None
+    small = await card.query_selector(LOCALITY_SEL)
+    if small:
+        raw["locality_text"] = (await small.inner_text()).strip()
+
+    return listing_from_raw(raw)
+
+
+# Runs inside the browser: same selector fallbacks as `extract_card`, for every card at once.
+EXTRACT_CARDS_JS = """
+(cards, sel) => {
+    const firstText = (card, list, skipEmpty) => {
+        let text = null;
+        for (const s of list) {
+            const el = card.querySelector(s);
+            if (el) {
+                text = el.innerText.trim();
+                if (!skipEmpty || text) break;
+            }
+        }
+        return text;
+    };
+    return cards.map(card => {
+        const link = card.querySelector(sel.link);
+        const small = card.querySelector(sel.locality);
+        return {
+            url: link ? link.getAttribute("href") : null,
+            title: firstText(card, sel.title, false),
+            price_text: firstText(card, sel.price, false),
+            agency: firstText(card, sel.agency, false),
+            meta_text: firstText(card, sel.meta, true),
+            locality_text: small ? small.innerText.trim() : null,
+        };
+    });
+}
+"""
+
+
+async def extract_page(page) -> List[Listing]:
+    """Extract every listing card on `page` in a single browser roundtrip.
+
+    Faster alternative to `extract_cards(await load_cards(page))`: the card
+    texts come back as plain dicts from one `$$eval` call and are turned into
+    `Listing` objects by `listing_from_raw`.
+    """
+    split = lambda sel: [s.strip() for s in sel.split(',')]
+    raws = await page.eval_on_selector_all(LISTING_CARD_SEL, EXTRACT_CARDS_JS, {
+        "link": LINK_SEL,
+        "locality": LOCALITY_SEL,
+        "title": split(TITLE_SEL),
+        "price": split(PRICE_SEL),
+        "agency": split(AGENCY_SEL),
+        "meta": split(META_SEL),
+    })
+    items: List[Listing] = []
+    for raw in raws:
+        try:
+            items.append(listing_from_raw(raw))
+        except Exception:
+            continue
+    return items
+
+# Search API (JSON) engine: the result pages are rendered from this XHR
+SEARCH_API_MARKER = "/search-results/"
+
+
+def dig(data: Any, *path: Any) -> Any:
+    """Follow dict keys / list indexes in `path`, returning None as soon as one is missing."""
+    for key in path:
+        try:
+            data = data[key]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return data
+
+
+def url_slug(text: str) -> str:
+    """Path segment as immoweb writes it: "La Hulpe" -> "la-hulpe", "Liège" -> "liege"."""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[\s_/]+", "-", text.strip().lower()).strip("-")
+
+
+def listing_from_api(result: Dict[str, Any]) -> Listing:
+    """Map one entry of the search API `results` array to a `Listing`."""
+    listing_id = str(result["id"])
+    prop = result.get("property") or {}
+    loc = prop.get("location") or {}
+    # type is the category (APARTMENT, HOUSE), subtype the kind (PENTHOUSE, FLAT_STUDIO, ...)
+    property_type = (prop.get("type") or "apartment").lower()
+    subtype = (prop.get("subtype") or property_type).lower()
+    locality = loc.get("locality")
+    zipcode = loc.get("postalCode")
+    url = None
+    if locality and zipcode:
+        url = (f"https://www.immoweb.be/en/classified/{url_slug(subtype)}/for-sale/"
+               f"{url_slug(locality)}/{zipcode}/{listing_id}")
+    price = dig(result, "price", "mainValue")
+    if price is None:
+        price = dig(result, "transaction", "sale", "price")
+    floor = loc.get("floor")
+    epc = dig(result, "transaction", "certificates", "epcScore")
+    to_float = lambda v: float(v) if v is not None else None
+    return Listing(
+        listing_id=listing_id,
+        title=prop.get("title") or f"{subtype.replace('_', ' ').capitalize()} for sale",
+        price_eur=to_float(price),
+        locality=locality,
+        zipcode=str(zipcode) if zipcode is not None else None,
+        bedrooms=to_float(prop.get("bedroomCount")),
+        bathrooms=to_float(prop.get("bathroomCount")),
+        habitable_area_sqm=to_float(prop.get("netHabitableSurface")),
+        floor=str(floor) if floor is not None else None,
+        epc=epc.upper() if epc else None,
+        property_type=property_type,
+        url=url,
+        agency=dig(result, "customers", 0, "name"),
+        date_scraped=datetime.now(timezone.utc).isoformat(),
+    )
+
+
+def listings_from_search_json(data: Any) -> Optional[List[Listing]]:
+    """Listings from a search API response, or None when the JSON shape is not the one we know."""
+    results = dig(data, "results")
+    if not isinstance(results, list):
+        return None
+    try:
+        return [listing_from_api(r) for r in results]
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+
+
+class SearchJsonCapture:
+    """Remembers the last search API response seen by `page`."""
+
+    def __init__(self, page):
+        self.response = None
+        page.on("response", self._on_response)
+
+    def _on_response(self, response) -> None:
+        if SEARCH_API_MARKER in response.url and response.ok:
+            self.response = response
+
+    def reset(self) -> None:
+        self.response = None
+
+    async def json(self) -> Any:
+        if self.response is None:
+            return None
+        try:
+            return await self.response.json()
+        except Exception:
+            return None
+
+
+# Fields that the DOM and JSON engines both fill in the same format
+CROSS_CHECK_FIELDS = ("price_eur", "zipcode", "bedrooms", "habitable_area_sqm", "epc")
+
+
+def cross_check_listings(api_items: List[Listing], dom_items: List[Listing]) -> List[str]:
+    """Differences between the JSON and DOM results of one page, one line per mismatch."""
+    dom_by_id = {it.listing_id: it for it in dom_items if it.listing_id}
+    diffs = []
+    for it in api_items:
+        other = dom_by_id.pop(it.listing_id, None)
+        if other is None:
+            diffs.append(f"{it.listing_id}: only in JSON")
+            continue
+        for field in CROSS_CHECK_FIELDS:
+            a, b = getattr(it, field), getattr(other, field)
+            if a is not None and b is not None and a != b:
+                diffs.append(f"{it.listing_id}: {field} JSON={a!r} DOM={b!r}")
+    diffs.extend(f"{lid}: only in DOM" for lid in dom_by_id)
+    return diffs
+
+
+async def extract_listings(page, capture: Optional[SearchJsonCapture] = None,
+                           cross_check: bool = False) -> List[Listing]:
+    """Listings of the loaded page: from the captured search JSON when there is a
+    `capture` and its shape is known, otherwise from the DOM (`extract_page`)."""
+    if capture is None:
+        return await extract_page(page)
+    items = listings_from_search_json(await capture.json())
+    if items is None:
+        print(f"No usable search JSON for {page.url}, falling back to DOM extraction")
+        return await extract_page(page)
+    if cross_check:
+        diffs = cross_check_listings(items, await extract_page(page))
+        print(f"cross-check {page.url}: {len(diffs)} difference(s)")
+        for line in diffs:
+            print(f"  {line}")
+    return items
+
+
+async def accept_cookies(page) -> None:
+    try:
+        btn = await page.query_selector("button:has-text('Accept'), button:has-text('Accepter'), button:has-text('Accepteren')")
+        if btn:
+            await btn.click()
+            await page.wait_for_timeout(500)
+    except:
+        pass
+
+
+async def load_cards(page) -> list:
+    cards = await page.query_selector_all(LISTING_CARD_SEL)
+    if not cards:
+        # Try to wait for network idle then retry once
+        await page.wait_for_load_state("networkidle")
+        cards = await page.query_selector_all(LISTING_CARD_SEL)
+    return cards
+
+
+# Fast-load mode: requests we never need for parsing the result cards
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+BLOCKED_HOSTS = (
+    "doubleclick.net", "googlesyndication.com", "googleadservices.com", "google-analytics.com",
+    "googletagmanager.com", "facebook.net", "facebook.com", "hotjar.com", "criteo.com", "criteo.net",
+    "adnxs.com", "taboola.com", "outbrain.com", "scorecardresearch.com", "bing.com", "tiktok.com",
+)
+
+
+def is_blocked(request) -> bool:
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+    host = urlparse(request.url).hostname or ""
+    return any(host == h or host.endswith("." + h) for h in BLOCKED_HOSTS)
+
+
+class PageMeter:
+    """Per-page load time, bytes transferred and request counts for fast-load mode.
+
+    Bytes are the encoded (over the wire) sizes reported by Chromium's
+    Network.loadingFinished events, so blocked requests count as zero.
+    """
+
+    def __init__(self):
+        self.bytes = 0
+        self.requests = 0
+        self.blocked = 0
+        self.t0 = time.perf_counter()
+
+    def start(self) -> None:
+        self.bytes = self.requests = self.blocked = 0
+        self.t0 = time.perf_counter()
+
+    def _on_loading_finished(self, params: Dict[str, Any]) -> None:
+        self.bytes += int(params.get("encodedDataLength", 0))
+        self.requests += 1
+
+    def summary(self, label: str) -> str:
+        return (f"{label}: {time.perf_counter() - self.t0:.2f}s, {self.bytes / 1024:.0f} KiB, "
+                f"{self.requests} requests, {self.blocked} blocked")
+
+
+async def enable_fast_load(ctx, page) -> PageMeter:
+    """Block images/fonts/media and ad/tracker hosts on `ctx`, and meter traffic of `page`."""
+    meter = PageMeter()
+
+    async def handle(route) -> None:
+        if is_blocked(route.request):
+            meter.blocked += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await ctx.route("**/*", handle)
+    cdp = await ctx.new_cdp_session(page)
+    await cdp.send("Network.enable")
+    cdp.on("Network.loadingFinished", meter._on_loading_finished)
+    return meter
+
+
+async def wait_for_cards(page, timeout_ms: int = 15000) -> list:
+    """Wait until the first listing card is rendered instead of sleeping a fixed delay."""
+    try:
+        await page.wait_for_selector(LISTING_CARD_SEL, timeout=timeout_ms)
+    except PlaywrightTimeoutError:
+        return []
+    return await page.query_selector_all(LISTING_CARD_SEL)
+
+
+async def extract_cards(cards) -> List[Listing]:
+    items: List[Listing] = []
+    for card in cards:
+        try:
+            items.append(await extract_card(card))
+        except Exception:
+            continue
+    return items
+
+
+async def save_page_html(page, record_dir: str, page_no: int) -> None:
+    """Save the rendered page as `<record_dir>/page_NNN.html` for offline replay (see immo_replay.py)."""
+    os.makedirs(record_dir, exist_ok=True)
+    with open(os.path.join(record_dir, f"page_{page_no:03d}.html"), "w", encoding="utf-8") as f:
+        f.write(await page.content())
+
+
+def page_url(url: str, n: int) -> str:
+    """Return `url` pointing at results page `n` (sets or adds the `page=` query param)."""
+    if re.search(r"[?&]page=(\d+)", url):
+        return re.sub(r"([?&]page=)\d+", f"\\g<1>{n}", url)
+    sep = '&' if '?' in url else '?'
+    return f"{url}{sep}page={n}"
+
+
+async def scrape(start_url: str, max_pages: int = 50, throttle_ms: int = 1500,
+                 record_dir: Optional[str] = None, index: Optional["SeenIndex"] = None,
+                 on_page: Optional[Callable[[List[Listing]], None]] = None,
+                 fast: bool = False, engine: str = "dom", cross_check: bool = False) -> List[Listing]:
+    """Crawl result pages one after the other, following the Next link.
+
+    `engine="json"` reads listings from the search API response the page loads
+    instead of the rendered cards, falling back to the DOM for any page whose
+    JSON is missing or has an unknown shape; `cross_check` then also extracts
+    from the DOM and prints the differences.
+
+    With `fast`, images/fonts/media and ad/tracker requests are blocked, each page
+    only waits for the first listing card, `throttle_ms` becomes the minimum gap
+    between page requests instead of a sleep after each load, and time/bytes per
+    page are printed.
+
+    With `index`, only new or changed listings are returned and the crawl stops at
+    the first page whose listings are all already in the index, unchanged. The
+    caller records the returned listings with `index.record()` once they are saved.
+    With `on_page`, each page's listings are handed to it as soon as the page is
+    scraped (e.g. a sink from immo_sinks.py) instead of being collected; the
+    returned list is then empty.
+    """
     results: List[Listing] = []
+    emit = on_page or results.extend
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=True)
         ctx = await browser.new_context()
         page = await ctx.new_page()
+        if fast:
+            meter = await enable_fast_load(ctx, page)
+            limiter = HostRateLimiter(1000 / throttle_ms if throttle_ms > 0 else 0)
+        capture = SearchJsonCapture(page) if engine == "json" else None
         url = start_url
         for page_idx in range(max_pages):
-            await page.goto(url, wait_until="load")
-            await page.wait_for_timeout(throttle_ms)
-
-            # accept cookies if present
-            try:
-                btn = await page.query_selector("button:has-text('Accept'), button:has-text('Accepter'), button:has-text('Accepteren')")
-                if btn:
-                    await btn.click()
-                    await page.wait_for_timeout(500)
-            except:
-                pass
-
-            cards = await page.query_selector_all(LISTING_CARD_SEL)
-            if not cards:
-                # Try to wait for network idle then retry once
-                await page.wait_for_load_state("networkidle")
-                cards = await page.query_selector_all(LISTING_CARD_SEL)
-
-            for card in cards:
-                try:
-                    results.append(await extract_card(card))
-                except Exception:
-                    continue
+            if capture:
+                capture.reset()
+            if fast:
+                await limiter.wait(url)
+                meter.start()
+                await page.goto(url, wait_until="domcontentloaded")
+                await accept_cookies(page)
+                cards = await wait_for_cards(page)
+            else:
+                await page.goto(url, wait_until="load")
+                await page.wait_for_timeout(throttle_ms)
+
+                # accept cookies if present
+                await accept_cookies(page)
+
+                cards = await load_cards(page)
+            if record_dir:
+                await save_page_html(page, record_dir, page_idx + 1)
+            items = await extract_listings(page, capture, cross_check)
+            if fast:
+                print(meter.summary(f"page {page_idx + 1}"))
+            if index is not None:
+                fresh = index.fresh(items)
+                emit(fresh)
+                if items and not fresh:
+                    break
+            else:
+                emit(items)
 
             # Find next page link
             next_href = None
@@ -212,12 +637,7 @@ async def scrape(start_url: str, max_pages: int = 50, throttle_ms: int = 1500) -
             if not next_href:
                 # Build next url by incrementing &page=
                 m = re.search(r"[?&]page=(\d+)", url)
-                if m:
-                    n = int(m.group(1)) + 1
-                    url = re.sub(r"([?&]page=)\d+", f"\\g<1>{n}", url)
-                else:
-                    sep = '&' if '?' in url else '?'
-                    url = f"{url}{sep}page=2"
+                url = page_url(url, int(m.group(1)) + 1 if m else 2)
             else:
                 if next_href.startswith("http"):
                     url = next_href
@@ -233,6 +653,234 @@ async def scrape(start_url: str, max_pages: int = 50, throttle_ms: int = 1500) -
     return results
 
 
+class SeenIndex:
+    """On-disk index of listings seen in earlier runs, for incremental scraping.
+
+    A SQLite table keyed by listing_id (or url when there is no id) holding a
+    hash of the listing content, so unchanged listings can be skipped and the
+    crawl can stop at the first page that has nothing new.
+    """
+
+    def __init__(self, path: str = "immoweb_seen.sqlite"):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            " key TEXT PRIMARY KEY, content_hash TEXT NOT NULL, first_seen TEXT NOT NULL, last_seen TEXT NOT NULL)"
+        )
+
+    @staticmethod
+    def key(item: Listing) -> Optional[str]:
+        return item.listing_id or item.url
+
+    @staticmethod
+    def content_hash(item: Listing) -> str:
+        data = asdict(item)
+        data.pop("date_scraped")
+        return hashlib.sha1(json.dumps(data, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    def fresh(self, items: List[Listing]) -> List[Listing]:
+        """Listings from `items` that are new or whose content changed since they were recorded."""
+        keys = [k for k in {self.key(it) for it in items} if k]
+        known: Dict[str, str] = {}
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT key, content_hash FROM seen WHERE key IN ({','.join('?' * len(chunk))})", chunk
+            )
+            known.update(rows)
+        return [it for it in items if known.get(self.key(it)) != self.content_hash(it)]
+
+    def record(self, items: List[Listing]) -> None:
+        now = datetime.now(timezone.utc).isoformat()
+        self.conn.executemany(
+            "INSERT INTO seen (key, content_hash, first_seen, last_seen) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT(key) DO UPDATE SET content_hash = excluded.content_hash, last_seen = excluded.last_seen",
+            [(self.key(it), self.content_hash(it), now, now) for it in items if self.key(it)],
+        )
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class HostRateLimiter:
+    """Async rate limiter that spaces out requests to the same host.
+
+    Every worker calls `wait(url)` before navigating; requests to one host are
+    released at most `rate` per second no matter how many workers are running.
+    """
+
+    def __init__(self, rate: float = 1.0):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot: Dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+    async def wait(self, url: str) -> None:
+        host = urlparse(url).netloc
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def dedupe_listings(items: List[Listing]) -> List[Listing]:
+    """Drop repeated listings by (listing_id, url), keeping the first one, like `to_dataframe()`."""
+    seen = set()
+    out: List[Listing] = []
+    for it in items:
+        key = (it.listing_id, it.url)
+        if key in seen:
+            continue
+        seen.add(key)
+        out.append(it)
+    return out
+
+
+def check_status(response) -> None:
+    """Raise on an error status (e.g. 429/5xx), so the page is retried instead of read as empty."""
+    if response is not None and response.status >= 400:
+        raise RuntimeError(f"HTTP {response.status} for {response.url}")
+
+
+async def scrape_parallel(start_url: str, max_pages: int = 50, workers: int = 4,
+                          rate: float = 1.0, record_dir: Optional[str] = None,
+                          index: Optional[SeenIndex] = None,
+                          on_page: Optional[Callable[[List[Listing]], None]] = None,
+                          fast: bool = False, engine: str = "dom", cross_check: bool = False,
+                          retries: int = 2, backoff: float = 2.0) -> List[Listing]:
+    """Crawl result pages 1..max_pages with a pool of `workers` browser contexts.
+
+    All contexts share one Chromium instance. Page requests go through a
+    `HostRateLimiter` instead of a fixed sleep, so throughput grows with the
+    number of workers up to `rate` pages/second per host. Listings come back
+    in page order and de-duplicated; pages after the first empty one are dropped.
+    A page that fails to load is retried `retries` times with exponential backoff
+    (`backoff`, 2 * backoff, ... seconds); if it still fails, or its extraction
+    raises, it is reported and skipped, and the crawl goes on.
+    With `record_dir`, every rendered page is also saved for offline replay.
+    With `index`, works incrementally like `scrape()`: pages from the first one
+    that has nothing new or changed onwards are dropped.
+    With `on_page`, pages are handed to it in page order as soon as every page
+    before them is done, and nothing is returned; de-duplication is then left
+    to the output post-pass (`immo_sinks.finalize`).
+    `fast`, `engine` and `cross_check` work as in `scrape()`.
+    """
+    m = re.search(r"[?&]page=(\d+)", start_url)
+    first = int(m.group(1)) if m else 1
+    queue: asyncio.Queue = asyncio.Queue()
+    for idx in range(max_pages):
+        queue.put_nowait(idx)
+    pages: Dict[int, List[Listing]] = {}
+    limiter = HostRateLimiter(rate)
+    stop_at = max_pages
+    next_page = 0
+    failed: List[int] = []
+
+    def flush() -> None:
+        # Hand finished pages to on_page in page order
+        nonlocal next_page
+        while next_page < stop_at and next_page in pages:
+            on_page(pages.pop(next_page))
+            next_page += 1
+
+    async def worker(browser) -> None:
+        nonlocal stop_at
+        ctx = await browser.new_context()
+        page = await ctx.new_page()
+        meter = await enable_fast_load(ctx, page) if fast else None
+        capture = SearchJsonCapture(page) if engine == "json" else None
+        try:
+            while True:
+                try:
+                    idx = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                if idx >= stop_at:
+                    continue
+                url = page_url(start_url, first + idx)
+                await limiter.wait(url)
+                if capture:
+                    capture.reset()
+                cards = None
+                for attempt in range(retries + 1):
+                    try:
+                        if meter:
+                            meter.start()
+                            response = await page.goto(url, wait_until="domcontentloaded")
+                            check_status(response)
+                            await accept_cookies(page)
+                            cards = await wait_for_cards(page)
+                        else:
+                            response = await page.goto(url, wait_until="load")
+                            check_status(response)
+                            await accept_cookies(page)
+                            cards = await load_cards(page)
+                        break
+                    except Exception as e:
+                        if attempt == retries:
+                            print(f"page {first + idx}: giving up after {retries + 1} attempts ({e})")
+                            break
+                        delay = backoff * 2 ** attempt
+                        print(f"page {first + idx}: load failed ({e}), retry {attempt + 1} in {delay:.1f}s")
+                        await asyncio.sleep(delay)
+                        await limiter.wait(url)
+                        if capture:
+                            capture.reset()
+                if cards is None:
+                    # A page that failed to load is skipped, not taken as the end of the results
+                    failed.append(first + idx)
+                    pages[idx] = []
+                    if on_page:
+                        flush()
+                    continue
+                if not cards:
+                    # Past the last results page: no need to fetch anything after it
+                    stop_at = min(stop_at, idx)
+                    continue
+                try:
+                    if record_dir:
+                        await save_page_html(page, record_dir, idx + 1)
+                    items = await extract_listings(page, capture, cross_check)
+                except Exception as e:
+                    print(f"page {first + idx}: extraction failed ({e}), skipping it")
+                    failed.append(first + idx)
+                    pages[idx] = []
+                    if on_page:
+                        flush()
+                    continue
+                if meter:
+                    print(meter.summary(f"page {first + idx}"))
+                if index is not None:
+                    fresh = index.fresh(items)
+                    if items and not fresh:
+                        stop_at = min(stop_at, idx)
+                        continue
+                    items = fresh
+                pages[idx] = items
+                if on_page:
+                    flush()
+        finally:
+            await ctx.close()
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        await asyncio.gather(*(worker(browser) for _ in range(max(1, min(workers, max_pages)))))
+        await browser.close()
+    if failed:
+        print(f"Skipped {len(failed)} page(s) that could not be loaded or parsed: {sorted(failed)}")
+
+    results: List[Listing] = []
+    if on_page:
+        return results
+    for idx in sorted(pages):
+        if idx < stop_at:
+            results.extend(pages[idx])
+    return dedupe_listings(results)
+
+
 def to_dataframe(items: List[Listing]) -> pd.DataFrame:
     df = pd.DataFrame([asdict(it) for it in items])
     # de-dup by listing_id/url
@@ -246,19 +894,74 @@ if __name__ == "__main__":
     ap = argparse.ArgumentParser()
     ap.add_argument("--start-url", required=True)
     ap.add_argument("--max-pages", type=int, default=10)
-    ap.add_argument("--out", nargs="+", choices=["csv", "json"], default=["csv"]) 
+    ap.add_argument("--out", nargs="+", choices=["csv", "json", "parquet"], default=["csv"]) 
+    ap.add_argument("--workers", type=int, default=1, help="Parallel browser contexts (1 = sequential crawl)")
+    ap.add_argument("--rate", type=float, default=1.0, help="Max page requests per second per host when --workers > 1")
+    ap.add_argument("--record-dir", help="Also save every rendered results page here (replay with immo_replay.py)")
+    ap.add_argument("--index", help="Incremental mode: SQLite seen-listing index (e.g. immoweb_seen.sqlite); "
+                                    "only new/changed listings are written, to *_changes.csv/json")
+    ap.add_argument("--stream", action="store_true",
+                    help="Write rows as each page finishes (json -> .jsonl), then de-dup/sort the files")
+    ap.add_argument("--no-sort", action="store_true",
+                    help="With --stream, only de-dup the files (bounded memory) and keep scrape order")
+    ap.add_argument("--fast", action="store_true",
+                    help="Block images/fonts/ads, wait only for listing cards, print time/bytes per page")
+    ap.add_argument("--engine", choices=["dom", "json"], default="dom",
+                    help="json: read listings from the search API response (DOM as fallback)")
+    ap.add_argument("--cross-check", action="store_true", help="With --engine json, compare against the DOM")
     args = ap.parse_args()
 
-    items = asyncio.run(scrape(args.start_url, args.max_pages))
+    index = SeenIndex(args.index) if args.index else None
+    base = "immoweb_etterbeek_300k_changes" if index else "immoweb_etterbeek_300k"
+
+    if args.stream:
+        from immo_sinks import finalize, open_sink
+        ext = {"csv": ".csv", "json": ".jsonl", "parquet": ".parquet"}
+        sinks = [open_sink(base + ext[fmt]) for fmt in args.out]
+
+        def write_page(page_items: List[Listing]) -> None:
+            for sink in sinks:
+                sink.write(page_items)
+            if index:
+                index.record(page_items)
+
+        if args.workers > 1:
+            asyncio.run(scrape_parallel(args.start_url, args.max_pages, args.workers, args.rate,
+                                        record_dir=args.record_dir, index=index, on_page=write_page,
+                                        fast=args.fast, engine=args.engine, cross_check=args.cross_check))
+        else:
+            asyncio.run(scrape(args.start_url, args.max_pages, record_dir=args.record_dir, index=index,
+                               on_page=write_page, fast=args.fast, engine=args.engine,
+                               cross_check=args.cross_check))
+        for sink in sinks:
+            sink.close()
+            rows = finalize(sink.path, sort=not args.no_sort)
+            print(f"Saved {sink.path} ({rows} rows)")
+        if index:
+            index.close()
+        raise SystemExit(0)
+
+    if args.workers > 1:
+        items = asyncio.run(scrape_parallel(args.start_url, args.max_pages, args.workers, args.rate,
+                                            record_dir=args.record_dir, index=index, fast=args.fast,
+                                            engine=args.engine, cross_check=args.cross_check))
+    else:
+        items = asyncio.run(scrape(args.start_url, args.max_pages, record_dir=args.record_dir, index=index,
+                                   fast=args.fast, engine=args.engine, cross_check=args.cross_check))
     df = to_dataframe(items)
 
     if "csv" in args.out:
-        df.to_csv("immoweb_etterbeek_300k.csv", index=False)
-        print("Saved CSV -> immoweb_etterbeek_300k.csv")
+        df.to_csv(f"{base}.csv", index=False)
+        print(f"Saved CSV -> {base}.csv")
     if "json" in args.out:
-        with open("immoweb_etterbeek_300k.json", "w", encoding="utf-8") as f:
+        with open(f"{base}.json", "w", encoding="utf-8") as f:
             json.dump(df.to_dict(orient="records"), f, ensure_ascii=False, indent=2)
-        print("Saved JSON -> immoweb_etterbeek_300k.json")
+        print(f"Saved JSON -> {base}.json")
+    if "parquet" in args.out:
+        df.to_parquet(f"{base}.parquet", index=False)
+        print(f"Saved Parquet -> {base}.parquet")
 
+    if index:
+        index.record(items)
+        index.close()
     print(f"Rows: {len(df)}")
-
@@ -0,0 +1,107 @@
+"""
+Check and benchmark the meta-block parsers in immo_helper.py.
+
+Compares, on randomly generated card texts:
+- reference: the original five-`re.search` version of `parse_meta_block`
+- single pass: `parse_meta_block` (one combined pattern, one scan)
+- batch: `parse_meta_series` (pandas `Series.str.extract`)
+
+Every generated text must give identical results on all three before timings are printed.
+
+Run
+  python immo_meta_bench.py --cards 200000
+"""
+
+from __future__ import annotations
+import argparse
+import math
+import random
+import re
+import time
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from immo_helper import Listing, parse_meta_block, parse_meta_series
+
+TOKENS = [
+    "2 bedrooms", "1 bedroom", "3 chambres", "2 slaapkamers", "1,5 bed", "1 bathroom", "2 salle  de\nbain",
+    "1 badkamer", "85 m²", "120 sqm", "64 m2", "1.250 m²", "80 m2 floor", "ground floor", "rez étage", "1st floor",
+    "2nd  floor", "3e étage", "4 verdieping", "EPC: C", "epc - b+", "EPC D-", "Garden", "Terrace", "Cellar",
+    "Lift", "Built 1930", "2.000.000", "12nd floor", "3,2e floor", "٣ bedrooms", "First Floor", "Parking",
+    # A bare EPC label followed by a floor: the EPC letter and the floor start at the same "g"/"f"
+    "EPC", "epc:", "EPC ground floor", "epc first floor",
+    # Non-breaking spaces, as Immoweb puts between numbers and units
+    "2 salle\xa0de bain", "2nd\xa0floor", "85\xa0m²", "3\xa0bedrooms", "EPC\xa0B",
+    "\n", "  ", "|", "·",
+]
+
+
+def reference_parse_meta_block(text: str) -> Dict[str, Any]:
+    """`parse_meta_block` as it was before the single-pass rewrite."""
+    out: Dict[str, Any] = {}
+    t = re.sub(r"\s+", " ", text or "").strip().lower()
+    m = re.search(r"(\d+[\.,]?\d*)\s*(bed|bedroom|chambre|slaapkamer)s?", t)
+    if m:
+        out["bedrooms"] = Listing.parse_float(m.group(1))
+    m = re.search(r"(\d+[\.,]?\d*)\s*(bath|bathroom|salle de bain|badkamer)s?", t)
+    if m:
+        out["bathrooms"] = Listing.parse_float(m.group(1))
+    m = re.search(r"(\d+[\.,]?\d*)\s*(m²|sqm|m2)", t)
+    if m:
+        out["habitable_area_sqm"] = Listing.parse_float(m.group(1))
+    m = re.search(r"(ground|rez|rdc|first|1st|2nd|3rd|\d+e?)\s*(floor|étage|verdieping)", t)
+    if m:
+        out["floor"] = m.group(0)
+    m = re.search(r"epc\s*[:\-]?\s*([a-g][+\-]?)", t)
+    if m:
+        out["epc"] = m.group(1).upper()
+    return out
+
+
+def fake_meta_texts(n: int, seed: int = 0) -> List[str]:
+    rnd = random.Random(seed)
+    return [" ".join(rnd.choices(TOKENS, k=rnd.randint(0, 8))) for _ in range(n)]
+
+
+def same(a: Any, b: Any) -> bool:
+    if a is None or (isinstance(a, float) and math.isnan(a)):
+        return b is None or (isinstance(b, float) and math.isnan(b))
+    return a == b
+
+
+def check(texts: List[str]) -> None:
+    frame = parse_meta_series(pd.Series(texts))
+    for field in ("bedrooms", "bathrooms", "habitable_area_sqm"):
+        if frame[field].dtype != "float64":
+            raise SystemExit(f"batch {field} has dtype {frame[field].dtype}, expected float64")
+    batch = frame.astype(object).to_dict(orient="records")
+    for text, row in zip(texts, batch):
+        expected = reference_parse_meta_block(text)
+        if parse_meta_block(text) != expected:
+            raise SystemExit(f"single-pass mismatch for {text!r}: {parse_meta_block(text)} != {expected}")
+        for field, value in row.items():
+            if not same(value, expected.get(field)):
+                raise SystemExit(f"batch mismatch on {field} for {text!r}: {value!r} != {expected.get(field)!r}")
+    print(f"checked {len(texts)} texts: all three parsers agree")
+
+
+def timed(label: str, n: int, fn) -> None:
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    print(f"{label:<28} {elapsed:7.2f} s  {n / elapsed:>12,.0f} cards/s")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--cards", type=int, default=100_000)
+    ap.add_argument("--check", type=int, default=20_000, help="Texts to cross-check before timing")
+    args = ap.parse_args()
+
+    check(fake_meta_texts(args.check, seed=1))
+    texts = fake_meta_texts(args.cards)
+    series = pd.Series(texts)
+    timed("reference (5x re.search)", len(texts), lambda: [reference_parse_meta_block(t) for t in texts])
+    timed("single pass", len(texts), lambda: [parse_meta_block(t) for t in texts])
+    timed("batch (str.extract)", len(texts), lambda: parse_meta_series(series))
@@ -0,0 +1,68 @@
+"""
+Benchmark the browser-free parsing hot path: HTML -> raw card texts -> parse_meta_block/Listing.
+
+Reports listings/second and peak Python heap (tracemalloc) for growing numbers of cards.
+Pages come from a directory recorded with `immo_helper.py --record-dir` or are synthetic.
+
+Run
+  python immo_parse_bench.py                               # synthetic, 1k/10k/100k cards
+  python immo_parse_bench.py --fixtures fixtures --sizes 1000 20000
+"""
+
+from __future__ import annotations
+import argparse
+import itertools
+import time
+import tracemalloc
+from typing import Iterator, List
+
+from immo_fixtures import fake_results_html
+from immo_helper import Listing
+from immo_replay import fixture_paths, iter_pages, parse_html
+
+
+def pages_for(pool: List[str], n_cards: int) -> Iterator[str]:
+    """Cycle through the page pool until about `n_cards` cards have been handed out."""
+    per_page = max(1, len(parse_html(pool[0])))
+    n_pages = -(-n_cards // per_page)
+    return itertools.islice(itertools.cycle(pool), n_pages)
+
+
+def run(pool: List[str], n_cards: int) -> List[Listing]:
+    results: List[Listing] = []
+    for html in pages_for(pool, n_cards):
+        results.extend(parse_html(html))
+    return results
+
+
+def bench(pool: List[str], sizes: List[int]) -> None:
+    print(f"{'cards':>8} {'seconds':>9} {'listings/s':>12} {'peak MiB':>9}")
+    for n in sizes:
+        t0 = time.perf_counter()
+        items = run(pool, n)
+        elapsed = time.perf_counter() - t0
+        del items
+
+        # Separate pass: tracemalloc slows allocation-heavy code down, so it must not skew the timing
+        tracemalloc.start()
+        items = run(pool, n)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{len(items):>8} {elapsed:>9.2f} {len(items) / elapsed:>12,.0f} {peak / 2**20:>9.1f}")
+        del items
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--fixtures", help="Directory with recorded page_NNN.html files (default: synthetic pages)")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    ap.add_argument("--cards", type=int, default=60, help="Cards per synthetic page")
+    args = ap.parse_args()
+
+    if args.fixtures:
+        pool = list(iter_pages(fixture_paths(args.fixtures)))
+        if not pool:
+            ap.error(f"no page_*.html files in {args.fixtures}")
+    else:
+        pool = [fake_results_html(args.cards, seed=i) for i in range(20)]
+    bench(pool, args.sizes)
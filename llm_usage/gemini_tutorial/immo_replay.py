@@ -0,0 +1,150 @@
+"""
+Offline replay of Immoweb result pages: parse saved HTML without a browser or network.
+
+What it does
+- Reads result pages recorded by `immo_helper.py --record-dir <dir>` (one `page_NNN.html` per page)
+- Parses them with lxml using the same selectors and fallbacks as `extract_card`/`extract_page`,
+  then runs the usual `listing_from_raw` -> `parse_meta_block`/`Listing.parse_float` path
+
+Setup
+  pip install lxml cssselect
+
+Run
+  python immo_helper.py --start-url "<paste the url>" --max-pages 5 --record-dir fixtures
+  python immo_replay.py fixtures --out csv
+"""
+
+from __future__ import annotations
+import glob
+import os
+import re
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import lxml.html
+from lxml import etree
+from lxml.cssselect import LxmlHTMLTranslator
+
+from immo_helper import (
+    AGENCY_SEL, LINK_SEL, LISTING_CARD_SEL, LOCALITY_SEL, META_SEL, PRICE_SEL, TITLE_SEL,
+    Listing, listing_from_raw,
+)
+
+# Elements that start a new line in the browser's innerText
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "figcaption", "figure",
+    "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p",
+    "pre", "section", "table", "td", "th", "tr", "ul",
+}
+SKIP_TAGS = {"script", "style", "noscript", "template"}
+
+_translator = LxmlHTMLTranslator()
+
+
+def _compile(sel: str, prefix: str = "descendant::") -> etree.XPath:
+    # "descendant::" (not lxml's default "descendant-or-self::") so a card never matches itself,
+    # like Element.querySelector in the browser.
+    return etree.XPath(_translator.css_to_xpath(sel, prefix=prefix))
+
+
+CARD_XPATH = _compile(LISTING_CARD_SEL, prefix="descendant-or-self::")
+LINK_XPATH = _compile(LINK_SEL)
+LOCALITY_XPATH = _compile(LOCALITY_SEL)
+TITLE_XPATHS = [_compile(s.strip()) for s in TITLE_SEL.split(',')]
+PRICE_XPATHS = [_compile(s.strip()) for s in PRICE_SEL.split(',')]
+AGENCY_XPATHS = [_compile(s.strip()) for s in AGENCY_SEL.split(',')]
+META_XPATHS = [_compile(s.strip()) for s in META_SEL.split(',')]
+
+
+def _collect_text(el, parts: List[str]) -> None:
+    if not isinstance(el.tag, str) or el.tag in SKIP_TAGS:
+        return
+    block = el.tag in BLOCK_TAGS
+    if block:
+        parts.append("\n")
+    if el.text:
+        parts.append(el.text)
+    for child in el:
+        _collect_text(child, parts)
+        if child.tail:
+            parts.append(child.tail)
+    if block:
+        parts.append("\n")
+
+
+def inner_text(el) -> str:
+    """Approximate the browser's `innerText`: block elements on their own lines, spaces collapsed."""
+    parts: List[str] = []
+    _collect_text(el, parts)
+    lines = (re.sub(r"\s+", " ", line).strip() for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _first(card, xpaths, skip_empty: bool = False) -> Optional[str]:
+    text = None
+    for xp in xpaths:
+        found = xp(card)
+        if found:
+            text = inner_text(found[0])
+            if not skip_empty or text:
+                break
+    return text
+
+
+def raw_card(card) -> Dict[str, Optional[str]]:
+    """Raw card texts, same keys as the dicts returned by `EXTRACT_CARDS_JS`."""
+    link = LINK_XPATH(card)
+    small = LOCALITY_XPATH(card)
+    return {
+        "url": link[0].get("href") if link else None,
+        "title": _first(card, TITLE_XPATHS),
+        "price_text": _first(card, PRICE_XPATHS),
+        "agency": _first(card, AGENCY_XPATHS),
+        "meta_text": _first(card, META_XPATHS, skip_empty=True),
+        "locality_text": inner_text(small[0]) if small else None,
+    }
+
+
+def parse_html(html: str) -> List[Listing]:
+    """Parse one saved result page into `Listing` objects, no browser involved."""
+    doc = lxml.html.fromstring(html)
+    items: List[Listing] = []
+    for card in CARD_XPATH(doc):
+        try:
+            items.append(listing_from_raw(raw_card(card)))
+        except Exception:
+            continue
+    return items
+
+
+def fixture_paths(record_dir: str) -> List[str]:
+    return sorted(glob.glob(os.path.join(record_dir, "page_*.html")))
+
+
+def iter_pages(paths: Iterable[str]) -> Iterator[str]:
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            yield f.read()
+
+
+def replay(record_dir: str) -> List[Listing]:
+    """Parse every page recorded in `record_dir`, in page order."""
+    results: List[Listing] = []
+    for html in iter_pages(fixture_paths(record_dir)):
+        results.extend(parse_html(html))
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+    from immo_helper import to_dataframe
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("record_dir", help="Directory with page_NNN.html files saved via --record-dir")
+    ap.add_argument("--out", nargs="*", choices=["csv"], default=[])
+    args = ap.parse_args()
+
+    df = to_dataframe(replay(args.record_dir))
+    if "csv" in args.out:
+        df.to_csv("immoweb_replay.csv", index=False)
+        print("Saved CSV -> immoweb_replay.csv")
+    print(f"Rows: {len(df)}")
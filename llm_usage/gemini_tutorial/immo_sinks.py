@@ -0,0 +1,233 @@
+"""
+Streaming output sinks for scraped listings.
+
+Each sink writes a page of `Listing` objects as soon as the page is scraped, so memory stays flat
+however many pages are crawled:
+- JsonLinesSink: one JSON object per line (.jsonl)
+- CsvSink: CSV, flushed after every page. None is written as an empty field and read back as
+  null, so an empty string in a CSV file also comes back as null
+- ParquetSink: Parquet with a typed schema built from the `Listing` dataclass, one row group
+  every `row_group_size` rows
+
+`finalize()` runs the de-dup/sort of `to_dataframe()` as a post-pass over the written file with
+pyarrow, instead of on Python objects. The de-dup streams the file in record batches and only
+keeps the set of (listing_id, url) keys seen so far. Sorting needs every row at once, so with
+`sort=True` (the default) the de-duplicated rows are held in memory as one Arrow table (about
+the size of the Parquet file uncompressed); `sort=False` keeps memory bounded by one batch
+plus the key set.
+
+Setup
+  pip install pyarrow
+"""
+
+from __future__ import annotations
+import csv
+import json
+import os
+import typing
+from dataclasses import asdict, fields
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.json as pa_json
+import pyarrow.parquet as pq
+
+from immo_helper import Listing
+
+ARROW_TYPES = {str: pa.string(), float: pa.float64(), int: pa.int64(), bool: pa.bool_()}
+
+
+def listing_schema() -> pa.Schema:
+    """Arrow schema with one column per `Listing` field; Optional[...] fields are nullable."""
+    hints = typing.get_type_hints(Listing)
+    cols = []
+    for f in fields(Listing):
+        tp = hints[f.name]
+        args = [a for a in typing.get_args(tp) if a is not type(None)]
+        nullable = bool(args)
+        cols.append(pa.field(f.name, ARROW_TYPES[args[0] if args else tp], nullable=nullable))
+    return pa.schema(cols)
+
+
+COLUMNS = [f.name for f in fields(Listing)]
+
+
+class Sink:
+    """Base class: `write()` one page of listings at a time, `close()` when the crawl is done."""
+
+    path: str
+
+    def write(self, items: List[Listing]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class JsonLinesSink(Sink):
+    def __init__(self, path: str):
+        self.path = path
+        self.f = open(path, "w", encoding="utf-8")
+
+    def write(self, items: List[Listing]) -> None:
+        for it in items:
+            self.f.write(json.dumps(asdict(it), ensure_ascii=False))
+            self.f.write("\n")
+        self.f.flush()
+
+    def close(self) -> None:
+        self.f.close()
+
+
+class CsvSink(Sink):
+    def __init__(self, path: str):
+        self.path = path
+        self.f = open(path, "w", encoding="utf-8", newline="")
+        self.writer = csv.DictWriter(self.f, fieldnames=COLUMNS)
+        self.writer.writeheader()
+
+    def write(self, items: List[Listing]) -> None:
+        self.writer.writerows(asdict(it) for it in items)
+        self.f.flush()
+
+    def close(self) -> None:
+        self.f.close()
+
+
+class ParquetSink(Sink):
+    def __init__(self, path: str, row_group_size: int = 10_000):
+        self.path = path
+        self.schema = listing_schema()
+        self.row_group_size = row_group_size
+        self.writer = pq.ParquetWriter(path, self.schema)
+        self.buffer: Dict[str, List[Any]] = {name: [] for name in COLUMNS}
+        self.buffered = 0
+
+    def write(self, items: List[Listing]) -> None:
+        for it in items:
+            for name in COLUMNS:
+                self.buffer[name].append(getattr(it, name))
+        self.buffered += len(items)
+        if self.buffered >= self.row_group_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self.buffered:
+            return
+        self.writer.write_table(pa.Table.from_pydict(self.buffer, schema=self.schema))
+        self.buffer = {name: [] for name in COLUMNS}
+        self.buffered = 0
+
+    def close(self) -> None:
+        self._flush()
+        self.writer.close()
+
+
+SINKS = {".jsonl": JsonLinesSink, ".csv": CsvSink, ".parquet": ParquetSink}
+
+
+def open_sink(path: str):
+    """Pick the sink class from the file extension (.jsonl, .csv or .parquet)."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in SINKS:
+        raise ValueError(f"Unsupported output format {ext!r}, expected one of {sorted(SINKS)}")
+    return SINKS[ext](path)
+
+
+def iter_batches(path: str, batch_size: int = 10_000) -> Iterator[pa.RecordBatch]:
+    """Stream a sink's file as record batches with the `Listing` schema."""
+    schema = listing_schema()
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".parquet":
+        yield from pq.ParquetFile(path, memory_map=True).iter_batches(batch_size=batch_size)
+    elif ext == ".csv":
+        # CSV has no null: sinks write None as an empty field, read every empty field back as null
+        options = pa_csv.ConvertOptions(column_types=schema, strings_can_be_null=True)
+        yield from pa_csv.open_csv(path, convert_options=options)
+    elif ext == ".jsonl":
+        yield from pa_json.open_json(path, parse_options=pa_json.ParseOptions(explicit_schema=schema))
+    else:
+        raise ValueError(f"Unsupported output format {ext!r}, expected one of {sorted(SINKS)}")
+
+
+class TableWriter:
+    """Write record batches to .parquet, .csv or .jsonl one at a time."""
+
+    def __init__(self, path: str, schema: pa.Schema, ext: Optional[str] = None):
+        self.ext = (ext or os.path.splitext(path)[1]).lower()
+        if self.ext == ".parquet":
+            self.writer = pq.ParquetWriter(path, schema)
+        elif self.ext == ".csv":
+            self.writer = pa_csv.CSVWriter(path, schema)
+        elif self.ext == ".jsonl":
+            self.f = open(path, "w", encoding="utf-8")
+        else:
+            raise ValueError(f"Unsupported output format {self.ext!r}, expected one of {sorted(SINKS)}")
+
+    def write(self, batch: Union[pa.RecordBatch, pa.Table]) -> None:
+        if self.ext == ".jsonl":
+            for row in batch.to_pylist():
+                self.f.write(json.dumps(row, ensure_ascii=False))
+                self.f.write("\n")
+        elif isinstance(batch, pa.Table):
+            self.writer.write_table(batch)
+        else:
+            self.writer.write_batch(batch)
+
+    def close(self) -> None:
+        if self.ext == ".jsonl":
+            self.f.close()
+        else:
+            self.writer.close()
+
+
+def dedupe_batches(batches: Iterable[pa.RecordBatch]) -> Iterator[pa.RecordBatch]:
+    """First row per (listing_id, url) across all batches; only the keys are kept in memory."""
+    seen: Set[Tuple[Optional[str], Optional[str]]] = set()
+    for batch in batches:
+        keep = []
+        for i, key in enumerate(zip(batch.column("listing_id").to_pylist(), batch.column("url").to_pylist())):
+            if key not in seen:
+                seen.add(key)
+                keep.append(i)
+        if len(keep) == batch.num_rows:
+            yield batch
+        elif keep:
+            yield batch.take(pa.array(keep, pa.int64()))
+
+
+def sort_listings(table: pa.Table) -> pa.Table:
+    """Price ascending, then area descending; Arrow puts nulls last by default, like na_position='last'."""
+    return table.sort_by([("price_eur", "ascending"), ("habitable_area_sqm", "descending")])
+
+
+def finalize(path: str, out_path: Optional[str] = None, sort: bool = True, batch_size: int = 10_000) -> int:
+    """De-dup (and sort) a file written by a sink, in place unless `out_path` is given. Returns the row count."""
+    out_path = out_path or path
+    tmp = out_path + ".tmp"
+    schema = listing_schema()
+    writer = TableWriter(tmp, schema, ext=os.path.splitext(out_path)[1])
+    rows = 0
+    try:
+        try:
+            batches = dedupe_batches(b.cast(schema) for b in iter_batches(path, batch_size))
+            if sort:
+                batches = sort_listings(pa.Table.from_batches(list(batches), schema=schema)).to_batches(batch_size)
+            for batch in batches:
+                writer.write(batch)
+                rows += batch.num_rows
+        finally:
+            writer.close()
+        os.replace(tmp, out_path)
+    finally:
+        # Only left behind when something above raised
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return rows
@@ -1,6 +1,11 @@
 from google import genai
+import asyncio
+import time
+
 from google.genai import types
 
+from tool_dispatcher import ToolDispatcher
+
 power_disco_ball = {
     "name": "power_disco_ball",
     "description": "Powers the spinning disco ball.",
@@ -50,9 +55,30 @@ dim_lights = {
     },
 }
 
+# Mock implementations; each takes a moment, like a call to a real device would
+def dim_lights_impl(brightness: float) -> dict:
+    time.sleep(0.2)
+    return {"brightness": brightness}
+
+
+async def start_music_impl(energetic: bool, loud: bool) -> dict:
+    await asyncio.sleep(0.2)
+    return {"music_type": "energetic" if energetic else "chill", "volume": "loud" if loud else "quiet"}
+
+
+def power_disco_ball_impl(power: bool) -> dict:
+    time.sleep(0.2)
+    return {"disco_ball": "on" if power else "off"}
+
+
+dispatcher = ToolDispatcher(timeout=5)
+dispatcher.register(dim_lights, dim_lights_impl)
+dispatcher.register(start_music, start_music_impl)
+dispatcher.register(power_disco_ball, power_disco_ball_impl)
+
 client = genai.Client()
 tools_house = [
-    types.Tool(function_declarations=[dim_lights,start_music, power_disco_ball])
+    types.Tool(function_declarations=dispatcher.declarations())
     ]
 
 config = types.GenerateContentConfig(
@@ -75,6 +101,19 @@ for fn in response.function_calls:
     args = ", ".join(f"{key}={val}" for key, val in fn.args.items())
     print(f"{fn.name}({args})")
 
+# Run all of them at once and send every result back in one message
+results = dispatcher.dispatch(response.function_calls)
+response = chat.send_message(
+    dispatcher.response_parts(results),
+    # Let the model answer in text now instead of forcing another function call
+    config=types.GenerateContentConfig(
+        tools=tools_house,
+        tool_config=types.ToolConfig(function_calling_config=types.FunctionCallingConfig(mode='NONE')),
+    ),
+)
+print(response.text)
+print(f"Tool latency: {dispatcher.latency_report()}")
+
 
 
 # Sample Output:
@@ -83,3 +122,5 @@ for fn in response.function_calls:
 # dim_lights(brightness=0.3)
 # start_music(loud=True, energetic=True)
 # power_disco_ball(power=True)
+# ...model reply...
+# Tool latency: {'dim_lights': {'calls': 1, 'errors': 0, 'timeouts': 0, 'p50_ms': 200.4, 'max_ms': 200.4}, ...}
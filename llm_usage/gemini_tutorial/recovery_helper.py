@@ -1,18 +1,38 @@
+"""
+Breakup recovery advice from three independent prompts (therapist, recovery plan, honest feedback).
+
+Modes
+- sequential: the three generate_content calls run one after another (total time is the sum)
+- async: the calls run concurrently on the async client (`client.aio`) and each answer is
+  printed as soon as it arrives (total time is the slowest call)
+
+The prompts share only the short user message, far below the minimum size of a Gemini context
+cache (about 1024 tokens on 2.5 Flash), so each call sends its full prompt.
+
+Run
+  python recovery_helper.py
+  python recovery_helper.py --mode async
+  python recovery_helper.py --mode both --mock-latency 1.0     # local mock server, no API key
+"""
+
+import asyncio
+import time
+from typing import AsyncIterator, Dict, Optional, Tuple
+
 from google import genai
 from google.genai import types
 import logging
 
+import constants
+
 # Configure logging for errors only
 logging.basicConfig(level=logging.ERROR)
 logger = logging.getLogger(__name__)
 
+USER_INPUT = "I am a teenager going through a hard breakup of 2 month relationship."
 
-def call_main():
-    therapist_client = genai.Client()
-
-    user_input = ("I am a teenager going through a hard breakup of 2 month relationship.")
-    logger.info(f"Generating advise for user input: {user_input}")
-    therapist_instruction = f"""
+INSTRUCTIONS = {
+    "therapist": """
                             Analyze the emotional state and provide empathetic support based on:
                             User's message: {user_input}
 
@@ -21,9 +41,8 @@ def call_main():
                             2. Gentle words of comfort
                             3. Relatable experiences
                             4. Words of encouragement
-                            """
-
-    recovery_instruction = f"""
+                            """,
+    "recovery": """
                             Design a 7-day recovery plan based on:
                             Current state: {user_input}
 
@@ -32,9 +51,8 @@ def call_main():
                             2. Self-care routines
                             3. Social media guidelines
                             4. Mood-lifting music suggestions
-                            """
-
-    honesty_instruction = f"""
+                            """,
+    "honesty": """
                             Provide honest, constructive feedback about:
                             Situation: {user_input}
 
@@ -43,44 +61,79 @@ def call_main():
                             2. Growth opportunities
                             3. Future outlook
                             4. Actionable steps
-                            """
-
-    response = therapist_client.models.generate_content(
-        model="gemini-2.5-flash",
-        contents=user_input,
-        config=types.GenerateContentConfig(
-            system_instruction=[
-                therapist_instruction,
-            ]
-        ),
-    )
-    print(response.text)
-
-    response = therapist_client.models.generate_content(
-        model="gemini-2.5-flash",
-        contents=user_input,
-        config=types.GenerateContentConfig(
-            system_instruction=[
-                recovery_instruction,
-            ]
-        ),
-    )
-    print(response.text)
-
-    response = therapist_client.models.generate_content(
-        model="gemini-2.5-flash",
-        contents=user_input,
-        config=types.GenerateContentConfig(
-            system_instruction=[
-                honesty_instruction,
-            ]
-        ),
-    )
-    print(response.text)
+                            """,
+}
+
+
+def request_config(name: str, user_input: str) -> types.GenerateContentConfig:
+    return types.GenerateContentConfig(system_instruction=[INSTRUCTIONS[name].format(user_input=user_input)])
+
+
+def call_main(client: Optional[genai.Client] = None, user_input: str = USER_INPUT) -> Dict[str, str]:
+    therapist_client = client or genai.Client()
+
+    logger.info(f"Generating advise for user input: {user_input}")
+    answers = {}
+    for name in INSTRUCTIONS:
+        response = therapist_client.models.generate_content(model=constants.MODEL_NAME, contents=user_input,
+                                                            config=request_config(name, user_input))
+        answers[name] = response.text
+        print(response.text)
     logger.info("I hope you feel better soon!!")
+    return answers
 
 
-if __name__ == "__main__":
-    call_main()
+async def fan_out(client: genai.Client, user_input: str = USER_INPUT) -> AsyncIterator[Tuple[str, str, float]]:
+    """Run all instructions concurrently; yields (name, text, seconds) in the order they finish."""
+    started = time.perf_counter()
+
+    async def one(name: str) -> Tuple[str, str, float]:
+        response = await client.aio.models.generate_content(model=constants.MODEL_NAME, contents=user_input,
+                                                            config=request_config(name, user_input))
+        return name, response.text, time.perf_counter() - started
 
+    tasks = [asyncio.create_task(one(name)) for name in INSTRUCTIONS]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Do not leave requests running if the caller stops early or one of them failed
+        for task in tasks:
+            task.cancel()
 
+
+async def call_main_async(client: Optional[genai.Client] = None, user_input: str = USER_INPUT) -> Dict[str, str]:
+    therapist_client = client or genai.Client()
+    logger.info(f"Generating advise for user input: {user_input}")
+    answers = {}
+    async for name, text, seconds in fan_out(therapist_client, user_input):
+        answers[name] = text
+        print(f"--- {name} ({seconds:.1f}s)\n{text}")
+    logger.info("I hope you feel better soon!!")
+    return answers
+
+
+if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mode", choices=["sequential", "async", "both"], default="sequential")
+    ap.add_argument("--mock-latency", type=float, default=None,
+                    help="Use a local mock server with this many seconds per call instead of the API")
+    args = ap.parse_args()
+
+    client, server = None, None
+    if args.mock_latency is not None:
+        from gemini_mock_server import start_mock_server
+        server, base_url = start_mock_server(latency=args.mock_latency)
+        client = genai.Client(api_key="mock", http_options=types.HttpOptions(base_url=base_url))
+
+    for mode in (["sequential", "async"] if args.mode == "both" else [args.mode]):
+        t0 = time.perf_counter()
+        if mode == "sequential":
+            call_main(client)
+        else:
+            asyncio.run(call_main_async(client))
+        print(f"=== {mode}: {time.perf_counter() - t0:.2f}s")
+    if server:
+        print(f"mock server: {dict(server.stats)}")
@@ -0,0 +1,172 @@
+"""
+Pooled, cached SerpAPI client for the travel_agent tools.
+
+- One `requests.Session` with a connection pool, so repeated calls reuse TCP/TLS connections.
+- Responses are cached under a key built from the normalized parameters: the api_key is
+  dropped, values are stripped and the query is case- and whitespace-folded, so
+  "Events in  Atlanta" and "events in atlanta" share an entry.
+- Each engine has its own TTL (hotel rates change faster than event listings). Memory holds
+  at most `max_entries` responses, evicting the least recently used. An optional SQLite file
+  keeps them across runs and is checked on a memory miss.
+- Entries are kept as JSON text, in memory as on disk, and every hit is parsed into a fresh
+  dict, so callers can modify what they get back without touching the cache.
+- Concurrent misses on the same key send one request: the first caller fetches, the others
+  wait on its Future and get their own copy of the same response (`client.coalesced` counts them).
+- `cache.stats()` reports hits, misses, disk hits, evictions and expirations for sizing.
+Error responses are never cached.
+"""
+
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Seconds a response stays valid, per SerpAPI engine
+ENGINE_TTLS = {"google_events": 60 * 60, "google_hotels": 10 * 60}
+DEFAULT_TTL = 10 * 60
+
+
+def cache_key(params: Dict[str, Any]) -> str:
+    normalized = {}
+    for name, value in params.items():
+        if name == "api_key" or value is None:
+            continue
+        value = " ".join(str(value).split())
+        normalized[name] = value.casefold() if name == "q" else value
+    return hashlib.sha1(json.dumps(normalized, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Thread-safe LRU cache with per-entry expiry and an optional SQLite tier; `get` returns a new copy."""
+
+    def __init__(self, max_entries: int = 512, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.disk_hits = self.evictions = self.expired = 0
+        self.conn = None
+        if path:
+            self.conn = sqlite3.connect(path, check_same_thread=False)
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires REAL NOT NULL, body TEXT NOT NULL)"
+            )
+            self.conn.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),))
+            self.conn.commit()
+
+    def _remember(self, key: str, expires: float, body: str) -> None:
+        self._entries[key] = (expires, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return json.loads(entry[1])
+                del self._entries[key]
+                self.expired += 1
+            if self.conn is not None:
+                row = self.conn.execute("SELECT expires, body FROM responses WHERE key = ? AND expires > ?",
+                                        (key, now)).fetchone()
+                if row:
+                    self._remember(key, row[0], row[1])
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return json.loads(row[1])
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Any, ttl: float) -> None:
+        expires = time.time() + ttl
+        body = json.dumps(value)
+        with self._lock:
+            self._remember(key, expires, body)
+            if self.conn is not None:
+                self.conn.execute("INSERT OR REPLACE INTO responses (key, expires, body) VALUES (?, ?, ?)",
+                                  (key, expires, body))
+                self.conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "disk_hits": self.disk_hits,
+                    "evictions": self.evictions, "expired": self.expired, "entries": len(self._entries),
+                    "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0}
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+class SerpApiClient:
+    def __init__(self, url: str, api_key: Optional[str], cache: Optional[ResponseCache] = None,
+                 ttls: Optional[Dict[str, float]] = None, pool_size: int = 16, timeout: float = 30):
+        self.url = url
+        self.api_key = api_key
+        self.cache = cache
+        self.ttls = ENGINE_TTLS if ttls is None else ttls
+        self.timeout = timeout
+        self.coalesced = 0
+        # cache key -> Future of the request in flight for it
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _fetch(self, params: Dict[str, Any]) -> requests.Response:
+        return self.session.get(self.url, params={"api_key": self.api_key, **params}, timeout=self.timeout)
+
+    def search(self, engine: str, **params: Any) -> Dict[str, Any]:
+        params = {"engine": engine, **params}
+        if self.cache is None:
+            return self._fetch(params).json()
+        key = cache_key(params)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        with self._lock:
+            future = self._inflight.get(key)
+            waiting = future is not None
+            if waiting:
+                self.coalesced += 1
+            else:
+                future = self._inflight[key] = Future()
+        if waiting:
+            # Same request already in flight: share its response (or its error)
+            return copy.deepcopy(future.result())
+        try:
+            response = self._fetch(params)
+            body = response.json()
+            if response.ok and "error" not in body:
+                self.cache.put(key, body, self.ttls.get(engine, DEFAULT_TTL))
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(copy.deepcopy(body))
+        finally:
+            with self._lock:
+                del self._inflight[key]
+        return body
+
+    def close(self) -> None:
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
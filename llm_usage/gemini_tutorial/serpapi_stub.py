@@ -0,0 +1,103 @@
+"""
+Local stand-in for the SerpAPI search endpoint used by travel_agent.py, with injected latency.
+
+GET /search.json?engine=google_events|google_hotels&q=... answers with a few generated
+`events_results` or `properties` in SerpAPI's shape. Each request sleeps `latency` seconds
+(plus up to `jitter`) on its own thread. `stats` counts requests per engine.
+
+Use
+  server, url = start_serpapi_stub(latency=0.8)
+  os.environ["SERP_API_URL"] = url        # before importing travel_agent
+
+Run standalone
+  python serpapi_stub.py --port 8766 --latency 0.8
+"""
+
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qs, urlparse
+
+
+def fake_events(query: str, n: int = 5) -> List[Dict[str, Any]]:
+    return [{"title": f"Event {i + 1} for {query}", "date": {"start_date": "Sat", "when": "7 PM"},
+             "address": [f"{100 + i} Main St"], "link": f"https://example.com/events/{i + 1}"} for i in range(n)]
+
+
+def fake_hotels(query: str, n: int = 5) -> List[Dict[str, Any]]:
+    return [{"name": f"Hotel {i + 1} near {query}", "hotel_class": f"{3 + i % 3}-star hotel",
+             "rate_per_night": {"lowest": f"${120 + 15 * i}"}, "overall_rating": 4.0 + i / 10} for i in range(n)]
+
+
+class SerpApiStub(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], latency: float = 0.5, jitter: float = 0.0):
+        super().__init__(address, SerpApiStubHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.stats: Counter = Counter()
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/search.json"
+
+
+class SerpApiStubHandler(BaseHTTPRequestHandler):
+    server: SerpApiStub
+    # Keep-alive, so pooled clients can reuse connections
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; without this, keep-alive requests stall on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        engine, query = params.get("engine"), params.get("q", "")
+        time.sleep(self.server.latency + random.uniform(0, self.server.jitter))
+        with self.server.lock:
+            self.server.stats[engine or "unknown"] += 1
+        if url.path != "/search.json":
+            status, body = 404, {"error": f"Unknown path {url.path}"}
+        elif engine == "google_events":
+            status, body = 200, {"events_results": fake_events(query)}
+        elif engine == "google_hotels":
+            status, body = 200, {"properties": fake_hotels(query)}
+        else:
+            status, body = 400, {"error": f"Unsupported engine {engine!r}"}
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def start_serpapi_stub(latency: float = 0.5, jitter: float = 0.0, port: int = 0) -> Tuple[SerpApiStub, str]:
+    """Start the stub on a background thread; returns it and its search URL."""
+    server = SerpApiStub(("127.0.0.1", port), latency, jitter)
+    threading.Thread(target=server.serve_forever, name="serpapi-stub", daemon=True).start()
+    return server, server.url
+
+
+if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--port", type=int, default=8766)
+    ap.add_argument("--latency", type=float, default=0.8)
+    ap.add_argument("--jitter", type=float, default=0.0)
+    args = ap.parse_args()
+
+    server = SerpApiStub(("127.0.0.1", args.port), args.latency, args.jitter)
+    print(f"SerpAPI stub on {server.url} ({args.latency}s latency)")
+    server.serve_forever()
@@ -0,0 +1,198 @@
+"""
+Generic dispatcher for Gemini function calls.
+
+Register each function declaration with the Python callable that implements it, then hand the
+dispatcher the `function_calls` of a model response:
+- arguments are checked against the declaration (required fields, unknown fields, JSON types,
+  enums); integral floats are accepted for "integer" since the model's args arrive as numbers
+- all calls of the turn run concurrently: sync callables on a thread pool, async ones on the
+  event loop, each under its own timeout
+- the results come back as one list of function response parts, in call order, ready to be
+  sent to the model in a single message; failures become {"error": ...} responses
+- `latency_report()` gives calls, errors, timeouts and p50/max latency per tool
+
+A sync callable that times out keeps running on its thread; only its answer is dropped.
+
+Run (three mock tools, one of which times out)
+  python tool_dispatcher.py
+"""
+
+import asyncio
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from google.genai import types
+
+JSON_TYPES = {"string": str, "boolean": bool, "object": dict, "array": list}
+
+
+class ToolArgumentError(ValueError):
+    pass
+
+
+@dataclass
+class ToolResult:
+    name: str
+    call_id: Optional[str]
+    response: Dict[str, Any]
+    seconds: float
+    ok: bool = True
+    timed_out: bool = False
+
+
+@dataclass
+class RegisteredTool:
+    declaration: Dict[str, Any]
+    fn: Callable[..., Any]
+    timeout: float
+    is_async: bool
+
+
+def check_value(name: str, value: Any, schema: Dict[str, Any]) -> Any:
+    """Validate one argument against its JSON schema; returns it, with integral floats as int."""
+    expected = schema.get("type")
+    if expected == "integer":
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ToolArgumentError(f"{name} must be an integer, got {value!r}")
+    elif expected == "number":
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            raise ToolArgumentError(f"{name} must be a number, got {value!r}")
+    elif expected in JSON_TYPES and not isinstance(value, JSON_TYPES[expected]):
+        raise ToolArgumentError(f"{name} must be of type {expected}, got {value!r}")
+    if "enum" in schema and value not in schema["enum"]:
+        raise ToolArgumentError(f"{name} must be one of {schema['enum']}, got {value!r}")
+    if expected == "array" and "items" in schema:
+        value = [check_value(f"{name}[{i}]", item, schema["items"]) for i, item in enumerate(value)]
+    return value
+
+
+class ToolDispatcher:
+    def __init__(self, timeout: float = 10.0, workers: int = 8):
+        self.timeout = timeout
+        self.tools: Dict[str, RegisteredTool] = {}
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tool")
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.timeouts: Dict[str, int] = {}
+
+    def register(self, declaration: Dict[str, Any], fn: Callable[..., Any], timeout: Optional[float] = None) -> None:
+        self.tools[declaration["name"]] = RegisteredTool(declaration, fn, timeout or self.timeout,
+                                                         inspect.iscoroutinefunction(fn))
+
+    def tool(self, declaration: Dict[str, Any], timeout: Optional[float] = None) -> Callable:
+        """Decorator form of `register`."""
+        def wrap(fn):
+            self.register(declaration, fn, timeout)
+            return fn
+        return wrap
+
+    def declarations(self) -> List[Dict[str, Any]]:
+        return [t.declaration for t in self.tools.values()]
+
+    def validate(self, name: str, args: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if name not in self.tools:
+            raise ToolArgumentError(f"Unknown tool {name!r}")
+        params = self.tools[name].declaration.get("parameters") or {}
+        properties = params.get("properties", {})
+        args = dict(args or {})
+        missing = [p for p in params.get("required", []) if p not in args]
+        if missing:
+            raise ToolArgumentError(f"{name}: missing required arguments {missing}")
+        unknown = [a for a in args if a not in properties]
+        if unknown:
+            raise ToolArgumentError(f"{name}: unknown arguments {unknown}")
+        return {arg: check_value(f"{name}.{arg}", value, properties[arg]) for arg, value in args.items()}
+
+    async def _run(self, call: types.FunctionCall) -> ToolResult:
+        started = time.perf_counter()
+        name = call.name
+        result = ToolResult(name, call.id, {}, 0.0)
+        try:
+            args = self.validate(name, call.args)
+            tool = self.tools[name]
+            if tool.is_async:
+                task = tool.fn(**args)
+            else:
+                task = asyncio.get_running_loop().run_in_executor(self.pool, partial(tool.fn, **args))
+            result.response = {"result": await asyncio.wait_for(task, tool.timeout)}
+        except asyncio.TimeoutError:
+            result.ok, result.timed_out = False, True
+            result.response = {"error": f"{name} timed out after {self.tools[name].timeout}s"}
+        except Exception as e:
+            result.ok = False
+            result.response = {"error": f"{type(e).__name__}: {e}"}
+        result.seconds = time.perf_counter() - started
+        self.latencies.setdefault(name, []).append(result.seconds)
+        if not result.ok:
+            counter = self.timeouts if result.timed_out else self.errors
+            counter[name] = counter.get(name, 0) + 1
+        return result
+
+    async def dispatch_async(self, function_calls: Optional[Sequence[types.FunctionCall]]) -> List[ToolResult]:
+        return list(await asyncio.gather(*(self._run(call) for call in function_calls or [])))
+
+    def dispatch(self, function_calls: Optional[Sequence[types.FunctionCall]]) -> List[ToolResult]:
+        """Run all calls of a turn; for code that is not already inside an event loop."""
+        return asyncio.run(self.dispatch_async(function_calls))
+
+    @staticmethod
+    def response_parts(results: Sequence[ToolResult]) -> List[types.Part]:
+        return [types.Part(function_response=types.FunctionResponse(id=r.call_id, name=r.name, response=r.response))
+                for r in results]
+
+    def latency_report(self) -> Dict[str, Dict[str, Any]]:
+        report = {}
+        for name, times in self.latencies.items():
+            ordered = sorted(times)
+            report[name] = {"calls": len(times), "errors": self.errors.get(name, 0),
+                            "timeouts": self.timeouts.get(name, 0),
+                            "p50_ms": round(ordered[len(ordered) // 2] * 1000, 1),
+                            "max_ms": round(ordered[-1] * 1000, 1)}
+        return report
+
+    def close(self) -> None:
+        self.pool.shutdown(wait=False)
+
+
+if __name__ == "__main__":
+    dispatcher = ToolDispatcher(timeout=1.0)
+
+    @dispatcher.tool({"name": "dim_lights", "parameters": {
+        "type": "object", "properties": {"brightness": {"type": "number"}}, "required": ["brightness"]}})
+    def dim_lights(brightness: float) -> dict:
+        time.sleep(0.3)
+        return {"brightness": brightness}
+
+    @dispatcher.tool({"name": "start_music", "parameters": {
+        "type": "object", "properties": {"energetic": {"type": "boolean"}, "loud": {"type": "boolean"}},
+        "required": ["energetic", "loud"]}})
+    async def start_music(energetic: bool, loud: bool) -> dict:
+        await asyncio.sleep(0.3)
+        return {"music_type": "energetic" if energetic else "chill", "volume": "loud" if loud else "quiet"}
+
+    @dispatcher.tool({"name": "power_disco_ball", "parameters": {
+        "type": "object", "properties": {"power": {"type": "boolean"}}, "required": ["power"]}}, timeout=0.5)
+    def power_disco_ball(power: bool) -> bool:
+        time.sleep(0.8)
+        return power
+
+    calls = [
+        types.FunctionCall(id="1", name="dim_lights", args={"brightness": 0.3}),
+        types.FunctionCall(id="2", name="start_music", args={"energetic": True, "loud": True}),
+        types.FunctionCall(id="3", name="power_disco_ball", args={"power": True}),
+        types.FunctionCall(id="4", name="dim_lights", args={"brightness": "low"}),
+    ]
+    t0 = time.perf_counter()
+    results = dispatcher.dispatch(calls)
+    print(f"{len(calls)} calls in {time.perf_counter() - t0:.2f}s "
+          f"(serially: {sum(r.seconds for r in results):.2f}s)")
+    for part in dispatcher.response_parts(results):
+        print(f"  {part.function_response.name}: {part.function_response.response}")
+    print(dispatcher.latency_report())
+    dispatcher.close()
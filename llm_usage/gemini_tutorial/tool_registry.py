@@ -0,0 +1,142 @@
+"""
+Tool registry: declarations and config built once, for automatic function calling.
+
+Passing Python functions in `GenerateContentConfig(tools=[...])` makes the SDK rebuild each
+FunctionDeclaration from the signature and docstring (`FunctionDeclaration.from_callable`),
+and deep-copy the config, on every request and every function-calling round. The registry
+does the conversion once at startup:
+- `declarations` and `tool` hold the FunctionDeclarations, converted the same way the SDK does
+- `config` is one GenerateContentConfig with that tool and the SDK's own automatic function
+  calling turned off; it is shared by all requests, so treat it as read-only (derive per-request
+  variants with `config.model_copy(update=...)`)
+- `generate()` runs the function-calling loop itself: the calls of each round go through a
+  ToolDispatcher (validated, concurrent, with timeouts) and their responses go back in one message.
+  `max_tool_rounds` bounds the rounds (one model turn and all of its calls), not the individual
+  calls like the SDK's `maximum_remote_calls`. Once it is spent, one last request goes out with
+  function calling disabled (`final_config`), so the model has to answer with text.
+
+Run (per-request overhead before/after, with --tools declarations)
+  python tool_registry.py --tools 40
+Both arms time what the SDK does per request with the config it is given (`t_tools` on a deep
+copy): from raw functions before, from the registry's ready declarations after. The full
+requests go to the mock server, which answers each prompt with one round of three function
+calls, so the SDK's automatic loop (before) and `generate()` (after) both run a tool round.
+"""
+
+from typing import Any, Callable, List, Literal, Sequence, Union
+
+from google import genai
+from google.genai import types
+
+import constants
+from tool_dispatcher import ToolDispatcher
+
+
+class ToolRegistry:
+    def __init__(self, functions: Sequence[Callable[..., Any]],
+                 api_option: Literal["GEMINI_API", "VERTEX_AI", "ENTERPRISE"] = "GEMINI_API",
+                 timeout: float = 10.0, max_tool_rounds: int = 10, **config_fields: Any):
+        self.max_tool_rounds = max_tool_rounds
+        self.dispatcher = ToolDispatcher(timeout=timeout)
+        declarations = []
+        for fn in functions:
+            declaration = types.FunctionDeclaration.from_callable_with_api_option(
+                callable=fn, api_option=api_option, use_json_schema=True)
+            declarations.append(declaration)
+            self.dispatcher.register({"name": declaration.name, "parameters": declaration.parameters_json_schema}, fn)
+        self.declarations = tuple(declarations)
+        self.tool = types.Tool(function_declarations=list(self.declarations))
+        self.config = types.GenerateContentConfig(
+            tools=[self.tool],
+            automatic_function_calling=types.AutomaticFunctionCallingConfig(disable=True),
+            **config_fields,
+        )
+        # Same tools (the history refers to them) but no more calls allowed
+        self.final_config = self.config.model_copy(update={"tool_config": types.ToolConfig(
+            function_calling_config=types.FunctionCallingConfig(mode=types.FunctionCallingConfigMode.NONE))})
+
+    def generate(self, client: genai.Client, contents: Union[str, List[types.Content]],
+                 model: str = constants.MODEL_NAME) -> types.GenerateContentResponse:
+        """generate_content with the registry's tools, running requested functions until the model answers.
+
+        Raises RuntimeError if the model still asks for functions after `max_tool_rounds` rounds,
+        when function calling is disabled.
+        """
+        history = [types.Content(role="user", parts=[types.Part(text=contents)])] if isinstance(contents, str) \
+            else list(contents)
+        for round_ in range(self.max_tool_rounds + 1):
+            last = round_ == self.max_tool_rounds
+            response = client.models.generate_content(model=model, contents=history,
+                                                      config=self.final_config if last else self.config)
+            if not response.function_calls:
+                return response
+            if last:
+                break
+            results = self.dispatcher.dispatch(response.function_calls)
+            history.append(response.candidates[0].content)
+            history.append(types.Content(role="user", parts=self.dispatcher.response_parts(results)))
+        raise RuntimeError(f"Model still requested {[call.name for call in response.function_calls]} after "
+                           f"{self.max_tool_rounds} tool rounds, with function calling disabled")
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from google.genai import _transformers
+
+    from automatic_func_call import dim_lights_impl, power_disco_ball_impl, start_music_impl
+    from gemini_mock_server import start_mock_server
+
+    def sdk_tools(client: genai.Client, config: types.GenerateContentConfig) -> List[types.Tool]:
+        """What the SDK does with `config.tools` inside each generate_content call."""
+        return _transformers.t_tools(client._api_client, config.model_copy(deep=True).tools)
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--tools", type=int, default=40, help="Number of tool functions")
+    ap.add_argument("--requests", type=int, default=200)
+    args = ap.parse_args()
+
+    def make_tool(i: int) -> Callable[..., dict]:
+        def tool(city: str, days: int = 1, metric: bool = True) -> dict:
+            """Looks something up for a city.
+
+            Args:
+                city: The city name.
+                days: How many days to cover.
+                metric: Whether to use metric units.
+            """
+            return {"city": city, "days": days}
+        tool.__name__ = tool.__qualname__ = f"lookup_{i}"
+        return tool
+
+    functions = [power_disco_ball_impl, start_music_impl, dim_lights_impl]
+    functions += [make_tool(i) for i in range(max(0, args.tools - len(functions)))]
+
+    server, base_url = start_mock_server(latency=0.0)
+    client = genai.Client(api_key="mock", http_options=types.HttpOptions(base_url=base_url))
+
+    def per_call_us(fn: Callable[[], Any], n: int) -> float:
+        t0 = time.perf_counter()
+        for _ in range(n):
+            fn()
+        return (time.perf_counter() - t0) / n * 1e6
+
+    t0 = time.perf_counter()
+    registry = ToolRegistry(functions)
+    print(f"{len(functions)} tools, registry built once in {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+    config_before = lambda: sdk_tools(client, types.GenerateContentConfig(tools=functions))
+    config_after = lambda: sdk_tools(client, registry.config)
+    print(f"  config + declarations per request   before {per_call_us(config_before, args.requests):9.1f} us"
+          f"   after {per_call_us(config_after, args.requests):9.1f} us")
+
+    # Full generate_content calls against the mock server (no latency), raw functions vs registry;
+    # each one is two model requests around a round of function calls
+    request_before = lambda: client.models.generate_content(
+        model=constants.MODEL_NAME, contents="Party time", config=types.GenerateContentConfig(tools=functions))
+    request_after = lambda: registry.generate(client, "Party time")
+    request_before(), request_after()
+    print(f"  generate_content per request        before {per_call_us(request_before, args.requests):9.1f} us"
+          f"   after {per_call_us(request_after, args.requests):9.1f} us")
+    print(f"  mock server: {dict(server.stats)}")
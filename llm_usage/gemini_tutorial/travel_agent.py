@@ -1,21 +1,32 @@
 import vertexai
 from vertexai.preview.generative_models import GenerativeModel, FunctionDeclaration, Tool, HarmCategory, HarmBlockThreshold, Content, Part
 
-import requests
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 
+from serpapi_client import ResponseCache, SerpApiClient
+
 SERP_API_KEY = os.environ.get("SERP API", os.getenv("SERP_API_KEY"))
+# Point at serpapi_stub.py for local runs
+SERP_API_URL = os.environ.get("SERP_API_URL", "https://serpapi.com/search.json")
+# Tool calls of one model turn run concurrently on this many threads
+TOOL_WORKERS = 8
+
+# Shared pooled session and response cache; SERP_CACHE_PATH adds an on-disk (SQLite) tier
+serp = SerpApiClient(SERP_API_URL, SERP_API_KEY,
+                     ResponseCache(max_entries=int(os.environ.get("SERP_CACHE_SIZE", 512)),
+                                   path=os.environ.get("SERP_CACHE_PATH")),
+                     pool_size=TOOL_WORKERS)
 
 def event_api(query: str, htichips: str = "date:today"):
-  URL = f"https://serpapi.com/search.json?api_key={SERP_API_KEY}&engine=google_events&q={query}&htichips={htichips}&hl=en&gl=us"
-  response = requests.get(URL).json()
+  response = serp.search("google_events", q=query, htichips=htichips, hl="en", gl="us")
   return response["events_results"]
 
 
 def hotel_api(query:str, check_in_date:str, check_out_date:int, hotel_class:int = 3, adults:int = 2):
-    URL = f"https://serpapi.com/search.json?api_key={SERP_API_KEY}&engine=google_hotels&q={query}&check_in_date={check_in_date}&check_out_date={check_out_date}&adults={int(adults)}&hotel_class={int(hotel_class)}&currency=USD&gl=us&hl=en"
-    response = requests.get(URL).json()
+    response = serp.search("google_hotels", q=query, check_in_date=check_in_date, check_out_date=check_out_date,
+                           adults=int(adults), hotel_class=int(hotel_class), currency="USD", gl="us", hl="en")
     
     return response["properties"]
 
@@ -112,15 +123,21 @@ safety_settings = {
 
 tools = Tool(function_declarations=[event_function, hotel_function])
 
-model = GenerativeModel(
-    #model_name = 'gemini-1.5-pro-001', 
-    model_name = 'gemini-2.5-flash', 
-    generation_config = generation_config, 
-    safety_settings = safety_settings, 
-    tools = [tools])
-chat = model.start_chat()
-response = chat.send_message("Hello")
-print(response.text)
+chat = None
+
+
+def get_chat():
+    """The shared chat session, created on first use so importing the module needs no credentials."""
+    global chat
+    if chat is None:
+        model = GenerativeModel(
+            #model_name = 'gemini-1.5-pro-001', 
+            model_name = 'gemini-2.5-flash', 
+            generation_config = generation_config, 
+            safety_settings = safety_settings, 
+            tools = [tools])
+        chat = model.start_chat()
+    return chat
 
 
 CallableFunctions = {
@@ -150,23 +167,45 @@ def mission_prompt(prompt:str):
 
 
 
-def Agent(user_prompt):
+def call_tool(tool) -> Part:
+    """Run one function call; a failure is reported to the model instead of ending the turn."""
+    try:
+        function_res = CallableFunctions[tool.name](**tool.args)
+        return Part.from_function_response(name=tool.name, response={"result": function_res})
+    except Exception as e:
+        return Part.from_function_response(name=tool.name, response={"error": f"{type(e).__name__}: {e}"})
+
+
+def run_tools(tools) -> list:
+    """Run all function calls of a turn concurrently; the parts keep the order of the calls."""
+    if len(tools) == 1:
+        return [call_tool(tools[0])]
+    with ThreadPoolExecutor(max_workers=min(TOOL_WORKERS, len(tools))) as pool:
+        return list(pool.map(call_tool, tools))
+
+
+def Agent(user_prompt, chat_session=None):
+    chat_session = chat_session or get_chat()
     prompt = mission_prompt(user_prompt)
-    response = chat.send_message(prompt)
+    response = chat_session.send_message(prompt)
     tools = response.candidates[0].function_calls
     while tools:
-        for tool in tools:
-            function_res = CallableFunctions[tool.name](**tool.args)
-            response = chat.send_message(Content(role="function_response",parts=[Part.from_function_response(name=tool.name, response={"result": function_res})]))
+        # All function responses of the turn go back in one message, i.e. one model roundtrip
+        response = chat_session.send_message(Content(role="function_response", parts=run_tools(tools)))
         tools = response.candidates[0].function_calls
     return response.text
 
 
-response1 = Agent("Hello")
-print(response1)
+if __name__ == "__main__":
+    response = get_chat().send_message("Hello")
+    print(response.text)
+
+    response1 = Agent("Hello")
+    print(response1)
 
-response2 = Agent("What events are there to do in Atlanta, Georgia?")
-print(response2)
+    response2 = Agent("What events are there to do in Atlanta, Georgia?")
+    print(response2)
 
-response3 = Agent("Are there any hotel avaiable in Midtown Atlanta for this weekend?")
-print(response3)
+    response3 = Agent("Are there any hotel avaiable in Midtown Atlanta for this weekend?")
+    print(response3)
+    print(f"SerpAPI cache: {serp.cache.stats()}")
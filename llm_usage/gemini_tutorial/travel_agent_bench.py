@@ -0,0 +1,105 @@
+"""
+Time the travel_agent tool loop against the SerpAPI stub, without Vertex AI.
+
+A scripted chat stands in for the model: the first reply asks for `event_api` and `hotel_api`
+in the same turn, the next one answers with text. Each send_message sleeps `--model-latency`.
+- serial: the previous loop, one tool at a time and one send_message per function response
+- concurrent: travel_agent.Agent, tools on a thread pool and all responses in one message
+Both run with the response cache off. Then:
+- cached: the same turns with the cache on (the first turn misses, the rest hit), plus stats
+- pooling: sequential searches through bare requests.get vs the pooled session (no latency)
+
+Run
+  python travel_agent_bench.py --serp-latency 0.8 --model-latency 0.5
+"""
+
+import argparse
+import os
+import time
+from types import SimpleNamespace
+
+import requests
+
+from serpapi_stub import start_serpapi_stub
+
+
+class ScriptedChat:
+    """Chat session that requests both tools once, then answers; counts model roundtrips."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.roundtrips = 0
+        self.pending_calls = 0
+
+    def _reply(self, function_calls, text=""):
+        return SimpleNamespace(candidates=[SimpleNamespace(function_calls=function_calls)], text=text)
+
+    def send_message(self, content):
+        time.sleep(self.latency)
+        self.roundtrips += 1
+        if isinstance(content, str):
+            calls = [
+                SimpleNamespace(name="event_api", args={"query": "Events in Atlanta, GA", "htichips": "date:weekend"}),
+                SimpleNamespace(name="hotel_api", args={"query": "Midtown Atlanta", "check_in_date": "2026-10-24",
+                                                        "check_out_date": "2026-10-25"}),
+            ]
+            self.pending_calls = len(calls)
+            return self._reply(calls)
+        self.pending_calls -= len(content.parts)
+        # The model only answers once it has every function response of its turn
+        return self._reply([] if self.pending_calls <= 0 else None, "Here are events and hotels in Atlanta.")
+
+
+def serial_agent(travel_agent, chat_session, user_prompt):
+    """The loop before concurrent tool calls."""
+    from vertexai.preview.generative_models import Content, Part
+
+    response = chat_session.send_message(travel_agent.mission_prompt(user_prompt))
+    tools = response.candidates[0].function_calls
+    while tools:
+        for tool in tools:
+            function_res = travel_agent.CallableFunctions[tool.name](**tool.args)
+            response = chat_session.send_message(Content(role="function_response", parts=[
+                Part.from_function_response(name=tool.name, response={"result": function_res})]))
+        tools = response.candidates[0].function_calls
+    return response.text
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--serp-latency", type=float, default=0.8)
+    ap.add_argument("--model-latency", type=float, default=0.5)
+    ap.add_argument("--turns", type=int, default=3)
+    args = ap.parse_args()
+
+    server, url = start_serpapi_stub(latency=args.serp_latency)
+    os.environ["SERP_API_URL"] = url
+    import travel_agent
+
+    prompt = "What events and hotels are there in Atlanta this weekend?"
+    cache, travel_agent.serp.cache = travel_agent.serp.cache, None
+    for label, run in (("serial", lambda chat: serial_agent(travel_agent, chat, prompt)),
+                       ("concurrent", lambda chat: travel_agent.Agent(prompt, chat)),
+                       ("cached", lambda chat: travel_agent.Agent(prompt, chat))):
+        if label == "cached":
+            travel_agent.serp.cache = cache
+        server.stats.clear()
+        chat = ScriptedChat(args.model_latency)
+        t0 = time.perf_counter()
+        for _ in range(args.turns):
+            run(chat)
+        per_turn = (time.perf_counter() - t0) / args.turns
+        print(f"{label:<11} {per_turn:6.2f} s/turn   {chat.roundtrips / args.turns:.0f} model roundtrips/turn   "
+              f"serpapi calls {dict(server.stats)}")
+    print(f"cache stats {cache.stats()}")
+
+    server.latency = 0.0
+    calls = 200
+    params = {"engine": "google_events", "q": "Events in Atlanta, GA", "htichips": "date:today"}
+    travel_agent.serp.cache = None
+    for label, get in (("requests.get", lambda: requests.get(url, params=params).json()),
+                       ("pooled session", lambda: travel_agent.serp.search(**params))):
+        t0 = time.perf_counter()
+        for _ in range(calls):
+            get()
+        print(f"{label:<15} {(time.perf_counter() - t0) / calls * 1000:6.2f} ms/search")
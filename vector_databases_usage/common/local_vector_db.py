@@ -0,0 +1,258 @@
+"""
+In-process VectorDB backend for local development and load tests.
+
+Each collection/namespace is a contiguous float32 matrix that grows geometrically, plus the
+ids and payloads of its rows. A query is one matrix product (a matrix-matrix product for
+`query_batch`) and `argpartition` for the top k. Filters build a boolean mask of rows from
+per-field indexes (rows of each value, values as floats) that are cached until the next write. When the filter is selective, only the
+matching rows are scored. Upserting an existing id overwrites its row in place. Deleted rows
+are masked and compacted once they make up half of the matrix.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from vector_db import Filter, Hit, VectorDB, filter_clauses
+
+METRICS = ("cosine", "dot", "euclidean")
+
+
+def value_key(value: Any) -> Tuple[bool, Any]:
+    # True == 1 and False == 0 in Python, but Qdrant and Pinecone treat booleans and numbers as
+    # different types, so equality and membership look values up with their bool-ness
+    return isinstance(value, bool), value
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indexes of the k highest scores along the last axis, best first."""
+    n = scores.shape[-1]
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(scores.shape[:-1] + (0,), dtype=np.int64)
+    idx = np.argpartition(-scores, k - 1, axis=-1)[..., :k] if k < n else np.broadcast_to(np.arange(n), scores.shape)
+    order = np.argsort(-np.take_along_axis(scores, idx, axis=-1), axis=-1, kind="stable")
+    return np.take_along_axis(idx, order, axis=-1)
+
+
+class Space:
+    """The vectors of one namespace of one collection."""
+
+    def __init__(self, dim: int, metric: str):
+        self.dim = dim
+        self.metric = metric
+        self.matrix = np.empty((0, dim), dtype=np.float32)
+        self.sq_norms = np.empty(0, dtype=np.float32)
+        self.alive = np.empty(0, dtype=bool)
+        self.size = 0
+        self.dead = 0
+        self.ids: List[Optional[str]] = []
+        self.payloads: List[Dict[str, Any]] = []
+        self.row_of: Dict[str, int] = {}
+        self._columns: Dict[str, Tuple[Dict[Any, np.ndarray], np.ndarray]] = {}
+
+    @property
+    def count(self) -> int:
+        return self.size - self.dead
+
+    def _reserve(self, needed: int) -> None:
+        if needed <= len(self.matrix):
+            return
+        capacity = max(needed, 2 * len(self.matrix), 64)
+        for name, dtype in (("matrix", np.float32), ("sq_norms", np.float32), ("alive", bool)):
+            old = getattr(self, name)
+            grown = np.zeros((capacity,) + old.shape[1:], dtype=dtype)
+            grown[:self.size] = old[:self.size]
+            setattr(self, name, grown)
+
+    def upsert(self, ids: Sequence[str], vectors: np.ndarray, payloads: Sequence[Dict[str, Any]]) -> None:
+        rows = np.empty(len(ids), dtype=np.int64)
+        new = 0
+        for i, (record_id, payload) in enumerate(zip(ids, payloads)):
+            row = self.row_of.get(record_id)
+            if row is None:
+                row = self.size + new
+                self.row_of[record_id] = row
+                self.ids.append(record_id)
+                self.payloads.append(payload)
+                new += 1
+            else:
+                self.payloads[row] = payload
+            rows[i] = row
+        self._reserve(self.size + new)
+        self.matrix[rows] = vectors
+        self.sq_norms[rows] = np.einsum("ij,ij->i", vectors, vectors)
+        self.alive[rows] = True
+        self.size += new
+        self._columns.clear()
+
+    def delete(self, ids: Sequence[str]) -> None:
+        for record_id in ids:
+            row = self.row_of.pop(record_id, None)
+            if row is not None:
+                self.alive[row] = False
+                self.ids[row] = None
+                self.payloads[row] = {}
+                self.dead += 1
+        self._columns.clear()
+        if self.dead and self.dead * 2 >= self.size:
+            self._compact()
+
+    def _compact(self) -> None:
+        keep = np.flatnonzero(self.alive[:self.size])
+        self.matrix = np.ascontiguousarray(self.matrix[keep])
+        self.sq_norms = self.sq_norms[keep]
+        self.alive = np.ones(len(keep), dtype=bool)
+        self.ids = [self.ids[r] for r in keep]
+        self.payloads = [self.payloads[r] for r in keep]
+        self.row_of = {record_id: row for row, record_id in enumerate(self.ids)}
+        self.size, self.dead = len(keep), 0
+
+    # -- filters ---------------------------------------------------------------
+
+    def _column(self, name: str) -> Tuple[Dict[Any, np.ndarray], np.ndarray]:
+        # Per field: rows of each value keyed by value_key (equality, membership) and values as floats (ranges)
+        if name not in self._columns:
+            groups: Dict[Any, List[int]] = {}
+            numbers = np.full(self.size, np.nan)
+            for row, payload in enumerate(self.payloads):
+                value = payload.get(name)
+                if value is None:
+                    continue
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    numbers[row] = value
+                try:
+                    groups.setdefault(value_key(value), []).append(row)
+                except TypeError:
+                    pass  # unhashable (list) values only take part in range filters
+            self._columns[name] = ({v: np.asarray(rows) for v, rows in groups.items()}, numbers)
+        return self._columns[name]
+
+    def _compare(self, name: str, op: str, operand: Any) -> np.ndarray:
+        groups, numbers = self._column(name)
+        if op in ("$eq", "$ne", "$in", "$nin"):
+            mask = np.zeros(self.size, dtype=bool)
+            for value in ([operand] if op in ("$eq", "$ne") else operand):
+                rows = groups.get(value_key(value))
+                if rows is not None:
+                    mask[rows] = True
+            return mask if op in ("$eq", "$in") else ~mask
+        with np.errstate(invalid="ignore"):
+            return {"$gt": numbers > operand, "$gte": numbers >= operand,
+                    "$lt": numbers < operand, "$lte": numbers <= operand}[op]
+
+    def _evaluate(self, flt: Filter) -> np.ndarray:
+        mask = np.ones(self.size, dtype=bool)
+        for clause in filter_clauses(flt):
+            if clause[0] == "and":
+                for sub in clause[1]:
+                    mask &= self._evaluate(sub)
+            elif clause[0] == "or":
+                mask &= np.logical_or.reduce([self._evaluate(sub) for sub in clause[1]])
+            else:
+                mask &= self._compare(*clause)
+        return mask
+
+    def mask(self, flt: Optional[Filter]) -> np.ndarray:
+        mask = self.alive[:self.size].copy()
+        if flt:
+            mask &= self._evaluate(flt)
+        return mask
+
+    # -- search ----------------------------------------------------------------
+
+    def search(self, queries: np.ndarray, top: int, flt: Optional[Filter]) -> List[List[Tuple[int, float]]]:
+        mask = self.mask(flt)
+        matching = None if mask.all() else np.flatnonzero(mask)
+        # Selective filter: gather and score only the matching rows; otherwise score all rows
+        # and push the others out of the top k
+        gathered = matching is not None and len(matching) <= self.size // 2
+        rows = matching if gathered else slice(0, self.size)
+        matrix, sq_norms = self.matrix[rows], self.sq_norms[rows]
+        scores = queries @ matrix.T
+        if self.metric == "euclidean":
+            sq_dist = sq_norms[None, :] - 2 * scores + np.einsum("ij,ij->i", queries, queries)[:, None]
+            scores = -np.sqrt(np.maximum(sq_dist, 0))
+        if matching is not None and not gathered:
+            scores[:, ~mask] = -np.inf
+        best = top_k(scores, top)
+        out = []
+        for q_best, q_scores in zip(best, np.take_along_axis(scores, best, axis=-1)):
+            keep = np.isfinite(q_scores)
+            found = matching[q_best[keep]] if gathered else q_best[keep]
+            out.append(list(zip(found.tolist(), q_scores[keep].tolist())))
+        return out
+
+
+class LocalVectorDB(VectorDB):
+    def __init__(self):
+        self.collections: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+    def create_collection(self, name: str, dim: int, metric: str = "cosine") -> None:
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric!r}, expected one of {METRICS}")
+        with self._lock:
+            self.collections[name] = {"dim": dim, "metric": metric, "spaces": {}}
+
+    def delete_collection(self, name: str) -> None:
+        with self._lock:
+            self.collections.pop(name, None)
+
+    def has_collection(self, name: str) -> bool:
+        return name in self.collections
+
+    def _space(self, collection: str, namespace: str, create: bool = False) -> Optional[Space]:
+        try:
+            info = self.collections[collection]
+        except KeyError:
+            raise KeyError(f"Collection {collection!r} does not exist") from None
+        space = info["spaces"].get(namespace)
+        if space is None and create:
+            space = info["spaces"][namespace] = Space(info["dim"], info["metric"])
+        return space
+
+    def _prepare(self, collection: str, vectors: Sequence[Sequence[float]]) -> np.ndarray:
+        info = self.collections[collection]
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, info["dim"])
+        if info["metric"] == "cosine":
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            vectors = vectors / norms
+        return vectors
+
+    def upsert(self, collection: str, ids: Sequence[str], vectors: Sequence[Sequence[float]],
+               payloads: Optional[Sequence[Dict[str, Any]]] = None, namespace: str = "") -> None:
+        vectors = self._prepare(collection, vectors)
+        if len(vectors) != len(ids):
+            raise ValueError(f"{len(ids)} ids but {len(vectors)} vectors")
+        payloads = payloads if payloads is not None else [{} for _ in ids]
+        with self._lock:
+            self._space(collection, namespace, create=True).upsert([str(i) for i in ids], vectors, payloads)
+
+    def query_batch(self, collection: str, vectors: Sequence[Sequence[float]], top_k: int = 10,
+                    flt: Optional[Filter] = None, namespace: str = "", with_payload: bool = True) -> List[List[Hit]]:
+        queries = self._prepare(collection, vectors)
+        with self._lock:
+            space = self._space(collection, namespace)
+            if space is None or space.count == 0:
+                return [[] for _ in queries]
+            results = space.search(queries, top_k, flt)
+            return [[Hit(space.ids[row], score, dict(space.payloads[row]) if with_payload else {})
+                     for row, score in hits] for hits in results]
+
+    def query(self, collection: str, vector: Sequence[float], top_k: int = 10, flt: Optional[Filter] = None,
+              namespace: str = "", with_payload: bool = True) -> List[Hit]:
+        return self.query_batch(collection, [vector], top_k, flt, namespace, with_payload)[0]
+
+    def delete(self, collection: str, ids: Sequence[str], namespace: str = "") -> None:
+        with self._lock:
+            space = self._space(collection, namespace)
+            if space is not None:
+                space.delete([str(i) for i in ids])
+
+    def count(self, collection: str, namespace: str = "") -> int:
+        with self._lock:
+            space = self._space(collection, namespace)
+            return space.count if space is not None else 0
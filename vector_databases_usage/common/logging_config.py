@@ -0,0 +1,167 @@
+"""
+Shared logger for the vector database samples. Scripts in qdrant/ and pinecone_tutorial/ put
+this directory on sys.path and `from logging_config import logger`.
+
+Log calls only put the record on a queue; a QueueListener thread formats it and writes it to
+a size-rotated file, so disk I/O never runs on the request path.
+- The message is formatted on the listener thread, not by the caller. Pass large payloads as
+  arguments, `logger.debug("results %s", results)` or `logger.debug(results)`, not in an
+  f-string; `str()` then runs in the background, and not at all if the level is disabled.
+  Objects passed this way should not be mutated after the call. `lazy(fn)` defers any
+  other computation (e.g. a json.dumps) in the same way.
+- LOG_FORMAT=json writes one JSON object per line instead of text.
+
+Environment: LOG_FILE (shared_log_file.log), LOG_LEVEL (DEBUG; an unknown name falls back to
+INFO with a warning), LOG_FORMAT (text | json), LOG_MAX_BYTES (10 MB), LOG_BACKUP_COUNT (5).
+
+Run (per-call cost on the caller thread, queue vs a synchronous FileHandler)
+  python logging_config.py
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Callable, Optional, Tuple
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+class lazy:
+    """Argument whose value is computed only when the record is written."""
+
+    __slots__ = ("fn",)
+
+    def __init__(self, fn: Callable[[], Any]):
+        self.fn = fn
+
+    def __str__(self) -> str:
+        return str(self.fn())
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "logger": record.name,
+            "level": record.levelname,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the listener.
+
+    The stock `prepare()` formats the message on the caller thread so records can be pickled
+    across processes; this queue never leaves the process.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def file_handler(path: str, fmt: str = "text", max_bytes: int = 10 * 1024 * 1024,
+                 backup_count: int = 5) -> logging.Handler:
+    handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8",
+                                  delay=True)
+    handler.setFormatter(JsonFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT))
+    return handler
+
+
+def parse_level(value: Optional[str], default: int = logging.DEBUG) -> Tuple[int, bool]:
+    """(level, valid) for a LOG_LEVEL value: a level name or number; unknown values give INFO."""
+    if not value:
+        return default, True
+    value = value.strip()
+    if value.isdigit():
+        return int(value), True
+    # getLevelName maps known names to their number and anything else to the string "Level ..."
+    level = logging.getLevelName(value.upper())
+    if isinstance(level, int):
+        return level, True
+    return logging.INFO, False
+
+
+def setup_logger(name: str, handler: logging.Handler, level: int = logging.DEBUG) -> Optional[QueueListener]:
+    """Route `name` through a queue to `handler`; returns the started listener (None if already set up)."""
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    if logger.handlers:
+        return None
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    logger.addHandler(DeferredQueueHandler(log_queue))
+    logger.propagate = False
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    # Write out what is still queued when the program exits
+    atexit.register(listener.stop)
+    return listener
+
+
+# Create or get the logger
+logger = logging.getLogger("shared_logger")
+_level, _level_ok = parse_level(os.environ.get("LOG_LEVEL"))
+setup_logger(
+    "shared_logger",
+    file_handler(os.environ.get("LOG_FILE", "shared_log_file.log"), os.environ.get("LOG_FORMAT", "text"),
+                 int(os.environ.get("LOG_MAX_BYTES", 10 * 1024 * 1024)), int(os.environ.get("LOG_BACKUP_COUNT", 5))),
+    _level,
+)
+if not _level_ok:
+    logger.warning("Unknown LOG_LEVEL %r, using INFO", os.environ.get("LOG_LEVEL"))
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    import numpy as np
+
+    # A search response sized like the samples' logged results
+    payload = [{"id": f"rec{i}", "score": 0.5 + i / 1000, "fields": {"category": "history", "chunk_text": "x" * 200}}
+               for i in range(50)]
+    calls = 2000
+
+    def per_call_us(log: logging.Logger, message: Callable[[int], None]) -> np.ndarray:
+        times = np.empty(calls)
+        for i in range(calls):
+            t0 = time.perf_counter()
+            message(i)
+            times[i] = (time.perf_counter() - t0) * 1e6
+        return times
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, fmt, queued in (("sync FileHandler", "text", False), ("queue", "text", True),
+                                   ("queue, json", "json", True)):
+            name = f"bench.{label}"
+            handler = file_handler(os.path.join(tmp, f"{label}.log"), fmt)
+            if queued:
+                listener = setup_logger(name, handler)
+            else:
+                logging.getLogger(name).addHandler(handler)
+                logging.getLogger(name).setLevel(logging.DEBUG)
+                listener = None
+            log = logging.getLogger(name)
+            log.propagate = False
+            print(f"{label}")
+            for case, message in (
+                ("short message", lambda i: log.info("query %d done", i)),
+                ("search result", lambda i: log.debug("results %s", payload)),
+                ("f-string result", lambda i: log.debug(f"results {payload}")),
+            ):
+                t = per_call_us(log, message)
+                print(f"  {case:<16} mean {t.mean():7.1f} us   p50 {np.percentile(t, 50):7.1f} us   "
+                      f"p99 {np.percentile(t, 99):7.1f} us")
+            if listener:
+                t0 = time.perf_counter()
+                atexit.unregister(listener.stop)
+                listener.stop()
+                print(f"  listener drained the queue in {time.perf_counter() - t0:.2f}s")
+            handler.close()
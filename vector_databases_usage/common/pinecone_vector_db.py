@@ -0,0 +1,90 @@
+"""
+VectorDB backend over Pinecone: one serverless index per collection, Pinecone namespaces as
+namespaces, payloads as metadata. Filters are already in Pinecone's syntax and are only checked
+(`check_filter`) so they fail the same way as on the other backends. Pinecone has no
+multi-vector query, so `query_batch` runs the queries on a thread pool.
+
+Setup
+  pip install pinecone
+  export PINECONE_API_KEY=...
+"""
+
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+from pinecone import Pinecone, ServerlessSpec
+
+from vector_db import Filter, Hit, VectorDB, check_filter
+
+PINECONE_METRICS = {"cosine": "cosine", "dot": "dotproduct", "euclidean": "euclidean"}
+
+
+class PineconeVectorDB(VectorDB):
+    def __init__(self, api_key: Optional[str] = None, cloud: str = "aws", region: str = "us-east-1",
+                 batch_size: int = 200, query_workers: int = 8):
+        self.pc = Pinecone(api_key=api_key or os.environ["PINECONE_API_KEY"])
+        self.spec = ServerlessSpec(cloud=cloud, region=region)
+        self.batch_size = batch_size
+        self.query_workers = query_workers
+        self._metrics: Dict[str, str] = {}
+        self._indexes: Dict[str, Any] = {}
+
+    def _index(self, collection: str):
+        if collection not in self._indexes:
+            self._indexes[collection] = self.pc.Index(collection)
+        return self._indexes[collection]
+
+    def _metric(self, collection: str) -> str:
+        if collection not in self._metrics:
+            self._metrics[collection] = self.pc.describe_index(collection)["metric"]
+        return self._metrics[collection]
+
+    def create_collection(self, name: str, dim: int, metric: str = "cosine") -> None:
+        self.pc.create_index(name=name, dimension=dim, metric=PINECONE_METRICS[metric], spec=self.spec)
+        self._metrics[name] = PINECONE_METRICS[metric]
+
+    def delete_collection(self, name: str) -> None:
+        self.pc.delete_index(name)
+        self._indexes.pop(name, None)
+        self._metrics.pop(name, None)
+
+    def has_collection(self, name: str) -> bool:
+        return self.pc.has_index(name)
+
+    def upsert(self, collection: str, ids: Sequence[str], vectors: Sequence[Sequence[float]],
+               payloads: Optional[Sequence[Dict[str, Any]]] = None, namespace: str = "") -> None:
+        payloads = payloads if payloads is not None else [{} for _ in ids]
+        index = self._index(collection)
+        for i in range(0, len(ids), self.batch_size):
+            batch = [{"id": str(record_id), "values": [float(x) for x in vector], "metadata": payload}
+                     for record_id, vector, payload in zip(ids[i:i + self.batch_size],
+                                                           vectors[i:i + self.batch_size],
+                                                           payloads[i:i + self.batch_size])]
+            index.upsert(vectors=batch, namespace=namespace)
+
+    def query(self, collection: str, vector: Sequence[float], top_k: int = 10, flt: Optional[Filter] = None,
+              namespace: str = "", with_payload: bool = True) -> List[Hit]:
+        if flt:
+            check_filter(flt)
+        response = self._index(collection).query(vector=[float(x) for x in vector], top_k=top_k, filter=flt or None,
+                                                  namespace=namespace, include_metadata=with_payload)
+        euclidean = self._metric(collection) == "euclidean"
+        # Pinecone returns the squared distance for euclidean indexes; Hit scores are "higher is better"
+        return [Hit(m["id"], -math.sqrt(max(m["score"], 0.0)) if euclidean else m["score"],
+                    dict(m.get("metadata") or {})) for m in response["matches"]]
+
+    def query_batch(self, collection: str, vectors: Sequence[Sequence[float]], top_k: int = 10,
+                    flt: Optional[Filter] = None, namespace: str = "", with_payload: bool = True) -> List[List[Hit]]:
+        with ThreadPoolExecutor(max_workers=self.query_workers) as pool:
+            return list(pool.map(lambda v: self.query(collection, v, top_k, flt, namespace, with_payload), vectors))
+
+    def delete(self, collection: str, ids: Sequence[str], namespace: str = "") -> None:
+        index = self._index(collection)
+        for i in range(0, len(ids), 1000):
+            index.delete(ids=[str(x) for x in ids[i:i + 1000]], namespace=namespace)
+
+    def count(self, collection: str, namespace: str = "") -> int:
+        summary = self._index(collection).describe_index_stats()["namespaces"].get(namespace)
+        return summary["vector_count"] if summary else 0
@@ -0,0 +1,151 @@
+"""
+VectorDB backend over Qdrant.
+
+Qdrant has collections but no namespaces and only accepts integer or UUID point ids, so each
+point gets a UUID derived from (namespace, id), and both values are stored in the payload as
+`_namespace` / `_id`. `_namespace` is a keyword payload index, so namespace filtering does not
+scan. Pinecone-style filters are translated to `models.Filter`. `query_batch` is one
+`query_batch_points` call.
+
+Setup
+  pip install qdrant-client
+  export QDRANT_HOST_ADDRESS=...  QDRANT_API_KEY=...
+"""
+
+import os
+import uuid
+from typing import Any, Dict, List, Optional, Sequence
+
+from qdrant_client import QdrantClient, models
+
+from vector_db import Filter, Hit, VectorDB, filter_clauses
+
+QDRANT_METRICS = {"cosine": models.Distance.COSINE, "dot": models.Distance.DOT,
+                  "euclidean": models.Distance.EUCLID}
+NAMESPACE_FIELD = "_namespace"
+ID_FIELD = "_id"
+RANGE_OPS = {"$gt": "gt", "$gte": "gte", "$lt": "lt", "$lte": "lte"}
+
+
+def point_id(namespace: str, record_id: str) -> str:
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"{namespace}/{record_id}"))
+
+
+def to_qdrant_filter(flt: Optional[Filter], namespace: Optional[str] = None) -> Optional[models.Filter]:
+    must: List[Any] = []
+    must_not: List[Any] = []
+    if namespace is not None:
+        must.append(models.FieldCondition(key=NAMESPACE_FIELD, match=models.MatchValue(value=namespace)))
+    for clause in filter_clauses(flt or {}):
+        if clause[0] == "and":
+            # An empty sub filter ({}) matches everything, so it drops out of $and
+            must.extend(sub for sub in map(to_qdrant_filter, clause[1]) if sub is not None)
+        elif clause[0] == "or":
+            should = [to_qdrant_filter(sub) for sub in clause[1]]
+            # ... and makes the whole $or match everything
+            if None not in should:
+                must.append(models.Filter(should=should))
+        else:
+            key, op, operand = clause
+            if op == "$eq":
+                must.append(models.FieldCondition(key=key, match=models.MatchValue(value=operand)))
+            elif op == "$ne":
+                must_not.append(models.FieldCondition(key=key, match=models.MatchValue(value=operand)))
+            elif op == "$in":
+                must.append(models.FieldCondition(key=key, match=models.MatchAny(any=list(operand))))
+            elif op == "$nin":
+                must_not.append(models.FieldCondition(key=key, match=models.MatchAny(any=list(operand))))
+            else:
+                must.append(models.FieldCondition(key=key, range=models.Range(**{RANGE_OPS[op]: operand})))
+    if not must and not must_not:
+        return None
+    return models.Filter(must=must or None, must_not=must_not or None)
+
+
+class QdrantVectorDB(VectorDB):
+    def __init__(self, client: Optional[QdrantClient] = None, batch_size: int = 256):
+        self.client = client or QdrantClient(host=os.environ["QDRANT_HOST_ADDRESS"],
+                                             api_key=os.environ["QDRANT_API_KEY"])
+        self.batch_size = batch_size
+        self._metrics: Dict[str, str] = {}
+
+    def _metric(self, collection: str) -> str:
+        if collection not in self._metrics:
+            params = self.client.get_collection(collection).config.params.vectors
+            self._metrics[collection] = {v: k for k, v in QDRANT_METRICS.items()}[params.distance]
+        return self._metrics[collection]
+
+    def create_collection(self, name: str, dim: int, metric: str = "cosine") -> None:
+        self.client.create_collection(
+            collection_name=name,
+            vectors_config=models.VectorParams(size=dim, distance=QDRANT_METRICS[metric]),
+        )
+        self.client.create_payload_index(name, NAMESPACE_FIELD, field_schema=models.PayloadSchemaType.KEYWORD)
+        self._metrics[name] = metric
+
+    def delete_collection(self, name: str) -> None:
+        self.client.delete_collection(name)
+        self._metrics.pop(name, None)
+
+    def has_collection(self, name: str) -> bool:
+        return self.client.collection_exists(name)
+
+    def upsert(self, collection: str, ids: Sequence[str], vectors: Sequence[Sequence[float]],
+               payloads: Optional[Sequence[Dict[str, Any]]] = None, namespace: str = "") -> None:
+        payloads = payloads if payloads is not None else [{} for _ in ids]
+        for i in range(0, len(ids), self.batch_size):
+            points = [
+                models.PointStruct(id=point_id(namespace, str(record_id)), vector=[float(x) for x in vector],
+                                   payload={**payload, ID_FIELD: str(record_id), NAMESPACE_FIELD: namespace})
+                for record_id, vector, payload in zip(ids[i:i + self.batch_size], vectors[i:i + self.batch_size],
+                                                      payloads[i:i + self.batch_size])
+            ]
+            self.client.upsert(collection_name=collection, points=points, wait=True)
+
+    def _hits(self, collection: str, points) -> List[Hit]:
+        # Qdrant returns a distance for EUCLID; Hit scores are "higher is better"
+        sign = -1.0 if self._metric(collection) == "euclidean" else 1.0
+        hits = []
+        for p in points:
+            payload = dict(p.payload or {})
+            record_id = payload.pop(ID_FIELD, str(p.id))
+            payload.pop(NAMESPACE_FIELD, None)
+            hits.append(Hit(record_id, sign * p.score, payload))
+        return hits
+
+    def query(self, collection: str, vector: Sequence[float], top_k: int = 10, flt: Optional[Filter] = None,
+              namespace: str = "", with_payload: bool = True) -> List[Hit]:
+        # The payload is always fetched because it carries the original id
+        points = self.client.query_points(
+            collection_name=collection, query=[float(x) for x in vector], limit=top_k,
+            query_filter=to_qdrant_filter(flt, namespace), with_payload=True,
+        ).points
+        hits = self._hits(collection, points)
+        if not with_payload:
+            for hit in hits:
+                hit.payload = {}
+        return hits
+
+    def query_batch(self, collection: str, vectors: Sequence[Sequence[float]], top_k: int = 10,
+                    flt: Optional[Filter] = None, namespace: str = "", with_payload: bool = True) -> List[List[Hit]]:
+        query_filter = to_qdrant_filter(flt, namespace)
+        requests = [models.QueryRequest(query=[float(x) for x in v], limit=top_k, filter=query_filter,
+                                        with_payload=True) for v in vectors]
+        responses = self.client.query_batch_points(collection_name=collection, requests=requests)
+        results = [self._hits(collection, r.points) for r in responses]
+        if not with_payload:
+            for hits in results:
+                for hit in hits:
+                    hit.payload = {}
+        return results
+
+    def delete(self, collection: str, ids: Sequence[str], namespace: str = "") -> None:
+        self.client.delete(
+            collection_name=collection,
+            points_selector=models.PointIdsList(points=[point_id(namespace, str(i)) for i in ids]),
+            wait=True,
+        )
+
+    def count(self, collection: str, namespace: str = "") -> int:
+        return self.client.count(collection_name=collection, count_filter=to_qdrant_filter(None, namespace),
+                                 exact=True).count
@@ -0,0 +1,88 @@
+"""
+One vector database interface for the Pinecone and Qdrant samples and for local load tests.
+
+Backends
+- LocalVectorDB (local_vector_db.py): in-process, NumPy matrix per collection/namespace
+- PineconeVectorDB (pinecone_vector_db.py): a Pinecone serverless index per collection
+- QdrantVectorDB (qdrant_vector_db.py): a Qdrant collection; namespaces are a payload field
+
+Filters use Pinecone's metadata filter syntax on payload fields, e.g.
+    {"city": "Berlin"}
+    {"city": {"$in": ["Berlin", "London"]}, "population": {"$gte": 1_000_000}}
+    {"$or": [{"city": "Berlin"}, {"country": "UK"}]}
+Operators: $eq $ne $in $nin $gt $gte $lt $lte, combined with $and / $or (a dict with
+several fields is an implicit $and). An empty filter {} matches everything, also inside
+$and / $or; an empty $and / $or list is rejected with ValueError by every backend.
+
+vector_db_bench.py runs the same workloads against any backend.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+Filter = Dict[str, Any]
+COMPARISONS = ("$eq", "$ne", "$in", "$nin", "$gt", "$gte", "$lt", "$lte")
+
+
+@dataclass
+class Hit:
+    id: str
+    score: float
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+def filter_clauses(flt: Filter) -> List[tuple]:
+    """Flatten one filter level into ("and"/"or", [sub filters]) or (field, op, value) clauses."""
+    clauses = []
+    for key, value in flt.items():
+        if key in ("$and", "$or"):
+            if not value:
+                raise ValueError(f"Empty {key} in filter: give at least one sub filter")
+            clauses.append((key[1:], list(value)))
+        elif isinstance(value, dict):
+            for op, operand in value.items():
+                if op not in COMPARISONS:
+                    raise ValueError(f"Unsupported filter operator {op!r} on {key!r}")
+                clauses.append((key, op, operand))
+        else:
+            clauses.append((key, "$eq", value))
+    return clauses
+
+
+def check_filter(flt: Filter) -> None:
+    """Raise ValueError for the filters `filter_clauses` rejects, at any nesting level."""
+    for clause in filter_clauses(flt):
+        if clause[0] in ("and", "or"):
+            for sub in clause[1]:
+                check_filter(sub)
+
+
+class VectorDB:
+    """Base class. Scores are "higher is better" for every metric (euclidean: minus the distance)."""
+
+    def create_collection(self, name: str, dim: int, metric: str = "cosine") -> None:
+        raise NotImplementedError
+
+    def delete_collection(self, name: str) -> None:
+        raise NotImplementedError
+
+    def has_collection(self, name: str) -> bool:
+        raise NotImplementedError
+
+    def upsert(self, collection: str, ids: Sequence[str], vectors: Sequence[Sequence[float]],
+               payloads: Optional[Sequence[Dict[str, Any]]] = None, namespace: str = "") -> None:
+        raise NotImplementedError
+
+    def query(self, collection: str, vector: Sequence[float], top_k: int = 10, flt: Optional[Filter] = None,
+              namespace: str = "", with_payload: bool = True) -> List[Hit]:
+        raise NotImplementedError
+
+    def query_batch(self, collection: str, vectors: Sequence[Sequence[float]], top_k: int = 10,
+                    flt: Optional[Filter] = None, namespace: str = "", with_payload: bool = True) -> List[List[Hit]]:
+        return [self.query(collection, v, top_k, flt, namespace, with_payload) for v in vectors]
+
+    def delete(self, collection: str, ids: Sequence[str], namespace: str = "") -> None:
+        raise NotImplementedError
+
+    def count(self, collection: str, namespace: str = "") -> int:
+        raise NotImplementedError
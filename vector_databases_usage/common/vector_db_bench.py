@@ -0,0 +1,107 @@
+"""
+Run the same ingestion and query workloads against any VectorDB backend.
+
+Workloads
+  upsert          N random vectors with a `city` and `year` payload, in batches
+  query           single unfiltered queries, one at a time
+  query+filter    single queries filtered on city (about 1/8 of the points) and a year range
+  query_batch     the same queries, `--batch` vectors per call
+
+Each reports throughput and, for queries, p50/p99 latency per call.
+
+Run
+  python vector_db_bench.py                                   # local backend
+  python vector_db_bench.py --backend qdrant-memory --n 20000
+  python vector_db_bench.py --backend qdrant --n 100000 --dim 768
+  python vector_db_bench.py --backend pinecone --n 10000
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from vector_db import VectorDB
+
+CITIES = ["Berlin", "London", "Moscow", "New York", "Beijing", "Mumbai", "Paris", "Tokyo"]
+
+
+def make_backend(name: str) -> VectorDB:
+    if name == "local":
+        from local_vector_db import LocalVectorDB
+        return LocalVectorDB()
+    if name == "qdrant-memory":
+        from qdrant_client import QdrantClient
+        from qdrant_vector_db import QdrantVectorDB
+        return QdrantVectorDB(QdrantClient(":memory:"))
+    if name == "qdrant":
+        from qdrant_vector_db import QdrantVectorDB
+        return QdrantVectorDB()
+    if name == "pinecone":
+        from pinecone_vector_db import PineconeVectorDB
+        return PineconeVectorDB()
+    raise ValueError(f"Unknown backend {name!r}")
+
+
+def percentiles(times: List[float]) -> str:
+    return f"p50 {np.percentile(times, 50):8.2f} ms   p99 {np.percentile(times, 99):8.2f} ms"
+
+
+def timed_calls(calls: int, fn: Callable[[int], None]) -> List[float]:
+    times = []
+    for i in range(calls):
+        t0 = time.perf_counter()
+        fn(i)
+        times.append((time.perf_counter() - t0) * 1000)
+    return times
+
+
+def run(db: VectorDB, n: int, dim: int, batch_size: int, n_queries: int, k: int, batch: int,
+        collection: str = "bench", namespace: str = "bench") -> None:
+    rng = np.random.default_rng(0)
+    if db.has_collection(collection):
+        db.delete_collection(collection)
+    db.create_collection(collection, dim, "cosine")
+    try:
+        t0 = time.perf_counter()
+        for start in range(0, n, batch_size):
+            stop = min(start + batch_size, n)
+            vectors = rng.standard_normal((stop - start, dim)).astype(np.float32)
+            payloads = [{"city": CITIES[i % len(CITIES)], "year": 1990 + i % 35} for i in range(start, stop)]
+            db.upsert(collection, [str(i) for i in range(start, stop)], vectors, payloads, namespace=namespace)
+        seconds = time.perf_counter() - t0
+        print(f"  {'upsert':<14} {n / seconds:10.0f} upserts/s   ({n} vectors, batches of {batch_size})")
+
+        queries = rng.standard_normal((n_queries, dim)).astype(np.float32)
+        flt = {"city": "Berlin", "year": {"$gte": 2000}}
+        for label, fn in (
+            ("query", lambda i: db.query(collection, queries[i], k, namespace=namespace)),
+            ("query+filter", lambda i: db.query(collection, queries[i], k, flt, namespace=namespace)),
+        ):
+            times = timed_calls(n_queries, fn)
+            print(f"  {label:<14} {1000 * n_queries / sum(times):10.0f} queries/s   {percentiles(times)}")
+
+        calls = max(1, n_queries // batch)
+        times = timed_calls(calls, lambda i: db.query_batch(collection, queries[i * batch:(i + 1) * batch], k,
+                                                            namespace=namespace))
+        print(f"  {'query_batch':<14} {1000 * calls * batch / sum(times):10.0f} queries/s   {percentiles(times)}"
+              f"   ({batch} per call)")
+    finally:
+        db.delete_collection(collection)
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--backend", nargs="+", default=["local"], help="local, qdrant-memory, qdrant, pinecone")
+    ap.add_argument("--n", type=int, default=100_000)
+    ap.add_argument("--dim", type=int, default=384)
+    ap.add_argument("--batch-size", type=int, default=1000, help="Vectors per upsert call")
+    ap.add_argument("--queries", type=int, default=500)
+    ap.add_argument("--k", type=int, default=10)
+    ap.add_argument("--batch", type=int, default=32, help="Queries per query_batch call")
+    args = ap.parse_args()
+
+    for backend in args.backend:
+        print(f"\n{backend}: {args.n} x {args.dim}")
+        run(make_backend(backend), args.n, args.dim, args.batch_size, args.queries, args.k, args.batch)
@@ -0,0 +1,159 @@
+"""
+Bulk loading of records into a Pinecone index with integrated embedding.
+
+- `batched_records()` cuts a record stream (any iterable, so it need not fit in memory)
+  into requests of at most `max_records` records and `max_bytes` of JSON.
+- `bulk_upsert()` sends the batches with a pool of `workers` threads. At most `2 * workers`
+  batches are in flight, so memory stays bounded. Rate limits (429), server errors and
+  connection errors are retried with exponential backoff and jitter.
+- `wait_for_count()` polls `describe_index_stats` until the namespace shows the expected
+  number of vectors. This replaces a fixed `time.sleep`.
+
+Run against the local fake (no API key needed); load time should drop as workers grow
+  python bulk_loader.py --records 100000 --workers 1 4 16 --latency 0.05
+  python bulk_loader.py --records 1000000 --workers 8 32 --latency 0.05 --failure-rate 0.01
+"""
+
+import json
+import logging
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Set
+
+logger = logging.getLogger("shared_logger")
+
+MAX_RECORDS_PER_REQUEST = 96  # upsert_records limit for integrated-embedding indexes
+MAX_BYTES_PER_REQUEST = 2 * 1024 * 1024
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def batched_records(records: Iterable[Dict[str, Any]], max_records: int = MAX_RECORDS_PER_REQUEST,
+                    max_bytes: int = MAX_BYTES_PER_REQUEST) -> Iterator[List[Dict[str, Any]]]:
+    batch: List[Dict[str, Any]] = []
+    size = 0
+    for record in records:
+        record_size = len(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+        if batch and (len(batch) == max_records or size + record_size > max_bytes):
+            yield batch
+            batch, size = [], 0
+        batch.append(record)
+        size += record_size
+    if batch:
+        yield batch
+
+
+def is_retryable(exc: Exception) -> bool:
+    return getattr(exc, "status", None) in RETRY_STATUSES or isinstance(exc, (ConnectionError, TimeoutError))
+
+
+class BulkUpsertStats:
+    def __init__(self):
+        self.records = 0
+        self.batches = 0
+        self.retries = 0
+        self.started = time.perf_counter()
+        self.seconds = 0.0
+
+    def __str__(self) -> str:
+        s = max(self.seconds, 1e-9)
+        return (f"{self.records} records in {self.batches} batches, {self.retries} retries, "
+                f"{s:.1f}s ({self.records / s:.0f} records/s)")
+
+
+def upsert_with_backoff(index, namespace: str, batch: List[Dict[str, Any]], stats: BulkUpsertStats,
+                        retries: int = 6, base_delay: float = 0.5, max_delay: float = 30.0) -> None:
+    for attempt in range(retries + 1):
+        try:
+            index.upsert_records(namespace, batch)
+            return
+        except Exception as exc:
+            if attempt == retries or not is_retryable(exc):
+                raise
+            stats.retries += 1
+            # Full jitter, so workers that were throttled together do not retry together
+            delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+            logger.warning("Upsert of %d records failed (%s), retry %d in %.2fs", len(batch), exc, attempt + 1, delay)
+            time.sleep(delay)
+
+
+def bulk_upsert(index, namespace: str, records: Iterable[Dict[str, Any]], workers: int = 8,
+                max_records: int = MAX_RECORDS_PER_REQUEST, max_bytes: int = MAX_BYTES_PER_REQUEST,
+                retries: int = 6, base_delay: float = 0.5) -> BulkUpsertStats:
+    """Upsert `records` in size-bounded batches, `workers` requests at a time. Raises the first failure."""
+    stats = BulkUpsertStats()
+    pending: Set[Future] = set()
+
+    def drain(block_until: int) -> None:
+        nonlocal pending
+        while len(pending) > block_until:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        try:
+            for batch in batched_records(records, max_records, max_bytes):
+                drain(2 * workers - 1)
+                pending.add(pool.submit(upsert_with_backoff, index, namespace, batch, stats, retries, base_delay))
+                stats.records += len(batch)
+                stats.batches += 1
+            drain(0)
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+    stats.seconds = time.perf_counter() - stats.started
+    logger.info("Upserted into %s: %s", namespace, stats)
+    return stats
+
+
+def namespace_count(stats: Any, namespace: str) -> int:
+    summary = stats["namespaces"].get(namespace)
+    return summary["vector_count"] if summary else 0
+
+
+def wait_for_count(index, namespace: str, expected: int, timeout: float = 120.0, interval: float = 0.5,
+                   max_interval: float = 5.0) -> float:
+    """Poll until `namespace` holds at least `expected` vectors; returns the seconds waited."""
+    started = time.monotonic()
+    while True:
+        count = namespace_count(index.describe_index_stats(), namespace)
+        waited = time.monotonic() - started
+        if count >= expected:
+            logger.info("%s: %d vectors visible after %.1fs", namespace, count, waited)
+            return waited
+        if waited > timeout:
+            raise TimeoutError(f"{namespace}: {count}/{expected} vectors visible after {waited:.0f}s")
+        logger.debug("%s: %d/%d vectors visible, polling again in %.1fs", namespace, count, expected, interval)
+        time.sleep(interval)
+        interval = min(interval * 1.5, max_interval)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from fake_pinecone import FakePinecone
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--records", type=int, default=100_000)
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    ap.add_argument("--latency", type=float, default=0.05, help="Seconds per fake upsert request")
+    ap.add_argument("--failure-rate", type=float, default=0.01, help="Share of requests answered with 429")
+    ap.add_argument("--visibility-delay", type=float, default=1.0)
+    args = ap.parse_args()
+
+    def records(n: int) -> Iterator[Dict[str, Any]]:
+        for i in range(n):
+            yield {"_id": f"rec{i}", "chunk_text": f"Synthetic record number {i} for the bulk loader.",
+                   "category": ("history", "science", "biology")[i % 3]}
+
+    for workers in args.workers:
+        pc = FakePinecone(latency=args.latency, failure_rate=args.failure_rate,
+                          visibility_delay=args.visibility_delay, store_records=False)
+        pc.create_index_for_model(name="bulk", cloud="aws", region="us-east-1",
+                                  embed={"model": "llama-text-embed-v2", "field_map": {"text": "chunk_text"}})
+        index = pc.Index("bulk")
+        stats = bulk_upsert(index, "bulk-ns", records(args.records), workers=workers, base_delay=0.05)
+        waited = wait_for_count(index, "bulk-ns", args.records, interval=0.2)
+        print(f"workers={workers:<3} {stats}; visible after {waited:.1f}s more")
@@ -0,0 +1,104 @@
+"""
+In-process stand-in for the parts of the Pinecone client used in this folder.
+
+FakePinecone / FakeIndex mimic `has_index`, `create_index_for_model`, `Index`, `delete_index`,
+`upsert_records`, `describe_index_stats` and `search`, with knobs for what makes a real index
+interesting to load: per-request latency, rate-limit errors (status 429), a request size limit
+and eventual consistency (records become visible in the stats after a delay).
+Search scores by word overlap with the query instead of embeddings.
+
+    pc = FakePinecone(latency=0.05, failure_rate=0.02, visibility_delay=1.0)
+"""
+
+import random
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+class FakePineconeApiException(Exception):
+    def __init__(self, status: int, reason: str):
+        super().__init__(f"({status}) {reason}")
+        self.status = status
+        self.reason = reason
+
+
+class FakeIndex:
+    def __init__(self, name: str, text_field: str = "chunk_text", latency: float = 0.0, failure_rate: float = 0.0,
+                 visibility_delay: float = 0.0, max_batch: int = 96, store_records: bool = True, seed: int = 0):
+        self.name = name
+        self.text_field = text_field
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.visibility_delay = visibility_delay
+        self.max_batch = max_batch
+        self.store_records = store_records
+        self.requests = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        # namespace -> id -> (visible_at, record)
+        self._data: Dict[str, Dict[str, Any]] = {}
+
+    def upsert_records(self, namespace: str, records: List[Dict[str, Any]]) -> None:
+        if len(records) > self.max_batch:
+            raise FakePineconeApiException(400, f"Batch size {len(records)} exceeds the maximum of {self.max_batch}")
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.requests += 1
+            if self._rng.random() < self.failure_rate:
+                raise FakePineconeApiException(429, "Too Many Requests")
+            visible_at = time.monotonic() + self.visibility_delay
+            ns = self._data.setdefault(namespace, {})
+            for record in records:
+                ns[record["_id"]] = (visible_at, record if self.store_records else None)
+
+    def _visible(self, namespace: str) -> List[Any]:
+        now = time.monotonic()
+        return [(i, r) for i, (at, r) in self._data.get(namespace, {}).items() if at <= now]
+
+    def describe_index_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            namespaces = {ns: {"vector_count": len(self._visible(ns))} for ns in self._data}
+        return {
+            "dimension": 1024,
+            "namespaces": namespaces,
+            "total_vector_count": sum(ns["vector_count"] for ns in namespaces.values()),
+        }
+
+    def search(self, namespace: str, query: Dict[str, Any], rerank: Optional[Dict[str, Any]] = None,
+               fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        words = set(re.findall(r"\w+", query["inputs"]["text"].lower()))
+        with self._lock:
+            visible = self._visible(namespace)
+        hits = []
+        for record_id, record in visible:
+            if record is None:
+                continue
+            text_words = set(re.findall(r"\w+", str(record.get(self.text_field, "")).lower()))
+            score = len(words & text_words) / (len(words) or 1)
+            hits.append({"_id": record_id, "_score": score,
+                         "fields": {k: v for k, v in record.items() if k != "_id"}})
+        hits.sort(key=lambda hit: hit["_score"], reverse=True)
+        top_n = (rerank or {}).get("top_n", query["top_k"])
+        return {"result": {"hits": hits[:min(query["top_k"], top_n)]}}
+
+
+class FakePinecone:
+    def __init__(self, api_key: Optional[str] = None, **index_options: Any):
+        self.index_options = index_options
+        self._indexes: Dict[str, FakeIndex] = {}
+
+    def has_index(self, name: str) -> bool:
+        return name in self._indexes
+
+    def create_index_for_model(self, name: str, cloud: str, region: str, embed: Dict[str, Any], **kwargs: Any) -> None:
+        text_field = embed.get("field_map", {}).get("text", "chunk_text")
+        self._indexes[name] = FakeIndex(name, text_field=text_field, **self.index_options)
+
+    def Index(self, name: str) -> FakeIndex:
+        return self._indexes[name]
+
+    def delete_index(self, name: str) -> None:
+        self._indexes.pop(name, None)
@@ -1,13 +1,21 @@
 # Import the Pinecone library
 import os
-import time
-from log_config.logging_config import logger
-# from logging_config import logger
+import sys
 
-from pinecone import Pinecone
+# The shared logger lives in ../common
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from logging_config import logger
+
+from bulk_loader import bulk_upsert, wait_for_count
+
+# PINECONE_FAKE=1 runs the sample against the in-process fake (fake_pinecone.py)
+if os.environ.get("PINECONE_FAKE"):
+    from fake_pinecone import FakePinecone as Pinecone
+else:
+    from pinecone import Pinecone
 
 # Initialize a Pinecone client with your API key
-pc = Pinecone(api_key=os.environ["PINECONE_API_KEY"])
+pc = Pinecone(api_key=os.environ.get("PINECONE_API_KEY"))
 
 # Create a dense index with integrated embedding
 index_name = "quickstart-py"
@@ -78,10 +86,10 @@ records = [
 # Target the index
 dense_index = pc.Index(index_name)
 
-# Upsert the records into a namespace
-dense_index.upsert_records("example-namespace", records)
-
-time.sleep(10)
+# Upsert the records into a namespace in size-bounded batches sent in parallel,
+# then wait until they are all visible instead of sleeping a fixed time
+bulk_upsert(dense_index, "example-namespace", records, workers=8)
+wait_for_count(dense_index, "example-namespace", len(records))
 
 # View stats for the index
 stats = dense_index.describe_index_stats()
@@ -117,7 +125,8 @@ else:
     logger.debug("No data available")
 # Print the results
 for hit in results['result']['hits']:
-        logger.info(f"id: {hit['_id']:<5} | score: {round(hit['_score'], 2):<5} | category: {hit['fields']['category']:<10} | text: {hit['fields']['chunk_text']:<50}")
+        logger.info("id: %-5s | score: %-5s | category: %-10s | text: %-50s",
+                    hit['_id'], round(hit['_score'], 2), hit['fields']['category'], hit['fields']['chunk_text'])
 
 # Delete the index
 pc.delete_index(index_name)
\ No newline at end of file
@@ -0,0 +1,238 @@
+"""
+Micro-batched Qdrant queries.
+
+Callers submit single queries from any thread and get a Future back. One worker thread
+collects them and sends up to `max_batch_size` queries per `query_batch_points` call, waiting
+at most `max_wait_ms` after the first query of a batch for more to arrive. Under load this
+means one round trip per batch instead of one per query; a lone query only waits max_wait_ms.
+
+Filters are `models.Filter` objects or the Pinecone-style dicts of common/vector_db.py,
+translated by the same `to_qdrant_filter()` as QdrantVectorDB:
+    {"city": "London"}                                # city == "London"
+    {"city": {"$in": ["Berlin", "London"]}}           # city in (...)
+    {"year": {"$gte": 2000}}                          # 2000 <= year
+Filtered fields should have a payload index (`create_payload_indexes()`), otherwise Qdrant
+has to read the payload of every candidate point.
+
+Run (single vs batched throughput and latency)
+  python qdrant_batcher.py                           # in-memory local client
+  python qdrant_batcher.py --rtt-ms 2                # plus a simulated 2 ms network round trip
+  QDRANT_HOST_ADDRESS=... QDRANT_API_KEY=... python qdrant_batcher.py --server
+The in-memory client searches in Python (and ignores payload indexes), so it is CPU-bound and
+shows only the saved per-call overhead; the round-trip savings show with a server or --rtt-ms.
+"""
+
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from qdrant_client import QdrantClient, models
+
+# Shared modules (logger, filter translation) live in ../common
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from logging_config import logger
+from qdrant_vector_db import to_qdrant_filter
+from vector_db import Filter
+
+FilterLike = Union[models.Filter, Filter, None]
+
+
+def as_filter(flt: FilterLike) -> Optional[models.Filter]:
+    if flt is None or isinstance(flt, models.Filter):
+        return flt
+    return to_qdrant_filter(flt)
+
+
+def create_payload_indexes(client: QdrantClient, collection: str,
+                           fields: Dict[str, models.PayloadSchemaType]) -> None:
+    """E.g. {"city": models.PayloadSchemaType.KEYWORD, "year": models.PayloadSchemaType.INTEGER}."""
+    for field_name, schema in fields.items():
+        client.create_payload_index(collection, field_name, field_schema=schema, wait=True)
+
+
+class QueryBatcher:
+    """Groups concurrent `submit()` calls into `query_batch_points` requests.
+
+    Use as a context manager or call `close()`, which answers the queued queries first.
+    """
+
+    _STOP = object()
+
+    def __init__(self, client: QdrantClient, collection: str, max_batch_size: int = 64,
+                 max_wait_ms: float = 2.0):
+        self.client = client
+        self.collection = collection
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.batches = 0
+        self.queries = 0
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._closed = False
+        # Held while checking _closed and queueing, so nothing lands behind _STOP unanswered
+        self._lock = threading.Lock()
+        self._worker = threading.Thread(target=self._run, name=f"qdrant-batcher-{collection}", daemon=True)
+        self._worker.start()
+
+    def submit(self, vector: Sequence[float], limit: int = 10, flt: FilterLike = None,
+               with_payload: Union[bool, Sequence[str]] = False) -> Future:
+        """Queue one query; the Future resolves to its list of ScoredPoint. Raises after `close()`."""
+        future: Future = Future()
+        request = models.QueryRequest(query=[float(x) for x in vector], limit=limit, filter=as_filter(flt),
+                                      with_payload=list(with_payload) if isinstance(with_payload, (list, tuple))
+                                      else with_payload)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("QueryBatcher is closed")
+            self._queue.put((request, future))
+        return future
+
+    def query(self, vector: Sequence[float], limit: int = 10, flt: FilterLike = None,
+              with_payload: Union[bool, Sequence[str]] = False) -> List[models.ScoredPoint]:
+        return self.submit(vector, limit, flt, with_payload).result()
+
+    def _collect(self) -> Tuple[List[Tuple[models.QueryRequest, Future]], bool]:
+        """Block for the first query, then take more until the batch is full or max_wait has passed."""
+        first = self._queue.get()
+        if first is self._STOP:
+            return [], True
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is self._STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch, stop = self._collect()
+            # Skip queries whose caller has cancelled the future
+            batch = [(request, future) for request, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            try:
+                responses = self.client.query_batch_points(collection_name=self.collection,
+                                                           requests=[request for request, _ in batch])
+            except Exception as e:
+                logger.error("Batch of %d queries on %s failed: %s", len(batch), self.collection, e)
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            if len(responses) != len(batch):
+                e = RuntimeError(f"query_batch_points returned {len(responses)} responses for {len(batch)} queries")
+                logger.error("Batch on %s failed: %s", self.collection, e)
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            self.batches += 1
+            self.queries += len(batch)
+            for (_, future), response in zip(batch, responses):
+                future.set_result(response.points)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(self._STOP)
+        self._worker.join()
+        logger.info("QueryBatcher %s: %d queries in %d batches", self.collection, self.queries, self.batches)
+
+    def __enter__(self) -> "QueryBatcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+if __name__ == "__main__":
+    import argparse
+    from concurrent.futures import ThreadPoolExecutor
+
+    import numpy as np
+
+    from qdrant_ingest import ingest
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=5_000)
+    ap.add_argument("--dim", type=int, default=128)
+    ap.add_argument("--queries", type=int, default=500)
+    ap.add_argument("--callers", type=int, default=32, help="Concurrent caller threads")
+    ap.add_argument("--max-batch-size", type=int, default=64)
+    ap.add_argument("--max-wait-ms", type=float, default=2.0)
+    ap.add_argument("--rtt-ms", type=float, default=0.0, help="Simulated network round trip per request")
+    ap.add_argument("--server", action="store_true", help="Use QDRANT_HOST_ADDRESS instead of an in-memory client")
+    args = ap.parse_args()
+
+    local = not args.server
+    client = QdrantClient(":memory:") if local else QdrantClient(host=os.environ["QDRANT_HOST_ADDRESS"],
+                                                                  api_key=os.environ["QDRANT_API_KEY"])
+    collection = "batcher_bench"
+    if client.collection_exists(collection):
+        client.delete_collection(collection)
+    client.create_collection(collection, vectors_config=models.VectorParams(size=args.dim,
+                                                                             distance=models.Distance.DOT))
+    cities = ["Berlin", "London", "Moscow", "New York", "Beijing", "Mumbai", "Paris", "Tokyo"]
+    rng = np.random.default_rng(0)
+    ingest(client, collection, rng.standard_normal((args.n, args.dim), dtype=np.float32),
+           payloads=({"city": cities[i % len(cities)], "year": 1990 + i % 35} for i in range(args.n)),
+           parallel=1 if local else 4)
+    create_payload_indexes(client, collection, {"city": models.PayloadSchemaType.KEYWORD,
+                                                "year": models.PayloadSchemaType.INTEGER})
+    queries = rng.standard_normal((args.queries, args.dim), dtype=np.float32)
+
+    # The in-memory client is not thread-safe: single queries from many threads take turns
+    client_lock = threading.Lock() if local else None
+
+    def round_trip(call, *a, **kw):
+        if args.rtt_ms:
+            time.sleep(args.rtt_ms / 1000)
+        if client_lock is None:
+            return call(*a, **kw)
+        with client_lock:
+            return call(*a, **kw)
+
+    class RoundTripClient:
+        """Adds the simulated round trip (and the local lock) to every request."""
+
+        def query_points(self, **kw):
+            return round_trip(client.query_points, **kw)
+
+        def query_batch_points(self, **kw):
+            return round_trip(client.query_batch_points, **kw)
+
+    rt_client = RoundTripClient()
+
+    def run(label: str, flt: FilterLike, one_query) -> None:
+        latencies = [0.0] * args.queries
+
+        def call(i: int) -> None:
+            t0 = time.perf_counter()
+            one_query(queries[i], flt)
+            latencies[i] = (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.callers) as callers:
+            list(callers.map(call, range(args.queries)))
+        seconds = time.perf_counter() - t0
+        print(f"  {label:<22} {args.queries / seconds:8.0f} queries/s   "
+              f"p50 {np.percentile(latencies, 50):7.2f} ms   p99 {np.percentile(latencies, 99):7.2f} ms")
+
+    print(f"{args.n} x {args.dim}, {args.queries} queries from {args.callers} callers, rtt {args.rtt_ms} ms")
+    for flt_label, flt in (("", None), ("+filter", {"city": "London", "year": {"$gte": 2000}})):
+        run(f"single{flt_label}", flt, lambda v, f: rt_client.query_points(
+            collection_name=collection, query=v.tolist(), limit=10, query_filter=as_filter(f), with_payload=False))
+        with QueryBatcher(rt_client, collection, args.max_batch_size, args.max_wait_ms) as batcher:
+            run(f"batched{flt_label}", flt, lambda v, f: batcher.query(v, 10, f))
+        print(f"  {'':<22} {batcher.queries / max(batcher.batches, 1):.1f} queries per batch")
+    client.delete_collection(collection)
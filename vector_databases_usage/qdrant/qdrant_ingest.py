@@ -0,0 +1,164 @@
+"""
+Streaming, batched point ingestion for Qdrant.
+
+`ingest()` takes the vectors as a NumPy array (batches are slices, never copied as a whole)
+or as any iterable/generator of vectors. Optional payloads and ids are iterables too.
+- Points go in columnar `models.Batch` requests (ids, vectors and payloads lists), not
+  PointStruct objects.
+- Batches are sent with `wait=False` from `parallel` threads, with at most 2 * parallel
+  batches in flight, so peak memory depends on the batch size and not on the input size.
+- After the last batch, one `wait=True` request and an exact `count` confirm that everything
+  is applied.
+Use `QdrantClient(..., prefer_grpc=True)` for gRPC. The in-memory client (":memory:") is not
+thread-safe, so use parallel=1 with it.
+
+Run (throughput and peak RSS)
+  python qdrant_ingest.py --n 20000                       # in-memory local client
+  QDRANT_HOST_ADDRESS=... QDRANT_API_KEY=... python qdrant_ingest.py --server --n 1000000 --dim 768
+"""
+
+import itertools
+import math
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+from qdrant_client import QdrantClient, models
+
+# The shared logger lives in ../common
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from logging_config import logger
+
+Vectors = Union[np.ndarray, Iterable[Sequence[float]]]
+
+
+def iter_batches(vectors: Vectors, payloads: Optional[Iterable[Dict[str, Any]]] = None,
+                 ids: Optional[Iterable[Union[int, str]]] = None,
+                 batch_size: int = 256) -> Iterator[Tuple[List[Any], List[List[float]], Optional[List[Dict[str, Any]]]]]:
+    """(ids, vectors, payloads) lists of at most `batch_size` points; ids default to 0, 1, 2, ..."""
+    ids = iter(ids) if ids is not None else itertools.count()
+    payloads = iter(payloads) if payloads is not None else None
+    if isinstance(vectors, np.ndarray):
+        chunks = (vectors[i:i + batch_size] for i in range(0, len(vectors), batch_size))
+    else:
+        it = iter(vectors)
+        chunks = iter(lambda: list(itertools.islice(it, batch_size)), [])
+    for chunk in chunks:
+        vector_lists = chunk.tolist() if isinstance(chunk, np.ndarray) else [list(map(float, v)) for v in chunk]
+        batch_ids = list(itertools.islice(ids, len(vector_lists)))
+        batch_payloads = list(itertools.islice(payloads, len(vector_lists))) if payloads is not None else None
+        if len(batch_ids) != len(vector_lists) or (batch_payloads is not None and len(batch_payloads) != len(vector_lists)):
+            raise ValueError("ids and payloads must have one entry per vector")
+        yield batch_ids, vector_lists, batch_payloads
+
+
+class IngestStats:
+    def __init__(self):
+        self.points = 0
+        self.batches = 0
+        self.started = time.perf_counter()
+        self.seconds = 0.0
+
+    def __str__(self) -> str:
+        s = max(self.seconds, 1e-9)
+        return f"{self.points} points in {self.batches} batches, {s:.1f}s ({self.points / s:.0f} points/s)"
+
+
+def ingest(client: QdrantClient, collection: str, vectors: Vectors,
+           payloads: Optional[Iterable[Dict[str, Any]]] = None, ids: Optional[Iterable[Union[int, str]]] = None,
+           batch_size: int = 256, parallel: int = 4, expected: Optional[int] = None) -> IngestStats:
+    """Upload points in parallel batches without waiting on each, then confirm they are all applied.
+
+    `expected` is the number of points the collection should hold at the end (default: the
+    number uploaded, i.e. an empty collection beforehand).
+    """
+    stats = IngestStats()
+    pending: Set[Future] = set()
+
+    def send(batch, wait_for_apply: bool) -> None:
+        batch_ids, batch_vectors, batch_payloads = batch
+        client.upsert(collection_name=collection, wait=wait_for_apply,
+                      points=models.Batch(ids=batch_ids, vectors=batch_vectors, payloads=batch_payloads))
+
+    def drain(block_until: int) -> None:
+        nonlocal pending
+        while len(pending) > block_until:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()
+
+    batches = iter_batches(vectors, payloads, ids, batch_size)
+    last = next(batches, None)
+    with ThreadPoolExecutor(max_workers=parallel) as pool:
+        for batch in batches:
+            # Send the batch before `batch`; the final one is held back and sent with wait=True
+            drain(2 * parallel - 1)
+            pending.add(pool.submit(send, last, False))
+            stats.points += len(last[0])
+            stats.batches += 1
+            last = batch
+        drain(0)
+    if last is not None:
+        send(last, True)
+        stats.points += len(last[0])
+        stats.batches += 1
+
+    expected = stats.points if expected is None else expected
+    count = client.count(collection_name=collection, exact=True).count
+    if count < expected:
+        raise RuntimeError(f"{collection}: {count} points after ingest, expected {expected}")
+    stats.seconds = time.perf_counter() - stats.started
+    logger.info("Ingested into %s: %s", collection, stats)
+    return stats
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB; NaN where `resource` is missing (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return math.nan
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=20_000)
+    ap.add_argument("--dim", type=int, default=128)
+    ap.add_argument("--batch-size", type=int, default=256)
+    ap.add_argument("--parallel", type=int, default=4)
+    ap.add_argument("--server", action="store_true", help="Use QDRANT_HOST_ADDRESS instead of an in-memory client")
+    ap.add_argument("--grpc", action="store_true")
+    args = ap.parse_args()
+
+    if args.server:
+        client = QdrantClient(host=os.environ["QDRANT_HOST_ADDRESS"], api_key=os.environ["QDRANT_API_KEY"],
+                              prefer_grpc=args.grpc)
+    else:
+        client = QdrantClient(":memory:")
+        args.parallel = 1
+    collection = "ingest_bench"
+    if client.collection_exists(collection):
+        client.delete_collection(collection)
+    client.create_collection(collection, vectors_config=models.VectorParams(size=args.dim, distance=models.Distance.DOT))
+
+    def generate(n: int, dim: int) -> Iterator[np.ndarray]:
+        # Vectors are produced lazily, as they would be read from disk or an embedding model
+        rng = np.random.default_rng(0)
+        for _ in range(n):
+            yield rng.standard_normal(dim, dtype=np.float32)
+
+    payloads = ({"city": ("Berlin", "London", "Moscow", "New York")[i % 4]} for i in range(args.n))
+    rss_before = peak_rss_mb()
+    stats = ingest(client, collection, generate(args.n, args.dim), payloads, batch_size=args.batch_size,
+                   parallel=args.parallel)
+    print(f"{stats}; peak RSS {peak_rss_mb():.0f} MB (was {rss_before:.0f} MB before ingest)")
+    client.delete_collection(collection)
@@ -1,34 +1,56 @@
 import os
+import sys
 
+import numpy as np
 from qdrant_client import QdrantClient
-from qdrant_client.models import PointStruct
+from qdrant_client import models
 from qdrant_client.models import Distance, VectorParams
-from log_config.logging_config import logger
+# The shared logger lives in ../common
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from logging_config import logger
+from qdrant_batcher import QueryBatcher, create_payload_indexes
+from qdrant_ingest import ingest
 
 #client = QdrantClient(url="http://localhost:6333")
-client = QdrantClient(
-    # do not mention the http protocol
-    host=os.environ["QDRANT_HOST_ADDRESS"],
-    api_key=os.environ["QDRANT_API_KEY"],
-)
+if os.environ.get("QDRANT_LOCAL"):
+    # In-process client, no server needed
+    client = QdrantClient(":memory:")
+else:
+    client = QdrantClient(
+        # do not mention the http protocol
+        host=os.environ["QDRANT_HOST_ADDRESS"],
+        api_key=os.environ["QDRANT_API_KEY"],
+    )
 client.create_collection(
     collection_name="test_collection",
     vectors_config=VectorParams(size=4, distance=Distance.DOT),
 )
-operation_info = client.upsert(
-    collection_name="test_collection",
-    wait=True,
-    points=[
-        PointStruct(id=1, vector=[0.05, 0.61, 0.76, 0.74], payload={"city": "Berlin"}),
-        PointStruct(id=2, vector=[0.19, 0.81, 0.75, 0.11], payload={"city": "London"}),
-        PointStruct(id=3, vector=[0.36, 0.55, 0.47, 0.94], payload={"city": "Moscow"}),
-        PointStruct(id=4, vector=[0.18, 0.01, 0.85, 0.80], payload={"city": "New York"}),
-        PointStruct(id=5, vector=[0.24, 0.18, 0.22, 0.44], payload={"city": "Beijing"}),
-        PointStruct(id=6, vector=[0.35, 0.08, 0.11, 0.44], payload={"city": "Mumbai"}),
+
+# Vectors as one float32 array and payloads as a generator; for real loads these can be
+# memory-mapped arrays or generators, uploaded in parallel batches of `batch_size`
+vectors = np.array(
+    [
+        [0.05, 0.61, 0.76, 0.74],
+        [0.19, 0.81, 0.75, 0.11],
+        [0.36, 0.55, 0.47, 0.94],
+        [0.18, 0.01, 0.85, 0.80],
+        [0.24, 0.18, 0.22, 0.44],
+        [0.35, 0.08, 0.11, 0.44],
     ],
+    dtype=np.float32,
+)
+cities = ["Berlin", "London", "Moscow", "New York", "Beijing", "Mumbai"]
+stats = ingest(
+    client,
+    "test_collection",
+    vectors,
+    payloads=({"city": city} for city in cities),
+    ids=range(1, len(cities) + 1),
+    batch_size=256,
+    parallel=1 if os.environ.get("QDRANT_LOCAL") else 4,
 )
 
-logger.debug(operation_info)
+logger.debug(stats)
 search_result = client.query_points(
     collection_name="test_collection",
     query=[0.2, 0.1, 0.9, 0.7],
@@ -38,4 +60,12 @@ search_result = client.query_points(
 
 logger.debug(search_result)
 
-
+# Filtered queries: index the payload field, then let concurrent callers share batched requests
+create_payload_indexes(client, "test_collection", {"city": models.PayloadSchemaType.KEYWORD})
+with QueryBatcher(client, "test_collection", max_batch_size=64, max_wait_ms=2) as batcher:
+    futures = [
+        batcher.submit([0.2, 0.1, 0.9, 0.7], limit=3, flt={"city": {"$in": ["London", "Moscow"]}}, with_payload=True),
+        batcher.submit([0.5, 0.5, 0.1, 0.1], limit=3, flt={"city": "Berlin"}, with_payload=True),
+    ]
+    for future in futures:
+        logger.debug(future.result())